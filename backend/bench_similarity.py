@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark semantic top-k search engines against the exact path.
+
+Reports build/search time and recall@k of the IVF index for several
+nprobe values, using exact blocked search as ground truth.
+
+Usage:
+    python backend/bench_similarity.py --n 100000 --dim 300 --k 5
+    python backend/bench_similarity.py --vectors vectors.npy --nprobe 4 8 16 32
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.similarity import normalize_rows, blocked_topk, IVFIndex
+
+
+def synthetic_vectors(n: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """Clustered random vectors (closer to real embeddings than pure noise)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=n)
+    return centers[labels] + 0.6 * rng.normal(size=(n, dim)).astype(np.float32)
+
+
+def recall_at_k(approx: np.ndarray, exact: np.ndarray) -> float:
+    """Fraction of exact neighbors found by the approximate search."""
+    hits = 0
+    total = 0
+    for a, e in zip(approx, exact):
+        e = e[e >= 0]
+        hits += np.isin(e, a).sum()
+        total += len(e)
+    return hits / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark semantic similarity engines")
+    parser.add_argument('--vectors', help='Path to an (N, dim) .npy matrix (default: synthetic)')
+    parser.add_argument('--n', type=int, default=50000, help='Synthetic vector count (default: 50000)')
+    parser.add_argument('--dim', type=int, default=300, help='Synthetic dimension (default: 300)')
+    parser.add_argument('--clusters', type=int, default=200, help='Synthetic cluster count (default: 200)')
+    parser.add_argument('--k', type=int, default=5, help='Neighbors per word (default: 5)')
+    parser.add_argument('--nlist', type=int, help='IVF list count (default: 4 * sqrt(N))')
+    parser.add_argument('--nprobe', type=int, nargs='+', default=[1, 4, 8, 16, 32],
+                        help='nprobe values to sweep (default: 1 4 8 16 32)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.vectors:
+        vectors = np.load(args.vectors, mmap_mode='r')
+    else:
+        vectors = synthetic_vectors(args.n, args.dim, args.clusters, args.seed)
+    vectors = normalize_rows(vectors)
+    print(f"\nVectors: {vectors.shape[0]} x {vectors.shape[1]}, k={args.k}\n")
+
+    start = time.perf_counter()
+    exact, _ = blocked_topk(vectors, vectors, args.k, self_offset=0)
+    exact_time = time.perf_counter() - start
+    print(f"{'engine':<16}{'build (s)':>12}{'search (s)':>12}{'recall@k':>12}")
+    print(f"{'exact':<16}{0.0:>12.2f}{exact_time:>12.2f}{1.0:>12.4f}")
+
+    start = time.perf_counter()
+    index = IVFIndex(nlist=args.nlist, random_seed=args.seed).fit(vectors)
+    build_time = time.perf_counter() - start
+
+    for nprobe in args.nprobe:
+        index.nprobe = nprobe
+        start = time.perf_counter()
+        approx, _ = index.search(vectors, args.k, self_offset=0)
+        search_time = time.perf_counter() - start
+        recall = recall_at_k(approx, exact)
+        print(f"{'ivf/' + str(nprobe):<16}{build_time:>12.2f}{search_time:>12.2f}{recall:>12.4f}")
+
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
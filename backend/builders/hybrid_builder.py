@@ -14,7 +14,10 @@ from core.processors import (
     HierarchyProcessor,
     SemanticProcessor,
     ThematicClusteringProcessor,
-    FrequencyRankingProcessor
+    FrequencyRankingProcessor,
+    GraphPruningProcessor,
+    GalaxySummaryProcessor,
+    CelestialAttributesProcessor
 )
 from core.exporter import V4Exporter
 from core.models import UniverseData
@@ -56,7 +59,9 @@ def build_hybrid_universe(
     # Add data sources (order matters - first source provides base info)
     builder.add_source(WordNetSource())      # Base: definitions, POS
     builder.add_source(LLMSource(llm_graph_path))  # Enrich: semantic relations
-    builder.add_source(SpacySource(spacy_model))   # Enrich: vectors, POS
+    builder.add_source(SpacySource(spacy_model, {  # Enrich: vectors
+        'vectors_only': True  # POS comes from WordNet
+    }))
 
     # Add processors
     builder.add_processor(HierarchyProcessor())  # Must run before clustering
@@ -68,6 +73,9 @@ def build_hybrid_universe(
         'min_similarity': 0.6
     }))
     builder.add_processor(FrequencyRankingProcessor())
+    builder.add_processor(GraphPruningProcessor())  # Drop targets outside the universe
+    builder.add_processor(GalaxySummaryProcessor())  # Overview graph for the zoomed-out view
+    builder.add_processor(CelestialAttributesProcessor())  # Precomputed star/planet visuals
 
     # Build
     universe = builder.build(wordlist)
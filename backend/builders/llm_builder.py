@@ -14,7 +14,10 @@ from core.processors import (
     HierarchyProcessor,
     SemanticProcessor,
     ThematicClusteringProcessor,
-    FrequencyRankingProcessor
+    FrequencyRankingProcessor,
+    GraphPruningProcessor,
+    GalaxySummaryProcessor,
+    CelestialAttributesProcessor
 )
 from core.exporter import V4Exporter
 from core.models import UniverseData
@@ -62,6 +65,9 @@ def build_llm_universe(
         'num_galaxies': num_galaxies
     }))
     builder.add_processor(FrequencyRankingProcessor())
+    builder.add_processor(GraphPruningProcessor())  # Drop targets outside the universe
+    builder.add_processor(GalaxySummaryProcessor())  # Overview graph for the zoomed-out view
+    builder.add_processor(CelestialAttributesProcessor())  # Precomputed star/planet visuals
 
     # Build universe
     universe = builder.build(wordlist)
@@ -12,7 +12,10 @@ from core.data_sources import WordNetSource, SpacySource
 from core.processors import (
     HierarchyProcessor,
     VectorClusteringProcessor,
-    FrequencyRankingProcessor
+    FrequencyRankingProcessor,
+    GraphPruningProcessor,
+    GalaxySummaryProcessor,
+    CelestialAttributesProcessor
 )
 from core.exporter import V4Exporter
 from core.models import UniverseData
@@ -51,7 +54,9 @@ def build_simple_universe(
 
     # Add sources
     builder.add_source(WordNetSource())
-    builder.add_source(SpacySource(spacy_model))
+    builder.add_source(SpacySource(spacy_model, {
+        'vectors_only': True  # POS comes from WordNet
+    }))
 
     # Add processors
     builder.add_processor(HierarchyProcessor())
@@ -60,6 +65,9 @@ def build_simple_universe(
         'random_seed': 42
     }))
     builder.add_processor(FrequencyRankingProcessor())
+    builder.add_processor(GraphPruningProcessor())  # Drop targets outside the universe
+    builder.add_processor(GalaxySummaryProcessor())  # Overview graph for the zoomed-out view
+    builder.add_processor(CelestialAttributesProcessor())  # Precomputed star/planet visuals
 
     # Build
     universe = builder.build(wordlist)
@@ -109,13 +109,16 @@ def list_command(args):
     print("  - WordNet:    Hierarchy, definitions, POS")
     print("  - LLM:        Semantic associations (needs llm_semantic_graph.json)")
     print("  - Spacy:      Word vectors, similarity")
+    print("  - Embedding:  Memory-mapped GloVe/word2vec/fastText vectors")
+    print("  - Frequency:  Corpus word counts (COCA/BNC-style tables)")
     print("  - ConceptNet: Common-sense relations (optional)")
 
     print("\nProcessors:")
     print("  - HierarchyProcessor:  Assign hierarchy levels")
     print("  - SemanticProcessor:   Add similarity-based relations")
+    print("  - ReductionProcessor:  PCA-project vectors before similarity/clustering")
     print("  - ClusteringProcessor: Assign galaxy groupings")
-    print("  - RankingProcessor:    Compute frequency scores")
+    print("  - RankingProcessor:    Compute frequency scores (degree or PageRank)")
 
     print()
     return 0
@@ -6,6 +6,9 @@ A modular, composable framework for building vocabulary universes.
 
 from .models import WordInfo, VocabRelation, UniverseData, GalaxyConfig
 from .builder import UniverseBuilder
+from .graph import RelationGraph
+from .ancestry import AncestryIndex
+from .spatial import SpatialIndex
 
 __all__ = [
     "WordInfo",
@@ -13,4 +16,7 @@ __all__ = [
     "UniverseData",
     "GalaxyConfig",
     "UniverseBuilder",
+    "RelationGraph",
+    "AncestryIndex",
+    "SpatialIndex",
 ]
@@ -0,0 +1,210 @@
+"""
+Ancestry index over the hypernym DAG for constant-time is-a queries.
+"""
+from typing import Any, Dict, List, Optional
+import logging
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class AncestryIndex:
+    """
+    Compressed transitive closure of a parent -> child DAG.
+
+    Every node gets a post-order number from a DFS over the DAG. A node's
+    descendants are then described by a short, sorted list of post-order
+    intervals (one interval for a tree; extra ones only where a node
+    inherits children through a second parent). "Is X a kind of Y" is a
+    binary search in Y's intervals - O(1) for tree-shaped hierarchies.
+
+    Usage:
+        index = AncestryIndex.build(ids, parent_ids, child_ids)
+        index.is_a('word_puppy', 'word_animal')
+        index.descendants('word_animal')
+    """
+
+    def __init__(self, ids: List[str], post: np.ndarray, offsets: np.ndarray,
+                 starts: np.ndarray, ends: np.ndarray):
+        """
+        Args:
+            ids: Node ids (word ids, in universe order)
+            post: (N,) post-order number per node
+            offsets: (N + 1,) interval list bounds per node
+            starts: Interval starts (inclusive)
+            ends: Interval ends (inclusive)
+        """
+        self.ids = list(ids)
+        self.index = {id_: i for i, id_ in enumerate(self.ids)}
+        self.post = post
+        self.offsets = offsets
+        self.starts = starts
+        self.ends = ends
+
+        # Node with each post-order number
+        self.by_post = np.empty(len(post), dtype=np.int64)
+        self.by_post[post] = np.arange(len(post))
+
+    @classmethod
+    def build(cls, ids: List[str], parent_ids: np.ndarray, child_ids: np.ndarray) -> 'AncestryIndex':
+        """
+        Build the index from parent -> child edges.
+
+        Args:
+            ids: Node ids
+            parent_ids: (E,) parent node per edge
+            child_ids: (E,) child node per edge; edges that close a cycle
+                are dropped (which ones depends on the DFS order)
+
+        Returns:
+            AncestryIndex
+        """
+        num_nodes = len(ids)
+        order = np.argsort(parent_ids, kind='stable')
+        children = child_ids[order].tolist()
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(parent_ids, minlength=num_nodes), out=indptr[1:])
+        indptr = indptr.tolist()
+
+        has_parent = np.bincount(child_ids, minlength=num_nodes) > 0
+        roots = np.flatnonzero(~has_parent).tolist()
+
+        # Iterative DFS; post-order lists every node after all its descendants.
+        # Nodes in cycles that no root reaches start their own DFS afterwards.
+        # An edge to a node still on the stack closes a cycle and is dropped;
+        # every other edge (including extra parents) is kept.
+        post = [-1] * num_nodes
+        visited = [False] * num_nodes
+        on_stack = [False] * num_nodes
+        kept: List[List[int]] = [[] for _ in range(num_nodes)]
+        finish_order = []
+        num_back_edges = 0
+        for root in roots + list(range(num_nodes)):
+            if visited[root]:
+                continue
+            visited[root] = on_stack[root] = True
+            stack = [(root, indptr[root])]
+            while stack:
+                node, next_edge = stack[-1]
+                if next_edge < indptr[node + 1]:
+                    stack[-1] = (node, next_edge + 1)
+                    child = children[next_edge]
+                    if on_stack[child]:
+                        num_back_edges += 1
+                        continue
+                    kept[node].append(child)
+                    if not visited[child]:
+                        visited[child] = on_stack[child] = True
+                        stack.append((child, indptr[child]))
+                else:
+                    stack.pop()
+                    on_stack[node] = False
+                    post[node] = len(finish_order)
+                    finish_order.append(node)
+
+        if num_back_edges:
+            logger.warning(f"Dropped {num_back_edges} cycle-closing edges from the ancestry index")
+
+        # Intervals: own post number plus every kept child's intervals, merged.
+        # Children finish first, so their lists are ready.
+        intervals: List[List[List[int]]] = [None] * num_nodes
+        for node in finish_order:
+            spans = [[post[node], post[node]]]
+            for child in kept[node]:
+                spans.extend(intervals[child])
+            spans.sort()
+            merged = [spans[0]]
+            for start, end in spans[1:]:
+                last = merged[-1]
+                if start <= last[1] + 1:
+                    if end > last[1]:
+                        merged[-1] = [last[0], end]
+                else:
+                    merged.append([start, end])
+            intervals[node] = merged
+
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum([len(spans) for spans in intervals], out=offsets[1:])
+        flat = np.array([span for spans in intervals for span in spans], dtype=np.int64).reshape(-1, 2)
+
+        index = cls(ids, np.array(post, dtype=np.int64), offsets, flat[:, 0].copy(), flat[:, 1].copy())
+        logger.info(f"Built ancestry index: {num_nodes} nodes, {len(flat)} intervals")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _node(self, id_: str) -> Optional[int]:
+        return self.index.get(id_)
+
+    def is_a(self, word_id: str, ancestor_id: str) -> bool:
+        """
+        True if ancestor_id is a (transitive) hypernym of word_id.
+
+        Args:
+            word_id: Word id, e.g. 'word_puppy'
+            ancestor_id: Candidate ancestor id, e.g. 'word_animal'
+
+        Returns:
+            False for unknown ids and for word_id == ancestor_id
+        """
+        node, ancestor = self._node(word_id), self._node(ancestor_id)
+        if node is None or ancestor is None or node == ancestor:
+            return False
+
+        p = self.post[node]
+        lo, hi = self.offsets[ancestor], self.offsets[ancestor + 1]
+        i = lo + np.searchsorted(self.starts[lo:hi], p, side='right') - 1
+        return bool(i >= lo and self.ends[i] >= p)
+
+    def descendants(self, word_id: str) -> List[str]:
+        """All (transitive) hyponyms of a word, in post order."""
+        node = self._node(word_id)
+        if node is None:
+            return []
+        lo, hi = self.offsets[node], self.offsets[node + 1]
+        ranges = [self.by_post[s:e + 1] for s, e in zip(self.starts[lo:hi], self.ends[lo:hi])]
+        nodes = np.concatenate(ranges)
+        return [self.ids[n] for n in nodes.tolist() if n != node]
+
+    def ancestors(self, word_id: str) -> List[str]:
+        """All (transitive) hypernyms of a word."""
+        node = self._node(word_id)
+        if node is None:
+            return []
+        p = self.post[node]
+        hit = (self.starts <= p) & (self.ends >= p)
+        owners = np.repeat(np.arange(len(self.ids)), np.diff(self.offsets))[hit]
+        return [self.ids[n] for n in np.unique(owners).tolist() if n != node]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Compact JSON form; arrays follow the universe's word order.
+
+        Word i descends from word j iff post[i] lies in one of j's intervals
+        starts[offsets[j]:offsets[j + 1]] / ends[...].
+        """
+        return {
+            "post": self.post.tolist(),
+            "offsets": self.offsets.tolist(),
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], ids: List[str]) -> 'AncestryIndex':
+        """
+        Load an exported index.
+
+        Args:
+            data: Output of to_dict (e.g. universe JSON "ancestry")
+            ids: Word ids in the universe's word order
+        """
+        return cls(
+            ids,
+            np.asarray(data["post"], dtype=np.int64),
+            np.asarray(data["offsets"], dtype=np.int64),
+            np.asarray(data["starts"], dtype=np.int64),
+            np.asarray(data["ends"], dtype=np.int64)
+        )
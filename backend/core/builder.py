@@ -1,8 +1,9 @@
 """
 Main UniverseBuilder class - orchestrates data sources and processors.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
+import asyncio
 import logging
 
 from .models import WordInfo, UniverseData
@@ -24,6 +25,9 @@ class UniverseBuilder:
         builder.add_processor(HierarchyProcessor())
         builder.add_processor(ClusteringProcessor())
         universe = builder.build(wordlist)
+
+        # Or, to overlap latency of I/O-bound sources:
+        universe = asyncio.run(builder.build_async(wordlist))
     """
 
     def __init__(self, name: str = "universe"):
@@ -86,21 +90,63 @@ class UniverseBuilder:
         words = self._gather_words(wordlist)
         logger.info(f"Collected {len(words)} valid words")
 
+        return self._finish(words)
+
+    async def build_async(self, wordlist: List[str]) -> UniverseData:
+        """
+        Build the universe, gathering word info with asyncio.
+
+        Sources are still consulted in order, but within a source up to
+        `source.max_concurrency` lookups run at once, so sources backed by
+        remote services overlap their latency instead of being called
+        serially. Processors run as in build().
+
+        Args:
+            wordlist: List of words to include
+
+        Returns:
+            UniverseData object ready for export
+        """
+        logger.info(f"Building universe '{self.name}' with {len(wordlist)} words (async)...")
+
+        # Initialize all sources concurrently (model/index loading)
+        await asyncio.gather(*(asyncio.to_thread(source.initialize) for source in self.sources))
+
+        # Step 1: Gather word info from all sources
+        logger.info("Step 1: Gathering word information...")
+        words = await self._gather_words_async(wordlist)
+        logger.info(f"Collected {len(words)} valid words")
+
+        return self._finish(words)
+
+    def _finish(self, words: List[WordInfo]) -> UniverseData:
+        """
+        Run processors on gathered words and assemble the UniverseData.
+        """
         # Step 2: Run processors
         logger.info("Step 2: Running processors...")
+        graph = None
         for processor in self.processors:
             logger.info(f"  - Running {processor.get_name()}...")
+            # Share one relation graph until a processor changes relations
+            processor.graph = graph
             words = processor.process(words)
+            graph = None if processor.modifies_relations else processor.graph
+            processor.graph = None
 
-        # Step 3: Extract galaxies from metadata (if any processor created them)
+        # Step 3: Extract galaxies and export blocks from metadata (if any
+        # processor created them)
         galaxies = []
+        extensions = {}
         if words:
             galaxies = words[0].metadata.get('_galaxies', [])
+            extensions = words[0].metadata.get('_extensions', {})
 
         # Step 4: Create UniverseData
         universe = UniverseData(
             words=words,
             galaxies=galaxies,
+            extensions=extensions,
             meta={
                 "id": self.name,
                 "name": self.name.replace("_", " ").title()
@@ -120,25 +166,96 @@ class UniverseBuilder:
         Returns:
             List of WordInfo objects
         """
-        words_dict = {}
+        cleaned = self._clean_wordlist(wordlist)
+        words_dict: Dict[str, WordInfo] = {}
+
+        for source in self.sources:
+            # Words no earlier source knows take their base info from this
+            # one (batch-capable sources answer in one call)
+            pending = [word for word in cleaned if word not in words_dict]
+            if pending:
+                if source.supports_batch():
+                    infos = source.get_batch_info(pending)
+                else:
+                    infos = {word: source.get_word_info(word) for word in pending}
+
+                for word in pending:
+                    info = infos.get(word)
+                    if info:
+                        words_dict[word] = info
+
+            # Then the source adds its relations/vectors to every known word
+            # in one call - including words it just provided, since base
+            # info carries no relations
+            if words_dict:
+                source.enrich_batch(list(words_dict.values()))
+
+        return [words_dict[word] for word in cleaned if word in words_dict]
+
+    async def _gather_words_async(self, wordlist: List[str]) -> List[WordInfo]:
+        """
+        Async version of _gather_words with bounded concurrency per source.
+
+        Args:
+            wordlist: List of words to process
+
+        Returns:
+            List of WordInfo objects
+        """
+        cleaned = self._clean_wordlist(wordlist)
+        words_dict: Dict[str, WordInfo] = {}
+
+        for source in self.sources:
+            limit = asyncio.Semaphore(max(1, source.max_concurrency))
+
+            async def bounded(call):
+                async with limit:
+                    return await call
+
+            pending = [word for word in cleaned if word not in words_dict]
+            if pending:
+                if source.supports_batch():
+                    infos = {}
+                    for chunk_infos in await asyncio.gather(*(
+                        bounded(source.get_batch_info_async(chunk))
+                        for chunk in self._chunks(pending, source.max_concurrency)
+                    )):
+                        infos.update(chunk_infos)
+                else:
+                    results = await asyncio.gather(*(
+                        bounded(source.get_word_info_async(word)) for word in pending
+                    ))
+                    infos = dict(zip(pending, results))
+
+                for word in pending:
+                    info = infos.get(word)
+                    if info:
+                        words_dict[word] = info
+
+            if words_dict:
+                await asyncio.gather(*(
+                    bounded(source.enrich_batch_async(chunk))
+                    for chunk in self._chunks(list(words_dict.values()), source.max_concurrency)
+                ))
+
+        return [words_dict[word] for word in cleaned if word in words_dict]
 
+    @staticmethod
+    def _clean_wordlist(wordlist: List[str]) -> List[str]:
+        """Normalize and de-duplicate a word list (order-preserving)."""
+        cleaned = []
+        seen = set()
         for word in wordlist:
             word = word.strip().lower()
-            if not word or len(word) < 2:
+            if not word or len(word) < 2 or word in seen:
                 continue
+            seen.add(word)
+            cleaned.append(word)
+        return cleaned
 
-            # Try to get info from sources in order
-            word_info = None
-            for source in self.sources:
-                info = source.get_word_info(word)
-                if info:
-                    if word_info is None:
-                        word_info = info
-                    else:
-                        # Merge info from multiple sources
-                        word_info = source.enrich_word(word_info)
-
-            if word_info:
-                words_dict[word] = word_info
-
-        return list(words_dict.values())
+    @staticmethod
+    def _chunks(items: list, parts: int) -> List[list]:
+        """Split items into at most `parts` contiguous chunks."""
+        parts = max(1, min(parts, len(items)))
+        size = -(-len(items) // parts)
+        return [items[i:i + size] for i in range(0, len(items), size)]
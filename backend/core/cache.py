@@ -0,0 +1,144 @@
+"""
+Bounded lookup cache shared by data sources.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Union
+import logging
+import shelve
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+# Returned by LRUCache.get() for keys that are not cached
+# (None is a valid cached value, e.g. "this word has no vector")
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Size-bounded least-recently-used cache with an optional on-disk tier.
+
+    The in-memory tier holds at most `capacity` entries and evicts the least
+    recently used one when full. If `path` is given, every entry is also
+    written through to a shelve database, so a later build (or another
+    process) can reload values instead of recomputing them.
+
+    One instance can be shared by several sources; access is thread-safe.
+
+    Usage:
+        cache = LRUCache(capacity=50000, path="backend/data/.vector_cache")
+        spacy_source = SpacySource("en_core_web_md", {'cache': cache})
+    """
+
+    def __init__(self, capacity: int = 10000, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Max number of in-memory entries (default: 10000)
+            path: Optional shelve file for the persisted tier
+        """
+        if capacity < 1:
+            raise ValueError(f"Cache capacity must be positive, got {capacity}")
+
+        self.capacity = capacity
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk = shelve.open(str(self.path))
+            logger.info(f"Opened on-disk cache at {self.path} ({len(self._disk)} entries)")
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a key.
+
+        Returns:
+            Cached value, or MISSING if the key is in neither tier
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+
+            if self._disk is not None:
+                disk_key = str(key)
+                if disk_key in self._disk:
+                    value = self._disk[disk_key]
+                    self._store(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return MISSING
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value (write-through to the disk tier if enabled).
+        """
+        with self._lock:
+            self._store(key, value)
+            if self._disk is not None:
+                self._disk[str(key)] = value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insert into the memory tier, evicting the LRU entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.capacity:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset counters (disk tier is kept)."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.disk_hits = 0
+
+    def flush(self) -> None:
+        """Sync the disk tier."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.sync()
+
+    def close(self) -> None:
+        """Sync and close the disk tier."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, disk_hits, hit_rate, size and capacity
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "capacity": self.capacity,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
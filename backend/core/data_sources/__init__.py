@@ -6,6 +6,8 @@ from .wordnet import WordNetSource
 from .spacy import SpacySource
 from .llm import LLMSource
 from .conceptnet import ConceptNetSource
+from .embedding import EmbeddingSource
+from .frequency import FrequencySource
 
 __all__ = [
     "DataSource",
@@ -13,4 +15,6 @@ __all__ = [
     "SpacySource",
     "LLMSource",
     "ConceptNetSource",
+    "EmbeddingSource",
+    "FrequencySource",
 ]
@@ -3,7 +3,8 @@ Abstract base class for data sources.
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from ..models import WordInfo, VocabRelation
+import asyncio
+from ..models import WordInfo, VocabRelation, RELATION_MERGE_RULES
 
 
 class DataSource(ABC):
@@ -15,6 +16,18 @@ class DataSource(ABC):
     - ConceptNet: common-sense relations
     - LLM: semantic associations
     - Spacy: word vectors, POS tagging
+
+    Every source also has an async counterpart of its lookups, used by
+    UniverseBuilder.build_async(). The defaults run the sync methods in a
+    worker thread; I/O-bound sources (HTTP services, remote stores) can
+    override them natively. `max_concurrency` bounds how many calls the
+    builder keeps in flight per source (default: 1, i.e. sync sources are
+    never called from two threads at once).
+
+    Relations are merged into a word with WordInfo.add_relations, so a
+    (target, type) pair reported by several sources stays a single edge.
+    `merge_rule` picks how its strength is resolved ('max' or 'weighted',
+    default: 'max'); `merge_weight` is this source's weight for 'weighted'.
     """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -25,6 +38,11 @@ class DataSource(ABC):
             config: Source-specific configuration dict
         """
         self.config = config or {}
+        self.max_concurrency = self.config.get('max_concurrency', 1)
+        self.merge_rule = self.config.get('merge_rule', 'max')
+        self.merge_weight = self.config.get('merge_weight', 1.0)
+        if self.merge_rule not in RELATION_MERGE_RULES:
+            raise ValueError(f"Unknown relation merge rule: {self.merge_rule}")
         self._initialized = False
 
     def initialize(self):
@@ -82,9 +100,27 @@ class DataSource(ABC):
         # Default implementation: add relations
         self.initialize()
         relations = self.get_relations(word_info.word)
-        word_info.relations.extend(relations)
+        word_info.add_relations(relations, self.merge_rule, self.merge_weight)
         return word_info
 
+    def enrich_batch(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Enrich many WordInfo objects with data from this source in one call.
+
+        Sources override this to do their lookups in a single pass; the
+        default falls back to enrich_word for each word.
+
+        Args:
+            words: WordInfo objects to enrich
+
+        Returns:
+            The same list, enriched in-place
+        """
+        self.initialize()
+        for word_info in words:
+            self.enrich_word(word_info)
+        return words
+
     def supports_batch(self) -> bool:
         """
         Returns True if this source supports batch operations.
@@ -108,3 +144,51 @@ class DataSource(ABC):
             if info:
                 result[word] = info
         return result
+
+    async def get_word_info_async(self, word: str) -> Optional[WordInfo]:
+        """
+        Async counterpart of get_word_info.
+
+        Args:
+            word: The word to look up
+
+        Returns:
+            WordInfo object if found, None otherwise
+        """
+        return await asyncio.to_thread(self.get_word_info, word)
+
+    async def get_relations_async(self, word: str) -> List[VocabRelation]:
+        """
+        Async counterpart of get_relations.
+
+        Args:
+            word: The word to find relations for
+
+        Returns:
+            List of VocabRelation objects
+        """
+        return await asyncio.to_thread(self.get_relations, word)
+
+    async def get_batch_info_async(self, words: List[str]) -> Dict[str, WordInfo]:
+        """
+        Async counterpart of get_batch_info.
+
+        Args:
+            words: List of words to look up
+
+        Returns:
+            Dict mapping word -> WordInfo
+        """
+        return await asyncio.to_thread(self.get_batch_info, words)
+
+    async def enrich_batch_async(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Async counterpart of enrich_batch.
+
+        Args:
+            words: WordInfo objects to enrich
+
+        Returns:
+            The same list, enriched in-place
+        """
+        return await asyncio.to_thread(self.enrich_batch, words)
@@ -150,12 +150,15 @@ class ConceptNetSource(DataSource):
         if word not in self.relations_cache:
             return []
 
-        relations = []
-        for rel_data in self.relations_cache[word]:
-            relations.append(VocabRelation(
+        return self._to_relations(self.relations_cache[word])
+
+    def _to_relations(self, rel_list: List[Dict]) -> List[VocabRelation]:
+        """Convert indexed ConceptNet entries to VocabRelation objects."""
+        return [
+            VocabRelation(
                 target_id=f"word_{rel_data['target']}",
                 type=rel_data['type'],
                 strength=min(rel_data['weight'] / 3.0, 1.0)  # Normalize weight
-            ))
-
-        return relations
+            )
+            for rel_data in rel_list
+        ]
@@ -0,0 +1,308 @@
+"""
+Embedding file data source - serves word vectors from GloVe/word2vec/fastText files.
+"""
+from typing import Optional, List, Dict, Tuple
+from pathlib import Path
+import logging
+import numpy as np
+
+from .base import DataSource
+from .vocab_index import make_vocab, lookup, is_converted, write_meta
+from ..models import WordInfo, VocabRelation
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingSource(DataSource):
+    """
+    Memory-mapped word vectors from a plain embedding file.
+
+    Supported inputs:
+    - GloVe text files ("word v1 v2 ...", no header)
+    - word2vec / fastText .vec text files ("count dim" header line)
+    - word2vec binary files (.bin)
+
+    On first use the file is converted into a float32 .npy matrix plus a
+    sorted vocabulary index next to it (or in `cache_dir`). Later runs open
+    those with mmap, so vectors are paged in on demand and the pages are
+    shared by every process reading the same files.
+
+    Provides the same vector contract as SpacySource:
+    - metadata['vector'] / metadata['has_vector'] on WordInfo
+    - get_vector, get_batch_vectors, get_vector_matrix
+
+    Config:
+        cache_dir: Directory for converted files (default: next to the source file)
+        lowercase: Lowercase the vocabulary, keeping the first (most frequent)
+            casing of each word (default: True)
+        max_words: Only convert the first N vectors of the file
+        max_word_bytes: Skip tokens longer than this many UTF-8 bytes (default: 64)
+        binary: Force word2vec binary parsing (default: inferred from .bin suffix)
+    """
+
+    def __init__(self, path: str, config: Dict = None):
+        """
+        Initialize with path to an embedding file.
+
+        Args:
+            path: Path to the GloVe/word2vec/fastText file
+            config: Additional configuration
+        """
+        super().__init__(config)
+        self.path = Path(path)
+        self.cache_dir = Path(self.config.get('cache_dir', self.path.parent))
+        self.lowercase = self.config.get('lowercase', True)
+        self.max_words = self.config.get('max_words')
+        self.max_word_bytes = self.config.get('max_word_bytes', 64)
+        self.binary = self.config.get('binary', self.path.suffix == '.bin')
+
+        self.vectors: Optional[np.ndarray] = None  # (n, dim) float32 memmap, file order
+        self.vocab: Optional[np.ndarray] = None    # sorted fixed-width UTF-8 words
+        self.rows: Optional[np.ndarray] = None     # vocab position -> vector row
+
+    @property
+    def dim(self) -> int:
+        self.initialize()
+        return self.vectors.shape[1]
+
+    def _do_initialize(self):
+        """Convert the embedding file on first use, then memory-map it."""
+        stem = self.cache_dir / self.path.name
+        matrix_path = stem.with_name(stem.name + '.vectors.npy')
+        vocab_path = stem.with_name(stem.name + '.vocab.npy')
+        rows_path = stem.with_name(stem.name + '.rows.npy')
+        meta_path = stem.with_name(stem.name + '.meta.json')
+
+        if not is_converted(meta_path, self.path, self._settings()):
+            if not self.path.exists():
+                raise FileNotFoundError(f"Embedding file not found: {self.path}")
+            self._convert(matrix_path, vocab_path, rows_path, meta_path)
+
+        self.vectors = np.load(matrix_path, mmap_mode='r')
+        self.vocab = np.load(vocab_path, mmap_mode='r')
+        self.rows = np.load(rows_path, mmap_mode='r')
+        logger.info(f"Mapped {len(self.vocab)} vectors ({self.vectors.shape[1]}d) from {matrix_path}")
+
+    def _settings(self) -> Dict:
+        """Conversion settings a converted copy must match."""
+        return {
+            'lowercase': self.lowercase,
+            'max_words': self.max_words,
+            'max_word_bytes': self.max_word_bytes,
+            'binary': self.binary,
+        }
+
+    def _convert(self, matrix_path: Path, vocab_path: Path, rows_path: Path, meta_path: Path):
+        """Parse the embedding file into a float32 matrix and sorted vocab."""
+        logger.info(f"Converting {self.path} to memory-mapped vectors (one-time)...")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        count, dim = self._scan_shape()
+        if self.max_words:
+            count = min(count, self.max_words)
+
+        matrix = np.lib.format.open_memmap(matrix_path, mode='w+', dtype=np.float32, shape=(count, dim))
+        words = []
+        seen = set()
+
+        for word, vector in self._iter_vectors(dim):
+            if len(words) >= count:
+                break
+            if self.lowercase:
+                word = word.lower()
+            encoded = word.encode('utf-8')
+            if not encoded or len(encoded) > self.max_word_bytes or encoded in seen:
+                continue
+            seen.add(encoded)
+            matrix[len(words)] = vector
+            words.append(encoded)
+
+            if len(words) % 200000 == 0:
+                logger.info(f"  Converted {len(words)} vectors...")
+
+        matrix.flush()
+        del matrix
+
+        # Rows reserved for skipped/duplicate tokens stay zero and are never indexed
+        vocab, rows = make_vocab(words)
+        np.save(vocab_path, vocab)
+        np.save(rows_path, rows)
+        write_meta(meta_path, self.path, self._settings(), count=len(words), dim=dim)
+
+        logger.info(f"Converted {len(words)} vectors ({dim}d)")
+
+    def _scan_shape(self) -> Tuple[int, int]:
+        """Determine (row count, dimension) of the embedding file."""
+        with self.path.open('rb') as f:
+            first = f.readline().decode('utf-8', errors='replace').rstrip().split(' ')
+
+            # word2vec/fastText header: "count dim"
+            if len(first) == 2 and first[0].isdigit() and first[1].isdigit():
+                return int(first[0]), int(first[1])
+
+            if self.binary:
+                raise ValueError(f"Binary embedding file without header: {self.path}")
+
+            # GloVe: no header, count lines
+            dim = len(first) - 1
+            count = 1 + sum(1 for _ in f)
+            return count, dim
+
+    def _iter_vectors(self, dim: int):
+        """Yield (word, vector) pairs in file order."""
+        with self.path.open('rb') as f:
+            first = f.readline()
+            header = first.decode('utf-8', errors='replace').rstrip().split(' ')
+            has_header = len(header) == 2 and header[0].isdigit() and header[1].isdigit()
+
+            if self.binary:
+                row_bytes = dim * 4
+                while True:
+                    word = bytearray()
+                    char = f.read(1)
+                    while char and char != b' ':
+                        if char != b'\n':
+                            word.extend(char)
+                        char = f.read(1)
+                    if not char:
+                        return
+                    data = f.read(row_bytes)
+                    if len(data) < row_bytes:
+                        return
+                    yield word.decode('utf-8', errors='replace'), np.frombuffer(data, dtype='<f4')
+                return
+
+            lines = f if has_header else _chain_line(first, f)
+            for line in lines:
+                parts = line.decode('utf-8', errors='replace').rstrip().split(' ')
+                if len(parts) <= dim:
+                    continue
+                # Some GloVe tokens contain spaces - the last `dim` fields are the vector
+                word = ' '.join(parts[:-dim])
+                try:
+                    vector = np.asarray(parts[-dim:], dtype=np.float32)
+                except ValueError:
+                    continue
+                yield word, vector
+
+    def get_vector_matrix(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch vectors for a word list with one sorted-index lookup and row gather.
+
+        Args:
+            words: List of words
+
+        Returns:
+            (matrix, found) - float32 array of shape (len(words), dim) with zero
+            rows for unknown words, and a boolean mask of words that have a vector
+        """
+        self.initialize()
+        matrix = np.zeros((len(words), self.vectors.shape[1]), dtype=np.float32)
+        pos, found = lookup(self.vocab, words, self.lowercase)
+
+        if found.any():
+            rows = self.rows[pos[found]]
+            # Sorted gather keeps the memmap reads sequential
+            order = np.argsort(rows)
+            gathered = np.empty((len(rows), matrix.shape[1]), dtype=np.float32)
+            gathered[order] = self.vectors[rows[order]]
+            matrix[found] = gathered
+
+        return matrix, found
+
+    def get_word_info(self, word: str) -> Optional[WordInfo]:
+        """
+        Get word info from the embedding table.
+
+        Returns:
+            WordInfo with vector metadata if the word has a vector, None otherwise
+        """
+        matrix, found = self.get_vector_matrix([word])
+        if not found[0]:
+            return None
+        return self._make_word_info(word, matrix[0])
+
+    def get_relations(self, word: str) -> List[VocabRelation]:
+        """
+        Embedding files don't provide explicit relations.
+        Use processors for similarity-based relations.
+        """
+        return []
+
+    def get_vector(self, word: str) -> Optional[np.ndarray]:
+        """
+        Get word vector.
+
+        Args:
+            word: Word to vectorize
+
+        Returns:
+            numpy array or None
+        """
+        matrix, found = self.get_vector_matrix([word])
+        return matrix[0] if found[0] else None
+
+    def get_batch_vectors(self, words: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Get vectors for multiple words.
+
+        Args:
+            words: List of words
+
+        Returns:
+            Dict mapping word -> vector
+        """
+        matrix, found = self.get_vector_matrix(words)
+        return {words[i]: matrix[i] for i in np.flatnonzero(found)}
+
+    def get_batch_info(self, words: List[str]) -> Dict[str, WordInfo]:
+        """
+        Get info for multiple words with a single vectorized lookup.
+        """
+        matrix, found = self.get_vector_matrix(words)
+        return {words[i]: self._make_word_info(words[i], matrix[i]) for i in np.flatnonzero(found)}
+
+    def enrich_word(self, word_info: WordInfo) -> WordInfo:
+        """
+        Attach this source's vector to a WordInfo from another source.
+        """
+        return self.enrich_batch([word_info])[0]
+
+    def enrich_batch(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Attach vectors to words that don't have one yet, in one row gather.
+
+        Args:
+            words: WordInfo objects to enrich
+
+        Returns:
+            The same list, enriched in-place
+        """
+        missing = [w for w in words if w.metadata.get('vector') is None]
+        matrix, found = self.get_vector_matrix([w.word for w in missing])
+
+        for i in np.flatnonzero(found):
+            missing[i].metadata['vector'] = matrix[i]
+            missing[i].metadata['has_vector'] = True
+
+        return words
+
+    def supports_batch(self) -> bool:
+        return True
+
+    def _make_word_info(self, word: str, vector: np.ndarray) -> WordInfo:
+        """Create a WordInfo carrying the vector metadata."""
+        return WordInfo(
+            word=word,
+            metadata={
+                'vector': vector,
+                'has_vector': True
+            }
+        )
+
+
+def _chain_line(first: bytes, rest):
+    """Yield an already-consumed first line, then the remaining lines."""
+    yield first
+    yield from rest
@@ -0,0 +1,208 @@
+"""
+Corpus frequency data source - real word counts from COCA/BNC-style tables.
+"""
+from typing import Optional, List, Dict, Tuple
+from pathlib import Path
+import json
+import logging
+import numpy as np
+
+from .base import DataSource
+from .vocab_index import make_vocab, lookup, is_converted, write_meta
+from ..models import WordInfo, VocabRelation
+
+
+logger = logging.getLogger(__name__)
+
+
+class FrequencySource(DataSource):
+    """
+    Word counts from a large delimited frequency table.
+
+    The table ("word<TAB>count" by default; other column layouts via
+    config) is converted once into a sorted fixed-width word array and a
+    matching count array saved as .npy next to it (or in `cache_dir`).
+    Later runs open them with mmap and look words up by binary search, so
+    the table is never loaded into a dict.
+
+    Rows repeating a word (e.g. COCA lists one row per part of speech, or
+    several casings when lowercasing) are summed.
+
+    Sets metadata['corpus_frequency'] (raw count) on words, which
+    FrequencyRankingProcessor prefers over graph-derived estimates.
+
+    Config:
+        cache_dir: Directory for converted files (default: next to the table)
+        word_column: Column holding the word (default: 0)
+        count_column: Column holding the count (default: 1)
+        delimiter: Column separator (default: tab)
+        lowercase: Lowercase words before summing (default: True)
+        max_word_bytes: Skip words longer than this many UTF-8 bytes (default: 64)
+    """
+
+    def __init__(self, path: str, config: Dict = None):
+        """
+        Initialize with path to a frequency table.
+
+        Args:
+            path: Path to the frequency table
+            config: Additional configuration
+        """
+        super().__init__(config)
+        self.path = Path(path)
+        self.cache_dir = Path(self.config.get('cache_dir', self.path.parent))
+        self.word_column = self.config.get('word_column', 0)
+        self.count_column = self.config.get('count_column', 1)
+        self.delimiter = self.config.get('delimiter', '\t')
+        self.lowercase = self.config.get('lowercase', True)
+        self.max_word_bytes = self.config.get('max_word_bytes', 64)
+
+        self.vocab: Optional[np.ndarray] = None   # sorted fixed-width UTF-8 words
+        self.counts: Optional[np.ndarray] = None  # int64 count per vocab entry
+        self.total = 0
+
+    def _do_initialize(self):
+        """Convert the table on first use, then memory-map it."""
+        stem = self.cache_dir / self.path.name
+        vocab_path = stem.with_name(stem.name + '.words.npy')
+        counts_path = stem.with_name(stem.name + '.counts.npy')
+        meta_path = stem.with_name(stem.name + '.meta.json')
+
+        if not is_converted(meta_path, self.path, self._settings()):
+            if not self.path.exists():
+                raise FileNotFoundError(f"Frequency table not found: {self.path}")
+            self._convert(vocab_path, counts_path, meta_path)
+
+        self.vocab = np.load(vocab_path, mmap_mode='r')
+        self.counts = np.load(counts_path, mmap_mode='r')
+        self.total = json.loads(meta_path.read_text(encoding='utf-8')).get('total', 0)
+        logger.info(f"Mapped {len(self.vocab)} word counts from {counts_path}")
+
+    def _settings(self) -> Dict:
+        """Conversion settings a converted copy must match."""
+        return {
+            'lowercase': self.lowercase,
+            'word_column': self.word_column,
+            'count_column': self.count_column,
+            'delimiter': self.delimiter,
+            'max_word_bytes': self.max_word_bytes,
+        }
+
+    def _convert(self, vocab_path: Path, counts_path: Path, meta_path: Path):
+        """Parse the table into sorted words and summed counts."""
+        logger.info(f"Converting {self.path} to memory-mapped counts (one-time)...")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        words, counts = [], []
+        needed = max(self.word_column, self.count_column)
+        with self.path.open('r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                parts = line.rstrip('\r\n').split(self.delimiter)
+                if len(parts) <= needed:
+                    continue
+                try:
+                    count = int(float(parts[self.count_column]))
+                except ValueError:
+                    continue  # header or malformed row
+                word = parts[self.word_column].strip()
+                if self.lowercase:
+                    word = word.lower()
+                encoded = word.encode('utf-8')
+                if not encoded or len(encoded) > self.max_word_bytes:
+                    continue
+                words.append(encoded)
+                counts.append(count)
+
+        vocab, order = make_vocab(words)
+        counts = np.array(counts, dtype=np.int64)[order]
+        unique, starts = np.unique(vocab, return_index=True)
+        summed = np.add.reduceat(counts, starts) if len(counts) else counts
+
+        np.save(vocab_path, unique)
+        np.save(counts_path, summed)
+        write_meta(meta_path, self.path, self._settings(), count=len(unique), total=int(summed.sum()))
+
+        logger.info(f"Converted {len(unique)} words ({len(words)} rows)")
+
+    def get_counts(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up counts for a word list with one vectorized binary search.
+
+        Args:
+            words: List of words
+
+        Returns:
+            (counts, found) - int64 counts (0 for unknown words) and a boolean
+            mask of words present in the table
+        """
+        self.initialize()
+        counts = np.zeros(len(words), dtype=np.int64)
+        pos, found = lookup(self.vocab, words, self.lowercase)
+        counts[found] = self.counts[pos[found]]
+        return counts, found
+
+    def get_count(self, word: str) -> int:
+        """
+        Get the corpus count of a word (0 if unknown).
+        """
+        counts, _ = self.get_counts([word])
+        return int(counts[0])
+
+    def get_word_info(self, word: str) -> Optional[WordInfo]:
+        """
+        Get word info from the frequency table.
+
+        Returns:
+            WordInfo with corpus_frequency metadata if the word is listed, None otherwise
+        """
+        counts, found = self.get_counts([word])
+        if not found[0]:
+            return None
+        return self._make_word_info(word, int(counts[0]))
+
+    def get_relations(self, word: str) -> List[VocabRelation]:
+        """
+        Frequency tables don't provide relations.
+        """
+        return []
+
+    def get_batch_info(self, words: List[str]) -> Dict[str, WordInfo]:
+        """
+        Get info for multiple words with a single vectorized lookup.
+        """
+        counts, found = self.get_counts(words)
+        return {words[i]: self._make_word_info(words[i], int(counts[i])) for i in np.flatnonzero(found)}
+
+    def enrich_word(self, word_info: WordInfo) -> WordInfo:
+        """
+        Attach this source's count to a WordInfo from another source.
+        """
+        return self.enrich_batch([word_info])[0]
+
+    def enrich_batch(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Attach counts to words that don't have one yet, in one lookup.
+
+        Args:
+            words: WordInfo objects to enrich
+
+        Returns:
+            The same list, enriched in-place
+        """
+        missing = [w for w in words if 'corpus_frequency' not in w.metadata]
+        counts, found = self.get_counts([w.word for w in missing])
+
+        for i in np.flatnonzero(found):
+            missing[i].metadata['corpus_frequency'] = int(counts[i])
+
+        return words
+
+    def supports_batch(self) -> bool:
+        return True
+
+    def _make_word_info(self, word: str, count: int) -> WordInfo:
+        """Create a WordInfo carrying the count metadata."""
+        return WordInfo(
+            word=word,
+            metadata={'corpus_frequency': count}
+        )
@@ -13,6 +13,19 @@ from ..models import WordInfo, VocabRelation, RelationType
 logger = logging.getLogger(__name__)
 
 
+# Map LLM relation types to our RelationType
+LLM_TYPE_MAP = {
+    'synonym': RelationType.SYNONYM,
+    'antonym': RelationType.ANTONYM,
+    'category': RelationType.HYPERNYM,  # Category ~= hypernym
+    'attribute': RelationType.RELATED,
+    'action': RelationType.RELATED,
+    'context': RelationType.RELATED,
+    'component': RelationType.RELATED,
+    'consequence': RelationType.RELATED,
+}
+
+
 class LLMSource(DataSource):
     """
     LLM-based semantic graph data source.
@@ -81,20 +94,11 @@ class LLMSource(DataSource):
         if word not in self.graph_data:
             return []
 
+        return self._to_relations(self.graph_data[word])
+
+    def _to_relations(self, associations: List[Dict]) -> List[VocabRelation]:
+        """Convert raw LLM associations to VocabRelation objects."""
         relations = []
-        associations = self.graph_data[word]
-
-        # Map LLM relation types to our RelationType
-        type_map = {
-            'synonym': RelationType.SYNONYM,
-            'antonym': RelationType.ANTONYM,
-            'category': RelationType.HYPERNYM,  # Category ~= hypernym
-            'attribute': RelationType.RELATED,
-            'action': RelationType.RELATED,
-            'context': RelationType.RELATED,
-            'component': RelationType.RELATED,
-            'consequence': RelationType.RELATED,
-        }
 
         for assoc in associations:
             target = assoc.get('target', '').strip().lower()
@@ -103,7 +107,7 @@ class LLMSource(DataSource):
             if not target:
                 continue
 
-            rel_type = type_map.get(rel_type_str, RelationType.RELATED)
+            rel_type = LLM_TYPE_MAP.get(rel_type_str, RelationType.RELATED)
 
             relations.append(VocabRelation(
                 target_id=f"word_{target}",
@@ -1,17 +1,25 @@
 """
 Spacy data source - provides word vectors and POS tagging.
 """
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 import logging
 import numpy as np
 
 from .base import DataSource
+from ..cache import LRUCache, MISSING
 from ..models import WordInfo, VocabRelation
 
 
 logger = logging.getLogger(__name__)
 
 
+# Pipeline components that are never needed to read a word vector
+VECTORS_ONLY_EXCLUDE = [
+    "tok2vec", "tagger", "morphologizer", "parser", "senter",
+    "attribute_ruler", "lemmatizer", "ner",
+]
+
+
 class SpacySource(DataSource):
     """
     Spacy-based data source for word vectors and POS.
@@ -20,6 +28,15 @@ class SpacySource(DataSource):
     - Word embeddings/vectors
     - POS tagging
     - Similarity computation
+
+    Config:
+        vectors_only: Skip the tagging pipeline and read vectors straight from
+            the model's Vectors table (default: False)
+        pos_lookup: Optional callable word -> POS used in vectors-only mode;
+            without it words default to 'noun' and POS is left to other sources
+        cache_size: Max number of cached lookups (default: 10000)
+        cache_path: Optional shelve file to persist cached vectors across builds
+        cache: An existing LRUCache to share between sources (overrides the above)
     """
 
     def __init__(self, model: str = "en_core_web_md", config: Dict = None):
@@ -32,15 +49,26 @@ class SpacySource(DataSource):
         """
         super().__init__(config)
         self.model_name = model
+        self.vectors_only = self.config.get('vectors_only', False)
+        self.pos_lookup = self.config.get('pos_lookup')
         self.nlp = None
-        self._word_cache = {}
+        self.cache = self.config.get('cache')
+        if self.cache is None:
+            self.cache = LRUCache(
+                capacity=self.config.get('cache_size', 10000),
+                path=self.config.get('cache_path')
+            )
 
     def _do_initialize(self):
         """Load spacy model."""
         try:
             import spacy
             logger.info(f"Loading spacy model: {self.model_name}")
-            self.nlp = spacy.load(self.model_name)
+            if self.vectors_only:
+                # Vocab and vectors only - no tagger/parser/NER weights
+                self.nlp = spacy.load(self.model_name, exclude=VECTORS_ONLY_EXCLUDE)
+            else:
+                self.nlp = spacy.load(self.model_name)
             logger.info("Spacy model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load spacy model: {e}")
@@ -56,36 +84,11 @@ class SpacySource(DataSource):
         """
         self.initialize()
 
-        # Check cache
-        if word in self._word_cache:
-            return self._word_cache[word]
-
-        doc = self.nlp(word)
-        if not doc or len(doc) == 0:
-            return None
-
-        token = doc[0]
-
-        # Check if has vector
-        if not token.has_vector:
+        entry = self._get_entries([word])[0]
+        if entry is None:
             return None
 
-        # Map POS
-        pos = token.pos_.lower()
-        if pos not in ['noun', 'verb', 'adj', 'adv']:
-            pos = 'noun'  # Default
-
-        word_info = WordInfo(
-            word=word,
-            pos=pos,
-            metadata={
-                'vector': token.vector,
-                'has_vector': True
-            }
-        )
-
-        self._word_cache[word] = word_info
-        return word_info
+        return self._make_word_info(word, entry)
 
     def get_relations(self, word: str) -> List[VocabRelation]:
         """
@@ -105,10 +108,8 @@ class SpacySource(DataSource):
             numpy array or None
         """
         self.initialize()
-        doc = self.nlp(word)
-        if doc and len(doc) > 0 and doc[0].has_vector:
-            return doc[0].vector
-        return None
+        entry = self._get_entries([word])[0]
+        return entry[1] if entry is not None else None
 
     def get_batch_vectors(self, words: List[str]) -> Dict[str, np.ndarray]:
         """
@@ -122,13 +123,144 @@ class SpacySource(DataSource):
         """
         self.initialize()
         result = {}
-        docs = list(self.nlp.pipe(words))
 
-        for word, doc in zip(words, docs):
-            if doc and len(doc) > 0 and doc[0].has_vector:
-                result[word] = doc[0].vector
+        for word, entry in zip(words, self._get_entries(words)):
+            if entry is not None:
+                result[word] = entry[1]
+
+        return result
+
+    def get_vector_matrix(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch vectors for a word list as one row gather from the Vectors table.
+
+        Args:
+            words: List of words
+
+        Returns:
+            (matrix, found) - float32 array of shape (len(words), dim) with zero
+            rows for unknown words, and a boolean mask of words that have a vector
+        """
+        self.initialize()
+        vectors = self.nlp.vocab.vectors
+        strings = self.nlp.vocab.strings
+
+        keys = np.fromiter((strings[w] for w in words), dtype=np.uint64, count=len(words))
+        rows = np.asarray(vectors.find(keys=keys)) if len(words) else np.empty(0, dtype=np.int64)
+        found = rows >= 0
+
+        matrix = np.zeros((len(words), vectors.shape[1]), dtype=np.float32)
+        if found.any():
+            matrix[found] = vectors.data[rows[found]]
+
+        return matrix, found
+
+    def get_batch_info(self, words: List[str]) -> Dict[str, WordInfo]:
+        """
+        Get info for multiple words at once.
+
+        Cache misses are computed together: one vectorized gather in
+        vectors-only mode, one nlp.pipe() pass otherwise.
+        """
+        self.initialize()
+        result = {}
+
+        for word, entry in zip(words, self._get_entries(words)):
+            if entry is not None:
+                result[word] = self._make_word_info(word, entry)
 
         return result
 
+    def enrich_word(self, word_info: WordInfo) -> WordInfo:
+        """
+        Attach this source's vector to a WordInfo from another source.
+        """
+        return self.enrich_batch([word_info])[0]
+
+    def enrich_batch(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Attach vectors to words that don't have one yet, in one batch lookup.
+
+        Args:
+            words: WordInfo objects to enrich
+
+        Returns:
+            The same list, enriched in-place
+        """
+        self.initialize()
+
+        missing = [w for w in words if w.metadata.get('vector') is None]
+        entries = self._get_entries([w.word for w in missing])
+
+        for word_info, entry in zip(missing, entries):
+            if entry is not None:
+                word_info.metadata['vector'] = entry[1]
+                word_info.metadata['has_vector'] = True
+
+        return words
+
     def supports_batch(self) -> bool:
         return True
+
+    def _get_entries(self, words: List[str]) -> List[Optional[Tuple[Optional[str], np.ndarray]]]:
+        """
+        Resolve (pos, vector) entries through the cache.
+
+        Returns:
+            One entry per word; None for words without a vector. The POS is
+            None when the entry was produced in vectors-only mode.
+        """
+        entries = [self.cache.get(self._cache_key(word)) for word in words]
+        missing = [i for i, entry in enumerate(entries) if entry is MISSING]
+
+        if missing:
+            computed = self._compute_entries([words[i] for i in missing])
+            for i, entry in zip(missing, computed):
+                self.cache.put(self._cache_key(words[i]), entry)
+                entries[i] = entry
+
+        return entries
+
+    def _compute_entries(self, words: List[str]) -> List[Optional[Tuple[Optional[str], np.ndarray]]]:
+        """Compute (pos, vector) entries for words that missed the cache."""
+        if self.vectors_only:
+            matrix, found = self.get_vector_matrix(words)
+            # Copy rows so evicted entries don't pin the whole batch matrix
+            return [(None, matrix[i].copy()) if found[i] else None for i in range(len(words))]
+
+        entries = []
+        for doc in self.nlp.pipe(words):
+            if doc and len(doc) > 0 and doc[0].has_vector:
+                entries.append((doc[0].pos_, doc[0].vector))
+            else:
+                entries.append(None)
+        return entries
+
+    def _cache_key(self, word: str) -> str:
+        """
+        Cache key, namespaced by model and mode so a shared or persisted
+        cache stays correct: vectors-only entries have no POS and read the
+        vector table directly, full entries come from the tagged doc.
+        """
+        mode = 'vectors' if self.vectors_only else 'full'
+        return f"{self.model_name}:{mode}:{word}"
+
+    def _make_word_info(self, word: str, entry: Tuple[Optional[str], np.ndarray]) -> WordInfo:
+        """Create a fresh WordInfo carrying the vector metadata."""
+        pos, vector = entry
+        if pos is None:
+            pos = 'noun' if self.pos_lookup is None else (self.pos_lookup(word) or 'noun')
+
+        # Map POS
+        pos = pos.lower()
+        if pos not in ['noun', 'verb', 'adj', 'adv']:
+            pos = 'noun'  # Default
+
+        return WordInfo(
+            word=word,
+            pos=pos,
+            metadata={
+                'vector': vector,
+                'has_vector': True
+            }
+        )
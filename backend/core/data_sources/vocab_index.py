@@ -0,0 +1,92 @@
+"""
+Sorted-vocabulary index shared by the file-backed sources (embeddings, frequencies).
+
+A vocabulary is stored as a sorted fixed-width UTF-8 byte array (numpy 'S'
+dtype) saved as .npy, so it can be memory-mapped and searched with one
+vectorized binary search. The converted files carry a .meta.json that records
+the source file's size/mtime and the conversion settings, so stale
+conversions are redone.
+"""
+from typing import Any, Dict, List, Tuple
+from pathlib import Path
+import json
+import numpy as np
+
+
+def make_vocab(encoded: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort encoded words into a fixed-width vocabulary array.
+
+    Args:
+        encoded: UTF-8 encoded words (duplicates allowed)
+
+    Returns:
+        (vocab, order) - sorted 'S' array and the input position of each
+        entry (vocab[i] == encoded[order[i]]; ties keep input order)
+    """
+    vocab = np.array(encoded, dtype=f'S{max((len(w) for w in encoded), default=1)}')
+    order = np.argsort(vocab, kind='stable')
+    return vocab[order], order.astype(np.int64)
+
+
+def lookup(vocab: np.ndarray, words: List[str], lowercase: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find words in a sorted vocabulary with one vectorized binary search.
+
+    Args:
+        vocab: Sorted 'S' array (e.g. memory-mapped output of make_vocab)
+        words: Words to look up
+        lowercase: Lowercase words first (must match the conversion)
+
+    Returns:
+        (positions, found) - index into vocab per word (only meaningful where
+        found) and a boolean mask of words present
+    """
+    if not words or len(vocab) == 0:
+        return np.zeros(len(words), dtype=np.int64), np.zeros(len(words), dtype=bool)
+
+    encoded = [(w.lower() if lowercase else w).encode('utf-8') for w in words]
+    keys = np.array(encoded, dtype=vocab.dtype)
+
+    pos = np.searchsorted(vocab, keys)
+    pos = np.minimum(pos, len(vocab) - 1)
+    found = vocab[pos] == keys
+    # Fixed-width keys silently truncate; reject words longer than the index width
+    found &= np.array([len(e) <= vocab.dtype.itemsize for e in encoded])
+    return pos, found
+
+
+def is_converted(meta_path: Path, source_path: Path, settings: Dict[str, Any]) -> bool:
+    """
+    Check that converted files exist and match the source file and settings.
+
+    Converted files shipped without their source are accepted as-is.
+    """
+    if not meta_path.exists():
+        return False
+    try:
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False
+
+    if not source_path.exists():
+        return True
+
+    stat = source_path.stat()
+    return (
+        meta.get('source_size') == stat.st_size
+        and meta.get('source_mtime') == int(stat.st_mtime)
+        and all(meta.get(key) == value for key, value in settings.items())
+    )
+
+
+def write_meta(meta_path: Path, source_path: Path, settings: Dict[str, Any], **stats) -> None:
+    """Record the source file, conversion settings and stats next to converted files."""
+    stat = source_path.stat()
+    meta_path.write_text(json.dumps({
+        'source': str(source_path),
+        'source_size': stat.st_size,
+        'source_mtime': int(stat.st_mtime),
+        **settings,
+        **stats,
+    }), encoding='utf-8')
@@ -1,10 +1,11 @@
 """
 WordNet data source - provides hierarchy and definitions.
 """
-from typing import Optional, List
+from typing import Optional, List, Dict
 import logging
 
 from .base import DataSource
+from ..cache import LRUCache, MISSING
 from ..models import WordInfo, VocabRelation, RelationType
 
 
@@ -20,8 +21,20 @@ class WordNetSource(DataSource):
     - Hypernym/hyponym relations
     - Part of speech
     - Hierarchy depth information
+
+    Synset lookups go through a bounded LRU cache, so the base-info pass
+    and the relation pass of a build query WordNet once per word as long as
+    the wordlist fits in the cache.
+
+    Config:
+        cache_size: Max number of words whose synsets are cached
+            (default: 50000)
     """
 
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self._synset_cache = LRUCache(capacity=self.config.get('cache_size', 50000))
+
     def _do_initialize(self):
         """Download and load WordNet."""
         try:
@@ -51,7 +64,7 @@ class WordNetSource(DataSource):
         """
         self.initialize()
 
-        synsets = self.wn.synsets(word)
+        synsets = self._synsets(word)
         if not synsets:
             return None
 
@@ -92,13 +105,24 @@ class WordNetSource(DataSource):
         """
         self.initialize()
 
-        relations = []
-        synsets = self.wn.synsets(word)
+        synsets = self._synsets(word)
 
         if not synsets:
-            return relations
+            return []
 
-        synset = synsets[0]
+        return self._synset_relations(synsets[0], word)
+
+    def _synsets(self, word: str) -> list:
+        """WordNet synsets of a word, cached."""
+        synsets = self._synset_cache.get(word)
+        if synsets is MISSING:
+            synsets = self.wn.synsets(word)
+            self._synset_cache.put(word, synsets)
+        return synsets
+
+    def _synset_relations(self, synset, word: str) -> List[VocabRelation]:
+        """Build relations from a word's primary synset."""
+        relations = []
 
         # Hypernyms (is-a, parent)
         for hypernym in synset.hypernyms():
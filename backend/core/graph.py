@@ -0,0 +1,268 @@
+"""
+Integer-indexed relation graph shared by processors.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import logging
+import numpy as np
+
+from .models import WordInfo, RelationType
+
+
+logger = logging.getLogger(__name__)
+
+
+# Edge type codes follow the enum order
+RELATION_TYPES: List[RelationType] = list(RelationType)
+TYPE_CODES: Dict[RelationType, int] = {t: i for i, t in enumerate(RELATION_TYPES)}
+
+TypeSpec = Optional[Union[RelationType, Iterable[RelationType]]]
+
+
+class RelationGraph:
+    """
+    All word relations as flat edge arrays with CSR adjacency.
+
+    Nodes 0..n_words-1 are the words (in list order); relation targets that
+    are not in the word list get "ghost" node ids after them, so external
+    targets (e.g. WordNet hypernyms outside the vocabulary) can still be
+    counted. Edge e is words[src[e]].relations[rel_pos[e]].
+
+    Built once from the words and passed between processors by the builder;
+    use Processor.get_graph() rather than constructing it directly.
+
+    Usage:
+        graph = RelationGraph.from_words(words)
+        indptr, indices, weights = graph.csr(RelationType.HYPERNYM)
+        in_degree = graph.in_degree()
+    """
+
+    def __init__(
+        self,
+        node_ids: List[str],
+        n_words: int,
+        src: np.ndarray,
+        dst: np.ndarray,
+        types: np.ndarray,
+        weights: np.ndarray,
+        rel_pos: np.ndarray
+    ):
+        """
+        Args:
+            node_ids: Word ids followed by ghost target ids
+            n_words: Number of word nodes
+            src: (E,) source node per edge, non-decreasing
+            dst: (E,) target node per edge
+            types: (E,) type code per edge (see TYPE_CODES)
+            weights: (E,) relation strengths
+            rel_pos: (E,) position of the edge in its source word's relations
+        """
+        self.node_ids = node_ids
+        self.n_words = n_words
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.src = src
+        self.dst = dst
+        self.types = types
+        self.weights = weights
+        self.rel_pos = rel_pos
+
+        # Forward CSR: edges are already grouped by source
+        self.out_indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=self.num_nodes), out=self.out_indptr[1:])
+
+        # Reverse CSR: edge ids grouped by target
+        self.in_order = np.argsort(dst, kind='stable')
+        self.in_indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=self.num_nodes), out=self.in_indptr[1:])
+
+        self._type_masks: Dict[Tuple[int, ...], np.ndarray] = {}
+        self._relation_signature: Optional[Tuple] = None
+
+    @classmethod
+    def from_words(cls, words: List[WordInfo]) -> 'RelationGraph':
+        """
+        Build the graph with one pass over all relations.
+
+        Args:
+            words: Words in builder order
+
+        Returns:
+            RelationGraph
+        """
+        node_ids = [w.id for w in words]
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        src, dst, types, weights, rel_pos = [], [], [], [], []
+        for i, word in enumerate(words):
+            for pos, rel in enumerate(word.relations):
+                target = index.get(rel.target_id)
+                if target is None:
+                    target = index[rel.target_id] = len(node_ids)
+                    node_ids.append(rel.target_id)
+                src.append(i)
+                dst.append(target)
+                types.append(TYPE_CODES[RelationType(rel.type)])
+                weights.append(rel.strength)
+                rel_pos.append(pos)
+
+        graph = cls(
+            node_ids=node_ids,
+            n_words=len(words),
+            src=np.array(src, dtype=np.int64),
+            dst=np.array(dst, dtype=np.int64),
+            types=np.array(types, dtype=np.int8),
+            weights=np.array(weights, dtype=np.float32),
+            rel_pos=np.array(rel_pos, dtype=np.int64)
+        )
+        graph._relation_signature = cls._signature(words)
+
+        logger.info(f"Built relation graph: {graph.n_words} words, "
+                    f"{graph.num_nodes - graph.n_words} external targets, {graph.num_edges} edges")
+        return graph
+
+    @staticmethod
+    def _signature(words: List[WordInfo]) -> Tuple:
+        """Cheap fingerprint of the word list and its relation lists."""
+        return tuple((id(w), id(w.relations), len(w.relations)) for w in words)
+
+    def matches(self, words: List[WordInfo]) -> bool:
+        """
+        True if the graph still describes these words (same objects, same
+        order, no relation list replaced or resized since it was built).
+        """
+        return len(words) == self.n_words and self._signature(words) == self._relation_signature
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    def node_word(self, node: int) -> str:
+        """Word text of a node (ghost ids are parsed from their 'word_' id)."""
+        node_id = self.node_ids[node]
+        return node_id[5:] if node_id.startswith('word_') else node_id
+
+    def type_mask(self, types: TypeSpec = None, internal_only: bool = False) -> np.ndarray:
+        """
+        Boolean edge mask for the given relation type(s).
+
+        Args:
+            types: RelationType, iterable of types, or None for all
+            internal_only: Keep only edges whose target is a word node
+
+        Returns:
+            (E,) bool array
+        """
+        if types is None:
+            codes = ()
+        elif isinstance(types, RelationType):
+            codes = (TYPE_CODES[types],)
+        else:
+            codes = tuple(sorted(TYPE_CODES[RelationType(t)] for t in types))
+
+        key = codes + ((-1,) if internal_only else ())
+        mask = self._type_masks.get(key)
+        if mask is None:
+            mask = np.isin(self.types, codes) if codes else np.ones(self.num_edges, dtype=bool)
+            if internal_only:
+                mask &= self.dst < self.n_words
+            self._type_masks[key] = mask
+        return mask
+
+    def edges(self, types: TypeSpec = None, internal_only: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Edge arrays filtered by type.
+
+        Returns:
+            (src, dst, weights) arrays
+        """
+        if types is None and not internal_only:
+            return self.src, self.dst, self.weights
+        mask = self.type_mask(types, internal_only)
+        return self.src[mask], self.dst[mask], self.weights[mask]
+
+    def csr(
+        self,
+        types: TypeSpec = None,
+        reverse: bool = False,
+        internal_only: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        CSR adjacency of the subgraph with the given edge types.
+
+        Args:
+            types: RelationType, iterable of types, or None for all
+            reverse: Index by target instead of source
+            internal_only: Restrict to word nodes (rows/columns < n_words)
+
+        Returns:
+            (indptr, indices, weights) - neighbors of node i are
+            indices[indptr[i]:indptr[i + 1]]
+        """
+        if types is None and not internal_only:
+            if not reverse:
+                return self.out_indptr, self.dst, self.weights
+            return self.in_indptr, self.src[self.in_order], self.weights[self.in_order]
+
+        src, dst, weights = self.edges(types, internal_only)
+        if reverse:
+            src, dst = dst, src
+            order = np.argsort(src, kind='stable')
+            src, dst, weights = src[order], dst[order], weights[order]
+
+        num_rows = self.n_words if internal_only else self.num_nodes
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_rows), out=indptr[1:])
+        return indptr, dst, weights
+
+    def in_degree(self, types: TypeSpec = None, internal_only: bool = False) -> np.ndarray:
+        """
+        Incoming edge count per node (duplicates count).
+
+        Returns:
+            (num_nodes,) int64 array
+        """
+        _, dst, _ = self.edges(types, internal_only)
+        return np.bincount(dst, minlength=self.num_nodes)
+
+    def out_degree(self, types: TypeSpec = None, internal_only: bool = False) -> np.ndarray:
+        """
+        Outgoing edge count per node (ghost nodes have none).
+
+        Returns:
+            (num_nodes,) int64 array
+        """
+        src, _, _ = self.edges(types, internal_only)
+        return np.bincount(src, minlength=self.num_nodes)
+
+    def filter_relations(self, words: List[WordInfo], keep: np.ndarray) -> int:
+        """
+        Remove the relations of edges not in `keep` from the words' lists.
+
+        Only words that lose edges get a new list. The graph itself no
+        longer matches the words afterwards.
+
+        Args:
+            words: Words the graph was built from
+            keep: (E,) bool mask of edges to keep
+
+        Returns:
+            Number of relations removed
+        """
+        affected = np.zeros(self.num_nodes, dtype=bool)
+        affected[self.src[~keep]] = True
+        nodes = np.flatnonzero(affected)
+
+        # Kept positions of affected words, grouped by word (edges are sorted by source)
+        kept = keep & affected[self.src]
+        kept_src = self.src[kept]
+        positions = self.rel_pos[kept].tolist()
+        starts = np.searchsorted(kept_src, nodes, side='left').tolist()
+        ends = np.searchsorted(kept_src, nodes, side='right').tolist()
+
+        for node, start, end in zip(nodes.tolist(), starts, ends):
+            relations = words[node].relations
+            words[node].relations = [relations[pos] for pos in positions[start:end]]
+        return int((~keep).sum())
@@ -2,10 +2,14 @@
 Core data models for the Universe Builder.
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable
 from enum import Enum
 
 
+# How add_relation resolves a (target, type) pair reported more than once
+RELATION_MERGE_RULES = ('max', 'weighted')
+
+
 class RelationType(str, Enum):
     """Supported relation types"""
     SYNONYM = "synonym"
@@ -22,6 +26,9 @@ class VocabRelation:
     type: RelationType
     strength: float = 0.5
 
+    # Total weight of the reports merged into `strength` (see WordInfo.add_relation)
+    merge_weight: float = field(default=1.0, repr=False, compare=False)
+
     def to_dict(self) -> dict:
         return {
             "targetId": self.target_id,
@@ -56,10 +63,108 @@ class WordInfo:
     # Additional metadata (for internal processing)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Merge index over relations: (target_id, type) -> position
+    _relation_index: Optional[Dict[tuple, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _relation_targets: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _relation_index_key: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if not self.id:
             self.id = f"word_{self.word}"
 
+    def _relations_key(self) -> tuple:
+        """Cheap fingerprint of `relations`: list identity, length and last item."""
+        relations = self.relations
+        return (id(relations), len(relations), id(relations[-1]) if relations else None)
+
+    def _get_relation_index(self, rebuild: bool = False) -> Dict[tuple, int]:
+        """
+        Return the (target, type) -> position index, rebuilding it if
+        `relations` was replaced, resized or appended to directly since it
+        was last built (or if `rebuild` is set).
+
+        Merge weights live on the relations themselves, so a rebuild loses
+        nothing.
+        """
+        key = self._relations_key()
+        if rebuild or self._relation_index is None or self._relation_index_key != key:
+            index, targets = {}, {}
+            for pos, rel in enumerate(self.relations):
+                pair = (rel.target_id, rel.type)
+                if pair not in index:
+                    index[pair] = pos
+                    targets[rel.target_id] = targets.get(rel.target_id, 0) + 1
+            self._relation_index = index
+            self._relation_targets = targets
+            self._relation_index_key = key
+        return self._relation_index
+
+    def _find_relation(self, pair: tuple) -> Optional[VocabRelation]:
+        """Relation with this (target, type) pair, verified against the list."""
+        pos = self._get_relation_index().get(pair)
+        if pos is not None:
+            rel = self.relations[pos] if pos < len(self.relations) else None
+            if rel is None or (rel.target_id, rel.type) != pair:
+                # Reordered or edited in place without changing the fingerprint
+                pos = self._get_relation_index(rebuild=True).get(pair)
+        return None if pos is None else self.relations[pos]
+
+    def has_relation_to(self, target_id: str) -> bool:
+        """True if any relation (of any type) points at target_id."""
+        self._get_relation_index()
+        return target_id in self._relation_targets
+
+    def add_relation(self, relation: VocabRelation, rule: str = 'max', weight: float = 1.0) -> bool:
+        """
+        Add a relation, merging it with an existing one of the same target and type.
+
+        Args:
+            relation: Relation to add
+            rule: How to resolve the strength of a duplicate:
+                - 'max': keep the strongest report
+                - 'weighted': weighted mean of all reports so far
+            weight: Weight of this report for the 'weighted' rule; the
+                running total is kept in the relation's merge_weight
+                (relations appended directly count as weight 1.0)
+
+        Returns:
+            True if a new edge was added, False if it was merged
+        """
+        if rule not in RELATION_MERGE_RULES:
+            raise ValueError(f"Unknown relation merge rule: {rule}")
+
+        pair = (relation.target_id, relation.type)
+        existing = self._find_relation(pair)
+
+        if existing is None:
+            relation.merge_weight = weight
+            self._relation_index[pair] = len(self.relations)
+            targets = self._relation_targets
+            targets[relation.target_id] = targets.get(relation.target_id, 0) + 1
+            self.relations.append(relation)
+            self._relation_index_key = self._relations_key()
+            return True
+
+        if rule == 'max':
+            existing.strength = max(existing.strength, relation.strength)
+        else:
+            total = existing.merge_weight + weight
+            existing.strength = (existing.strength * existing.merge_weight + relation.strength * weight) / total
+            existing.merge_weight = total
+        return False
+
+    def add_relations(self, relations: Iterable[VocabRelation], rule: str = 'max', weight: float = 1.0) -> int:
+        """
+        Add several relations with add_relation.
+
+        Returns:
+            Number of new edges (the rest were merged into existing ones)
+        """
+        return sum(self.add_relation(rel, rule, weight) for rel in relations)
+
     def to_dict(self) -> dict:
         """Convert to v4.0-static format"""
         result = {
@@ -104,6 +209,10 @@ class UniverseData:
     galaxies: List[GalaxyConfig] = field(default_factory=list)
     meta: Dict[str, Any] = field(default_factory=dict)
 
+    # Optional top-level blocks added by processors (e.g. "ancestry");
+    # values are dicts or objects with to_dict()
+    extensions: Dict[str, Any] = field(default_factory=dict)
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict"""
         import time
@@ -121,4 +230,7 @@ class UniverseData:
         if self.galaxies:
             result["galaxies"] = [g.to_dict() for g in self.galaxies]
 
+        for key, value in self.extensions.items():
+            result[key] = value.to_dict() if hasattr(value, 'to_dict') else value
+
         return result
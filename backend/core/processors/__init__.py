@@ -4,8 +4,18 @@ Processors for transforming and enriching vocabulary data.
 from .base import Processor
 from .hierarchy import HierarchyProcessor
 from .semantic import SemanticProcessor
-from .clustering import ThematicClusteringProcessor, VectorClusteringProcessor
-from .ranking import FrequencyRankingProcessor
+from .clustering import (
+    ThematicClusteringProcessor,
+    VectorClusteringProcessor,
+    CommunityClusteringProcessor,
+)
+from .reduction import DimensionalityReductionProcessor
+from .pruning import GraphPruningProcessor
+from .validation import EdgeValidationProcessor
+from .summary import GalaxySummaryProcessor
+from .celestial import CelestialAttributesProcessor
+from .spatial import SpatialIndexProcessor
+from .ranking import FrequencyRankingProcessor, CentralityRankingProcessor
 
 __all__ = [
     "Processor",
@@ -13,5 +23,13 @@ __all__ = [
     "SemanticProcessor",
     "ThematicClusteringProcessor",
     "VectorClusteringProcessor",
+    "CommunityClusteringProcessor",
+    "DimensionalityReductionProcessor",
+    "GraphPruningProcessor",
+    "EdgeValidationProcessor",
+    "GalaxySummaryProcessor",
+    "CelestialAttributesProcessor",
+    "SpatialIndexProcessor",
     "FrequencyRankingProcessor",
+    "CentralityRankingProcessor",
 ]
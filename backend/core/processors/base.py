@@ -2,8 +2,9 @@
 Abstract base class for processors.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from ..models import WordInfo
+from ..graph import RelationGraph
 
 
 class Processor(ABC):
@@ -15,8 +16,15 @@ class Processor(ABC):
     - SemanticProcessor: adds semantic relations
     - ClusteringProcessor: assigns galaxy groupings
     - RankingProcessor: computes importance/frequency scores
+
+    Processors read relations through get_graph(), which returns the
+    RelationGraph the builder passes along in `graph` (or builds one).
+    Processors that add, remove or reweight relations set
+    `modifies_relations = True` so the builder rebuilds it after them.
     """
 
+    modifies_relations: bool = False
+
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize processor with configuration.
@@ -25,6 +33,22 @@ class Processor(ABC):
             config: Processor-specific configuration
         """
         self.config = config or {}
+        self.graph: Optional[RelationGraph] = None
+
+    def get_graph(self, words: List[WordInfo]) -> RelationGraph:
+        """
+        Relation graph for these words, reusing the shared one when it is
+        still valid.
+
+        Args:
+            words: Words being processed
+
+        Returns:
+            RelationGraph
+        """
+        if self.graph is None or not self.graph.matches(words):
+            self.graph = RelationGraph.from_words(words)
+        return self.graph
 
     @abstractmethod
     def process(self, words: List[WordInfo]) -> List[WordInfo]:
@@ -0,0 +1,179 @@
+"""
+Celestial attributes processor - precomputes the frontend's visual mapping.
+"""
+from typing import Any, Dict, List, Optional
+import logging
+import numpy as np
+
+from .base import Processor
+from ..models import WordInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+# Mirrors src/features/universe/visualConfig.ts - keep the two in sync.
+# Code order follows the CelestialType / SpectralClass unions in universe.ts.
+CELESTIAL_TYPES = ['supergiant', 'giant', 'main_sequence', 'dwarf', 'white_dwarf', 'planet', 'moon']
+SPECTRAL_CLASSES = ['O', 'B', 'A', 'F', 'G', 'K', 'M']
+
+SPECTRAL_COLORS = {
+    'O': '#4d9fff',
+    'B': '#7db4ff',
+    'A': '#d4e4ff',
+    'F': '#fffacd',
+    'G': '#ffdd55',
+    'K': '#ff8c42',
+    'M': '#ff4757',
+}
+
+BASE_SIZES = {
+    'supergiant': 100,
+    'giant': 70,
+    'main_sequence': 45,
+    'dwarf': 20,
+    'white_dwarf': 18,
+    'planet': 18,
+    'moon': 10,
+}
+
+# Age (years) above which a star gets each class, oldest first
+AGE_THRESHOLDS = [(500, 'M'), (300, 'K'), (100, 'G'), (50, 'F'), (20, 'A')]
+
+PLANET_COLORS = {
+    'theme_abstract': '#9ca3af',
+    'theme_communication': '#60a5fa',
+    'theme_education': '#34d399',
+    'theme_technology': '#a78bfa',
+    'theme_science': '#fbbf24',
+    'theme_emotion': '#f472b6',
+    'theme_action': '#fb923c',
+}
+DEFAULT_PLANET_COLOR = '#9ca3af'
+
+STAR_TYPES = ['supergiant', 'giant', 'main_sequence']
+
+
+class CelestialAttributesProcessor(Processor):
+    """
+    Computes each word's celestial type, spectral class, color, radius and
+    luminosity with the same rules as UniverseMapper.vocabToCelestial, so
+    clients can skip the per-node mapping pass on load.
+
+    All attributes are computed as whole-column NumPy expressions over the
+    word levels, frequencies and years. They are exported as the universe's
+    "celestial" block: small integer codes into lookup tables for the
+    categorical attributes, and rounded number arrays for radius and
+    luminosity, all in word order.
+
+    Run it after ranking and hierarchy processing, when levels and
+    frequencies are final.
+
+    Config:
+        reference_year: Year ages are measured from (default: 2024, as in
+            the frontend mapper)
+        decimals: Decimals kept for radius and luminosity (default: 2)
+    """
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.reference_year = self.config.get('reference_year', 2024)
+        self.decimals = self.config.get('decimals', 2)
+        self.attributes: Optional[Dict[str, Any]] = None
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Compute celestial attributes for all words.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words unchanged (attributes are attached as an export block)
+        """
+        if not words:
+            return words
+
+        count = len(words)
+        levels = np.fromiter((w.hierarchy_level for w in words), dtype=np.int64, count=count)
+        frequency = np.fromiter((w.frequency for w in words), dtype=np.float64, count=count)
+        years = np.fromiter((w.first_recorded_year for w in words), dtype=np.int64, count=count)
+
+        types = celestial_types(levels, frequency)
+        is_star = types <= CELESTIAL_TYPES.index(STAR_TYPES[-1])
+
+        # Stars are colored by age; other bodies by galaxy with class "G"
+        # as a placeholder
+        spectral = np.where(is_star, spectral_classes(self.reference_year - years),
+                            SPECTRAL_CLASSES.index('G'))
+
+        palette = list(dict.fromkeys(
+            [SPECTRAL_COLORS[c] for c in SPECTRAL_CLASSES]
+            + list(PLANET_COLORS.values()) + [DEFAULT_PLANET_COLOR]))
+        palette_index = {color: i for i, color in enumerate(palette)}
+        galaxy_color = {galaxy_id: palette_index[PLANET_COLORS.get(galaxy_id, DEFAULT_PLANET_COLOR)]
+                        for galaxy_id in {w.galaxy_id for w in words}}
+        planet_colors = np.fromiter((galaxy_color[w.galaxy_id] for w in words), dtype=np.int64, count=count)
+        colors = np.where(is_star, spectral, planet_colors)  # spectral colors lead the palette
+
+        self.attributes = {
+            "types": CELESTIAL_TYPES,
+            "spectralClasses": SPECTRAL_CLASSES,
+            "palette": palette,
+            "type": types.tolist(),
+            "spectralClass": spectral.tolist(),
+            "color": colors.tolist(),
+            "radius": np.round(celestial_radii(types, frequency), self.decimals).tolist(),
+            "luminosity": np.round(luminosities(frequency, levels), self.decimals).tolist()
+        }
+        words[0].metadata.setdefault('_extensions', {})['celestial'] = self.attributes
+
+        type_counts = np.bincount(types, minlength=len(CELESTIAL_TYPES))
+        logger.info(f"Celestial types: "
+                    f"{ {name: int(n) for name, n in zip(CELESTIAL_TYPES, type_counts) if n} }")
+        return words
+
+
+def celestial_types(levels: np.ndarray, frequency: np.ndarray) -> np.ndarray:
+    """
+    Celestial type code per word (index into CELESTIAL_TYPES).
+
+    Level 0 is a supergiant; levels 1-2 are giants above a frequency cutoff
+    (6000 / 7000) and main-sequence stars otherwise; levels 3-4 are planets,
+    5-6 dwarfs and deeper levels moons.
+    """
+    code = {name: i for i, name in enumerate(CELESTIAL_TYPES)}
+    return np.select(
+        [levels == 0,
+         (levels == 1) & (frequency > 6000),
+         (levels == 2) & (frequency > 7000),
+         levels <= 2,
+         levels <= 4,
+         levels <= 6],
+        [code['supergiant'], code['giant'], code['giant'],
+         code['main_sequence'], code['planet'], code['dwarf']],
+        default=code['moon']
+    ).astype(np.int64)
+
+
+def spectral_classes(ages: np.ndarray) -> np.ndarray:
+    """Spectral class code per word age (index into SPECTRAL_CLASSES)."""
+    bounds = np.array([age for age, _ in AGE_THRESHOLDS[::-1]])
+    classes = np.array([SPECTRAL_CLASSES.index(c) for _, c in AGE_THRESHOLDS[::-1]])
+    # Number of thresholds strictly below each age; 0 means newer than all
+    passed = np.searchsorted(bounds, ages, side='left')
+    return np.where(passed > 0, classes[np.maximum(passed - 1, 0)], SPECTRAL_CLASSES.index('O'))
+
+
+def celestial_radii(types: np.ndarray, frequency: np.ndarray) -> np.ndarray:
+    """Base size of the type scaled by log frequency (roughly +-30%)."""
+    base = np.array([BASE_SIZES[name] for name in CELESTIAL_TYPES], dtype=np.float64)
+    frequency_factor = np.log10(np.maximum(frequency, 1)) / 4
+    return base[types] * (0.7 + frequency_factor * 0.6)
+
+
+def luminosities(frequency: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """Brightness 0-100: frequent words high in the hierarchy shine most."""
+    freq_score = np.minimum(frequency / 10000, 1)
+    level_score = np.maximum(0, (10 - levels) / 10)
+    return (freq_score * 0.6 + level_score * 0.4) * 100
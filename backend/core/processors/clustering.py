@@ -1,13 +1,17 @@
 """
 Clustering processor - assigns words to galaxies/themes.
 """
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import Counter
+from pathlib import Path
 import logging
 import math
+import zlib
+import numpy as np
 
 from .base import Processor
-from ..models import WordInfo, GalaxyConfig
+from ..models import WordInfo, GalaxyConfig, RelationType
+from ..similarity import QuantizedVectors, normalize_rows
 
 
 logger = logging.getLogger(__name__)
@@ -18,9 +22,13 @@ class ThematicClusteringProcessor(Processor):
     Assigns words to thematic galaxies.
 
     Strategy:
-    1. Extract themes from LLM category relations
+    1. Count hypernym targets (in or outside the word list) with one
+       bincount over the graph's type-coded edges
     2. Create galaxy configs for top N themes
-    3. Assign words to galaxies based on their relations
+    3. Assign words to the theme of their first hypernym that is a theme
+       (theme words themselves join their own galaxy)
+    4. Words left over join the theme whose vector centroid is nearest;
+       words without vectors get a stable crc32 bucket
 
     Config:
         num_galaxies: Number of galaxies to create (default: 7)
@@ -47,68 +55,59 @@ class ThematicClusteringProcessor(Processor):
         """
         logger.info(f"Clustering {len(words)} words into {self.num_galaxies} galaxies...")
 
-        # Step 1: Extract themes from word categories
-        theme_counts = Counter()
-
-        for word in words:
-            # Look for category-type relations to identify themes
-            for rel in word.relations:
-                if rel.type.value in ['hypernym', 'category']:
-                    # Extract target word as potential theme
-                    target_word = rel.target_id.replace('word_', '')
-                    theme_counts[target_word.capitalize()] += 1
+        # Step 1: Extract themes from hypernym targets (including targets
+        # outside the word list)
+        graph = self.get_graph(words)
+        hyper_src, hyper_dst, _ = graph.edges(RelationType.HYPERNYM)
+        theme_counts = np.bincount(hyper_dst, minlength=graph.num_nodes)
 
         # Step 2: Select top themes
-        if theme_counts:
-            themes = [theme for theme, _ in theme_counts.most_common(self.num_galaxies)]
+        if hyper_dst.size:
+            top_nodes = np.argsort(-theme_counts, kind='stable')[:self.num_galaxies]
+            top_nodes = top_nodes[theme_counts[top_nodes] > 0]
+            themes = [graph.node_word(node).capitalize() for node in top_nodes]
         else:
             # Fallback to default themes
+            top_nodes = np.empty(0, dtype=np.int64)
             themes = self.default_themes[:self.num_galaxies]
 
         logger.info(f"Selected themes: {themes}")
 
         # Step 3: Create galaxy configs
-        galaxies = []
-        radius = 4000  # Match frontend scale
-
-        for i, theme in enumerate(themes):
-            # Distribute galaxies in 3D sphere using Fibonacci sphere
-            phi = math.acos(-1 + 2 * i / len(themes))
-            theta = math.sqrt(len(themes) * math.pi) * phi
-
-            galaxy = GalaxyConfig(
-                id=f"galaxy_{theme.lower().replace(' ', '_')}",
-                name=theme,
-                color=f"hsl({(i * 137.5) % 360}, 70%, 60%)",
-                center={
-                    "x": radius * math.sin(phi) * math.cos(theta),
-                    "y": radius * math.sin(phi) * math.sin(theta),
-                    "z": radius * math.cos(phi)
-                }
-            )
-            galaxies.append(galaxy)
+        galaxies = make_galaxies(
+            [f"galaxy_{theme.lower().replace(' ', '_')}" for theme in themes], themes)
 
         # Store galaxies in metadata for later export
         if words:
             words[0].metadata['_galaxies'] = galaxies
 
-        # Step 4: Assign words to galaxies
-        theme_to_galaxy = {theme: galaxies[i].id for i, theme in enumerate(themes)}
-
-        for word in words:
-            # Try to find theme from hypernym relations
-            assigned = False
-            for rel in word.relations:
-                if rel.type.value in ['hypernym', 'category']:
-                    target_word = rel.target_id.replace('word_', '').capitalize()
-                    if target_word in theme_to_galaxy:
-                        word.galaxy_id = theme_to_galaxy[target_word]
-                        assigned = True
-                        break
-
-            # Fallback: assign based on word hash for consistency
-            if not assigned:
-                word.galaxy_id = galaxies[hash(word.word) % len(galaxies)].id
+        # Step 4: Assign words to the galaxy of their first hypernym that is a theme
+        assigned = np.full(len(words), -1, dtype=np.int64)
+        theme_of_node = np.full(graph.num_nodes, -1, dtype=np.int64)
+        theme_of_node[top_nodes] = np.arange(len(top_nodes))
+        edge_theme = theme_of_node[hyper_dst]
+        hit = edge_theme >= 0
+        first_src, first_edge = np.unique(hyper_src[hit], return_index=True)
+        assigned[first_src] = edge_theme[hit][first_edge]
+
+        # Theme words in the vocabulary belong to their own galaxy
+        own_theme = top_nodes[top_nodes < len(words)]
+        unset = assigned[own_theme] < 0
+        assigned[own_theme[unset]] = theme_of_node[own_theme[unset]]
+
+        matched = int((assigned >= 0).sum())
+        if matched < len(words) and len(top_nodes):
+            self._assign_nearest_theme(words, assigned, len(top_nodes))
+
+        for word, galaxy_index in zip(words, assigned.tolist()):
+            if galaxy_index >= 0:
+                word.galaxy_id = galaxies[galaxy_index].id
+            else:
+                # Fallback: stable hash of the word (same in every process)
+                word.galaxy_id = galaxies[stable_bucket(word.word, len(galaxies))].id
+
+        logger.info(f"Assigned {matched} words by hypernym theme, "
+                    f"{int((assigned >= 0).sum()) - matched} by nearest theme centroid")
 
         # Log distribution
         galaxy_dist = Counter(w.galaxy_id for w in words)
@@ -116,6 +115,28 @@ class ThematicClusteringProcessor(Processor):
 
         return words
 
+    def _assign_nearest_theme(self, words: List[WordInfo], assigned: np.ndarray, num_themes: int) -> None:
+        """
+        Give unmatched words with vectors the theme whose centroid (mean of
+        the matched members' normalized vectors) is most similar, using one
+        matrix product. Updates assigned in place.
+        """
+        has_vector = np.fromiter((w.metadata.get('vector') is not None for w in words),
+                                 dtype=bool, count=len(words))
+        members = np.flatnonzero(has_vector & (assigned >= 0))
+        pending = np.flatnonzero(has_vector & (assigned < 0))
+        if len(members) == 0 or len(pending) == 0:
+            return
+
+        member_vectors = normalize_rows(np.stack([words[i].metadata['vector'] for i in members]))
+        sums = np.zeros((num_themes, member_vectors.shape[1]), dtype=np.float32)
+        np.add.at(sums, assigned[members], member_vectors)
+        populated = np.flatnonzero(np.bincount(assigned[members], minlength=num_themes))
+        centroids = normalize_rows(sums[populated])
+
+        pending_vectors = normalize_rows(np.stack([words[i].metadata['vector'] for i in pending]))
+        assigned[pending] = populated[np.argmax(pending_vectors @ centroids.T, axis=1)]
+
 
 class VectorClusteringProcessor(Processor):
     """
@@ -126,12 +147,38 @@ class VectorClusteringProcessor(Processor):
     Config:
         num_galaxies: Number of clusters (default: 7)
         random_seed: Random seed for reproducibility
+        algorithm: 'full' (KMeans on the stacked matrix) or 'minibatch'
+            (MiniBatchKMeans fed chunk by chunk, never stacking all vectors)
+            (default: 'full')
+        batch_size: Rows per mini-batch update (default: 4096)
+        max_epochs: Passes over the vectors in minibatch mode (default: 5)
+        tol: Stop minibatch epochs once no centroid moves further than this
+            (default: 1e-4)
+        centroids_path: .npy file with the previous build's centroids; used
+            as the initial centroids when the shape matches (so cluster i
+            stays galaxy_cluster_i between builds), then overwritten
+        quantization: None, 'int8' or 'float16' - read rows from a compact
+            copy of the vectors instead of stacking them, fit on a
+            dequantized sample and assign every word in dequantized chunks;
+            metadata['vector'] itself stays float32 (default: None)
+        fit_sample_size: Vectors used to fit centroids when quantized with the
+            'full' algorithm (default: 50000)
     """
 
     def __init__(self, config: Dict = None):
         super().__init__(config)
         self.num_galaxies = self.config.get('num_galaxies', 7)
         self.random_seed = self.config.get('random_seed', 42)
+        self.algorithm = self.config.get('algorithm', 'full')
+        self.batch_size = self.config.get('batch_size', 4096)
+        self.max_epochs = self.config.get('max_epochs', 5)
+        self.tol = self.config.get('tol', 1e-4)
+        self.centroids_path = self.config.get('centroids_path')
+        self.quantization = self.config.get('quantization')
+        self.fit_sample_size = self.config.get('fit_sample_size', 50000)
+
+        if self.algorithm not in ('full', 'minibatch'):
+            raise ValueError(f"Unknown clustering algorithm: {self.algorithm}")
 
     def process(self, words: List[WordInfo]) -> List[WordInfo]:
         """
@@ -146,9 +193,6 @@ class VectorClusteringProcessor(Processor):
         logger.info(f"K-means clustering into {self.num_galaxies} galaxies...")
 
         # Extract vectors
-        import numpy as np
-        from sklearn.cluster import KMeans
-
         vectors = []
         valid_words = []
 
@@ -164,31 +208,43 @@ class VectorClusteringProcessor(Processor):
                 word.galaxy_id = f"galaxy_cluster_{i % self.num_galaxies}"
             return words
 
-        vectors_np = np.stack(vectors)
+        # Rows are read chunk by chunk from the word vectors or a quantized copy
+        if self.quantization:
+            quantized = QuantizedVectors.from_rows(vectors, dtype=self.quantization)
+            logger.info(f"Quantized {len(quantized)} vectors to {self.quantization} "
+                        f"({quantized.nbytes / 1e6:.1f} MB)")
+            read_rows = quantized.dequantize
+        else:
+            def read_rows(start, end):
+                return np.asarray(vectors[start:end], dtype=np.float32)
+
+        init = self._load_centroids(len(vectors[0]))
+        if self.algorithm == 'minibatch':
+            centroids = self._fit_minibatch(read_rows, len(vectors), init)
+            labels = _assign_chunks(read_rows, len(vectors), centroids)
+        elif self.quantization:
+            centroids = self._fit_sample(quantized, init)
+            labels = _assign_chunks(read_rows, len(vectors), centroids)
+        else:
+            from sklearn.cluster import KMeans
 
-        # K-means clustering
-        kmeans = KMeans(n_clusters=self.num_galaxies, random_state=self.random_seed)
-        labels = kmeans.fit_predict(vectors_np)
+            vectors_np = np.stack(vectors)
+
+            # K-means clustering
+            if init is not None:
+                kmeans = KMeans(n_clusters=self.num_galaxies, init=init, n_init=1,
+                                random_state=self.random_seed)
+            else:
+                kmeans = KMeans(n_clusters=self.num_galaxies, random_state=self.random_seed)
+            labels = kmeans.fit_predict(vectors_np)
+            centroids = kmeans.cluster_centers_.astype(np.float32)
+
+        self._save_centroids(centroids)
 
         # Create galaxy configs
-        galaxies = []
-        radius = 4000
-
-        for i in range(self.num_galaxies):
-            phi = math.acos(-1 + 2 * i / self.num_galaxies)
-            theta = math.sqrt(self.num_galaxies * math.pi) * phi
-
-            galaxy = GalaxyConfig(
-                id=f"galaxy_cluster_{i}",
-                name=f"Cluster {i+1}",
-                color=f"hsl({(i * 137.5) % 360}, 70%, 60%)",
-                center={
-                    "x": radius * math.sin(phi) * math.cos(theta),
-                    "y": radius * math.sin(phi) * math.sin(theta),
-                    "z": radius * math.cos(phi)
-                }
-            )
-            galaxies.append(galaxy)
+        galaxies = make_galaxies(
+            [f"galaxy_cluster_{i}" for i in range(self.num_galaxies)],
+            [f"Cluster {i+1}" for i in range(self.num_galaxies)])
 
         # Store galaxies
         if words:
@@ -198,11 +254,315 @@ class VectorClusteringProcessor(Processor):
         for word, label in zip(valid_words, labels):
             word.galaxy_id = f"galaxy_cluster_{label}"
 
-        # Assign remaining words randomly
+        # Assign remaining words by a stable hash of the word
         word_ids = {w.id for w in valid_words}
         for word in words:
             if word.id not in word_ids:
-                word.galaxy_id = f"galaxy_cluster_{hash(word.word) % self.num_galaxies}"
+                word.galaxy_id = f"galaxy_cluster_{stable_bucket(word.word, self.num_galaxies)}"
 
         logger.info(f"Clustered {len(valid_words)} words")
         return words
+
+    def _load_centroids(self, dim: int) -> Optional[np.ndarray]:
+        """Previous build's centroids, if saved with a matching shape."""
+        if not self.centroids_path or not Path(self.centroids_path).exists():
+            return None
+        centroids = np.load(self.centroids_path)
+        if centroids.shape != (self.num_galaxies, dim):
+            logger.warning(f"Ignoring saved centroids with shape {centroids.shape}")
+            return None
+        logger.info(f"Warm-starting from centroids in {self.centroids_path}")
+        return centroids.astype(np.float32)
+
+    def _save_centroids(self, centroids: np.ndarray) -> None:
+        if self.centroids_path:
+            Path(self.centroids_path).parent.mkdir(parents=True, exist_ok=True)
+            np.save(self.centroids_path, centroids)
+
+    def _fit_minibatch(self, read_rows, num_rows: int, init: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Fit centroids with MiniBatchKMeans.partial_fit, one batch at a time.
+
+        Each epoch visits the batches in a shuffled order; epochs stop early
+        once the centroids move less than `tol`.
+        """
+        from sklearn.cluster import MiniBatchKMeans
+
+        batch_size = max(self.batch_size, self.num_galaxies)
+        kmeans = MiniBatchKMeans(
+            n_clusters=self.num_galaxies,
+            init=init if init is not None else 'k-means++',
+            n_init=1 if init is not None else 3,
+            batch_size=batch_size,
+            random_state=self.random_seed
+        )
+
+        rng = np.random.default_rng(self.random_seed)
+        starts = np.arange(0, num_rows, batch_size)
+        previous = None
+        for epoch in range(self.max_epochs):
+            for start in rng.permutation(starts):
+                batch = read_rows(start, start + batch_size)
+                if len(batch) < self.num_galaxies and not hasattr(kmeans, 'cluster_centers_'):
+                    continue  # the first partial_fit needs one row per cluster
+                kmeans.partial_fit(batch)
+
+            centroids = kmeans.cluster_centers_.astype(np.float32)
+            if previous is not None:
+                shift = np.abs(centroids - previous).max()
+                if shift < self.tol:
+                    logger.info(f"Mini-batch k-means converged after {epoch + 1} epochs")
+                    break
+            previous = centroids
+
+        return kmeans.cluster_centers_.astype(np.float32)
+
+    def _fit_sample(self, quantized: QuantizedVectors, init: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Fit centroids with full KMeans on a dequantized sample of the vectors.
+        """
+        from sklearn.cluster import KMeans
+
+        rng = np.random.default_rng(self.random_seed)
+        sample_size = min(len(quantized), self.fit_sample_size)
+        sample = np.sort(rng.choice(len(quantized), sample_size, replace=False))
+
+        if init is not None:
+            kmeans = KMeans(n_clusters=self.num_galaxies, init=init, n_init=1,
+                            random_state=self.random_seed)
+        else:
+            kmeans = KMeans(n_clusters=self.num_galaxies, random_state=self.random_seed)
+        kmeans.fit(quantized.take(sample))
+        return kmeans.cluster_centers_.astype(np.float32)
+
+
+class CommunityClusteringProcessor(Processor):
+    """
+    Assigns words to galaxies by community detection on the relation graph.
+
+    Strategy:
+    1. Weighted label propagation on the undirected word graph: every word
+       repeatedly adopts the label with the largest total relation strength
+       among its neighbors. Each round updates a seeded random half of the
+       words, which avoids the label oscillation of fully synchronous updates.
+    2. The largest communities become galaxies, each named after its
+       best-connected word
+    3. Words in smaller communities join the galaxy they have the strongest
+       ties to; isolated words fall back to a stable hash bucket
+
+    All steps run on the shared RelationGraph's integer edge arrays.
+
+    Config:
+        num_galaxies: Maximum number of galaxies (default: 7)
+        max_iter: Maximum propagation rounds (default: 30)
+        tol: Stop when fewer than this fraction of labels change (default: 0.001)
+        random_seed: Random seed for the update order (default: 42)
+    """
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.num_galaxies = self.config.get('num_galaxies', 7)
+        self.max_iter = self.config.get('max_iter', 30)
+        self.tol = self.config.get('tol', 0.001)
+        self.random_seed = self.config.get('random_seed', 42)
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Assign words to community galaxies.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words with galaxy_id assigned
+        """
+        logger.info(f"Detecting communities among {len(words)} words...")
+        if not words:
+            return words
+
+        num_words = len(words)
+        src, dst, weights = self.get_graph(words).edges(internal_only=True)
+
+        # Undirected, self-loops dropped
+        keep = src != dst
+        src, dst = np.concatenate([src[keep], dst[keep]]), np.concatenate([dst[keep], src[keep]])
+        weights = np.tile(weights[keep].astype(np.float64), 2)
+
+        labels = label_propagation(num_words, src, dst, weights,
+                                   self.max_iter, self.tol, self.random_seed)
+
+        # Largest communities (ignoring singletons) become galaxies
+        sizes = np.bincount(labels, minlength=num_words)
+        ranked = np.argsort(-sizes, kind='stable')
+        top = ranked[sizes[ranked] > 1][:self.num_galaxies]
+        logger.info(f"Found {int((sizes > 1).sum())} communities, "
+                    f"keeping {len(top)} as galaxies")
+
+        if len(top) == 0:
+            logger.warning("No communities found, assigning galaxies by word hash")
+            galaxies = make_galaxies(
+                [f"galaxy_community_{i}" for i in range(self.num_galaxies)],
+                [f"Community {i+1}" for i in range(self.num_galaxies)])
+            words[0].metadata['_galaxies'] = galaxies
+            for word in words:
+                word.galaxy_id = galaxies[stable_bucket(word.word, len(galaxies))].id
+            return words
+
+        galaxy_of_label = np.full(num_words, -1, dtype=np.int64)
+        galaxy_of_label[top] = np.arange(len(top))
+        assigned = galaxy_of_label[labels]
+
+        # Name each galaxy after its most strongly connected word
+        strength = np.bincount(src, weights=weights, minlength=num_words)
+        names = []
+        for g in range(len(top)):
+            members = np.flatnonzero(assigned == g)
+            names.append(words[members[np.argmax(strength[members])]].word.capitalize())
+
+        galaxies = make_galaxies(
+            [f"galaxy_{name.lower().replace(' ', '_')}" for name in names], names)
+        words[0].metadata['_galaxies'] = galaxies
+
+        # Words outside the kept communities: strongest tie to a galaxy
+        edge_galaxy = assigned[dst]
+        loose = (assigned[src] < 0) & (edge_galaxy >= 0)
+        if loose.any():
+            pairs = src[loose] * len(top) + edge_galaxy[loose]
+            unique_pairs, inverse = np.unique(pairs, return_inverse=True)
+            pair_weight = np.bincount(inverse, weights=weights[loose])
+            pair_word = unique_pairs // len(top)
+            order = np.lexsort((-pair_weight, pair_word))
+            first = np.r_[True, pair_word[order][1:] != pair_word[order][:-1]]
+            best = order[first]
+            assigned[pair_word[best]] = unique_pairs[best] % len(top)
+
+        for word, galaxy_index in zip(words, assigned.tolist()):
+            if galaxy_index < 0:
+                galaxy_index = stable_bucket(word.word, len(galaxies))
+            word.galaxy_id = galaxies[galaxy_index].id
+
+        galaxy_dist = Counter(w.galaxy_id for w in words)
+        logger.info(f"Galaxy distribution: {dict(galaxy_dist)}")
+
+        return words
+
+
+def label_propagation(
+    num_nodes: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    max_iter: int = 30,
+    tol: float = 0.001,
+    random_seed: int = 42
+) -> np.ndarray:
+    """
+    Weighted label propagation over (symmetric) edge arrays.
+
+    Args:
+        num_nodes: Number of nodes
+        src: (E,) edge sources
+        dst: (E,) edge targets
+        weights: (E,) edge weights
+        max_iter: Maximum rounds
+        tol: Stop when fewer than this fraction of nodes change label
+        random_seed: Seed for choosing which half of the nodes update per round
+
+    Returns:
+        (num_nodes,) community label per node (the id of a member node)
+    """
+    labels = np.arange(num_nodes, dtype=np.int64)
+    if len(src) == 0:
+        return labels
+
+    rng = np.random.default_rng(random_seed)
+    has_edges = np.bincount(src, minlength=num_nodes) > 0
+
+    for iteration in range(max_iter):
+        # Only the nodes updating this round need their neighbor labels scored
+        update = (rng.random(num_nodes) < 0.5) & has_edges
+        active = update[src]
+        nodes = src[active]
+
+        # Total weight per (node, neighbor label): sort the combined keys once,
+        # then sum each run of equal keys
+        keys = nodes * num_nodes + labels[dst[active]]
+        order = np.argsort(keys)
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        pair_weight = np.add.reduceat(weights[active][order], starts)
+        pair_node = keys[starts] // num_nodes
+        pair_label = keys[starts] % num_nodes
+
+        # Best label per node: highest weight, ties to the smaller label
+        # (pairs are sorted by node, then label)
+        node_starts = np.flatnonzero(np.r_[True, pair_node[1:] != pair_node[:-1]])
+        node_best = np.maximum.reduceat(pair_weight, node_starts)
+        is_best = pair_weight >= np.repeat(node_best, np.diff(np.r_[node_starts, len(pair_node)]))
+        best = np.flatnonzero(is_best)
+        best = best[np.r_[True, pair_node[best][1:] != pair_node[best][:-1]]]
+
+        proposed = labels.copy()
+        proposed[pair_node[best]] = pair_label[best]
+
+        changed = update & (proposed != labels)
+        labels[changed] = proposed[changed]
+
+        if changed.sum() < tol * num_nodes:
+            logger.info(f"Label propagation converged after {iteration + 1} rounds")
+            break
+
+    return labels
+
+
+def make_galaxies(ids: List[str], names: List[str], radius: float = 4000) -> List[GalaxyConfig]:
+    """
+    Galaxy configs spread over a Fibonacci sphere (radius matches the
+    frontend scale), with golden-angle hue steps between neighbors.
+
+    Args:
+        ids: Galaxy ids
+        names: Display names (same order)
+        radius: Sphere radius
+
+    Returns:
+        List of GalaxyConfig
+    """
+    galaxies = []
+    count = len(ids)
+
+    for i, (galaxy_id, name) in enumerate(zip(ids, names)):
+        phi = math.acos(-1 + 2 * i / count)
+        theta = math.sqrt(count * math.pi) * phi
+
+        galaxies.append(GalaxyConfig(
+            id=galaxy_id,
+            name=name,
+            color=f"hsl({(i * 137.5) % 360}, 70%, 60%)",
+            center={
+                "x": radius * math.sin(phi) * math.cos(theta),
+                "y": radius * math.sin(phi) * math.sin(theta),
+                "z": radius * math.cos(phi)
+            }
+        ))
+
+    return galaxies
+
+
+def _assign_chunks(read_rows, num_rows: int, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+    """Nearest centroid for every row, one chunk of rows at a time."""
+    centroid_norms = (centroids ** 2).sum(axis=1)
+    labels = np.empty(num_rows, dtype=np.int64)
+    for start in range(0, num_rows, chunk_size):
+        block = read_rows(start, start + chunk_size)
+        # argmin ||x - c||^2 == argmin (||c||^2 - 2 x.c)
+        labels[start:start + len(block)] = np.argmin(centroid_norms - 2 * block @ centroids.T, axis=1)
+    return labels
+
+
+def stable_bucket(text: str, buckets: int) -> int:
+    """
+    Deterministic bucket for a string (unlike hash(), which changes with
+    PYTHONHASHSEED between processes).
+    """
+    return zlib.crc32(text.encode('utf-8')) % buckets
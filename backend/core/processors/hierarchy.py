@@ -1,12 +1,13 @@
 """
 Hierarchy processor - assigns hierarchy levels based on relations.
 """
-from typing import List, Dict, Set
-from collections import defaultdict, deque
+from typing import List, Dict
 import logging
+import numpy as np
 
 from .base import Processor
 from ..models import WordInfo, RelationType
+from ..ancestry import AncestryIndex
 
 
 logger = logging.getLogger(__name__)
@@ -17,13 +18,34 @@ class HierarchyProcessor(Processor):
     Assigns hierarchy levels to words based on hypernym/hyponym relations.
 
     Strategy:
-    1. Build a graph from hypernym relations
+    1. Build parent -> child CSR arrays from hypernym/hyponym edges
     2. Find root nodes (no parents)
-    3. Assign levels via BFS from roots
+    3. Assign levels by BFS from roots, one whole frontier per step
     4. Words with more parents/broader concepts = lower level (0-2)
     5. Words with fewer parents/specific = higher level (3-6)
+
+    Hypernym cycles that no root reaches (a -> b -> a) would otherwise be
+    left unleveled. Their members that only feed the cycle are peeled off,
+    the cycle nodes with the fewest parents are treated as extra roots, and
+    a warning reports how many words were affected.
+
+    After process(), `depths` holds the uncapped BFS depth per word (root = 1)
+    and `ancestry` an AncestryIndex over all parent -> child edges except
+    the ones that close a cycle. The index is also exported as the
+    universe's "ancestry" block.
+
+    Config:
+        ancestry: Build and export the ancestry index (default: True)
     """
 
+    MAX_LEVEL = 6
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.build_ancestry = self.config.get('ancestry', True)
+        self.depths = None
+        self.ancestry = None
+
     def process(self, words: List[WordInfo]) -> List[WordInfo]:
         """
         Assign hierarchy levels based on relation graph.
@@ -36,74 +58,111 @@ class HierarchyProcessor(Processor):
         """
         logger.info(f"Processing hierarchy for {len(words)} words...")
 
-        # Build word lookup
-        word_dict = {w.id: w for w in words}
-        word_by_name = {w.word: w for w in words}
-
-        # Build parent-child graph
-        children = defaultdict(set)  # parent -> children
-        parents = defaultdict(set)   # child -> parents
-
-        for word in words:
-            for rel in word.relations:
-                if rel.type == RelationType.HYPERNYM:
-                    # word -> rel.target (word is child of target)
-                    if rel.target_id in word_dict:
-                        parents[word.id].add(rel.target_id)
-                        children[rel.target_id].add(word.id)
-                elif rel.type == RelationType.HYPONYM:
-                    # word -> rel.target (word is parent of target)
-                    if rel.target_id in word_dict:
-                        children[word.id].add(rel.target_id)
-                        parents[rel.target_id].add(word.id)
-
-        # Find roots (words with no parents or very few)
-        roots = set()
-        for word in words:
-            if len(parents[word.id]) == 0:
-                roots.add(word.id)
+        graph = self.get_graph(words)
+        num_words = graph.n_words
 
-        logger.info(f"Found {len(roots)} root nodes")
+        # Parent -> child edges between words in the universe
+        child_up, parent_up, _ = graph.edges(RelationType.HYPERNYM, internal_only=True)
+        parent_down, child_down, _ = graph.edges(RelationType.HYPONYM, internal_only=True)
+        parent_ids = np.concatenate([parent_up, parent_down])
+        child_ids = np.concatenate([child_up, child_down])
 
-        # BFS from roots to assign levels
-        levels = {}
-        queue = deque()
+        order = np.argsort(parent_ids, kind='stable')
+        children = child_ids[order]
+        children_ptr = np.zeros(num_words + 1, dtype=np.int64)
+        np.cumsum(np.bincount(parent_ids, minlength=num_words), out=children_ptr[1:])
 
-        # Initialize roots at level 1
-        for root_id in roots:
-            levels[root_id] = 1
-            queue.append((root_id, 1))
+        # Find roots (words with no parents)
+        has_parent = np.bincount(child_ids, minlength=num_words) > 0
+        roots = np.flatnonzero(~has_parent)
+
+        logger.info(f"Found {len(roots)} root nodes")
 
-        # BFS
-        visited = set()
-        while queue:
-            node_id, level = queue.popleft()
-            if node_id in visited:
-                continue
-            visited.add(node_id)
+        depths = np.zeros(num_words, dtype=np.int64)  # 0 = not reached
+        _bfs(roots, depths, children_ptr, children)
 
-            # Assign level (cap at 6)
-            levels[node_id] = min(level, 6)
+        # Cycles unreachable from any root
+        unreached = depths == 0
+        if unreached.any():
+            num_cyclic = int(unreached.sum())
+            while unreached.any():
+                seeds = _cycle_seeds(unreached, parent_ids, child_ids)
+                _bfs(seeds, depths, children_ptr, children)
+                unreached = depths == 0
+            logger.warning(f"{num_cyclic} words sit in or below hypernym cycles without a root; "
+                           f"cycle members with the fewest parents were used as roots")
 
-            # Process children
-            for child_id in children[node_id]:
-                if child_id not in visited:
-                    # Child is one level deeper
-                    queue.append((child_id, level + 1))
+        self.depths = depths
+        levels = np.minimum(depths, self.MAX_LEVEL)
 
         # Apply levels to words
-        for word in words:
-            if word.id in levels:
-                word.hierarchy_level = levels[word.id]
-            else:
-                # Orphan words default to level 4
-                word.hierarchy_level = 4
+        for word, level in zip(words, levels.tolist()):
+            word.hierarchy_level = level
+
+        if self.build_ancestry and words:
+            self.ancestry = AncestryIndex.build([w.id for w in words], parent_ids, child_ids)
+            words[0].metadata.setdefault('_extensions', {})['ancestry'] = self.ancestry
 
         # Log distribution
-        level_dist = defaultdict(int)
-        for word in words:
-            level_dist[word.hierarchy_level] += 1
+        counts = np.bincount(levels, minlength=self.MAX_LEVEL + 1)
+        level_dist = {level: int(count) for level, count in enumerate(counts) if count}
 
-        logger.info(f"Hierarchy levels assigned: {dict(level_dist)}")
+        logger.info(f"Hierarchy levels assigned: {level_dist}")
 
         return words
+
+
+def _bfs(seeds: np.ndarray, depths: np.ndarray, indptr: np.ndarray, indices: np.ndarray) -> None:
+    """
+    Frontier-at-a-time BFS: seeds get depth 1, every unvisited child of the
+    frontier gets the next depth. Updates depths in place (0 = unvisited).
+    """
+    frontier = seeds[depths[seeds] == 0]
+    depth = 1
+    while frontier.size:
+        depths[frontier] = depth
+        depth += 1
+
+        # Gather all children of the frontier in one go
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        candidates = indices[offsets]
+        candidates = candidates[depths[candidates] == 0]
+
+        # Dedupe without sorting: each position writes a negative tag, the
+        # position whose tag survives keeps the node (the next loop pass
+        # overwrites the tags with the real depth)
+        tags = -np.arange(1, len(candidates) + 1)
+        depths[candidates] = tags
+        frontier = candidates[depths[candidates] == tags]
+
+
+def _cycle_seeds(unreached: np.ndarray, parent_ids: np.ndarray, child_ids: np.ndarray) -> np.ndarray:
+    """
+    Pick roots for the unreached part of the hierarchy.
+
+    Every unreached word has an unreached parent, so the set hangs off one
+    or more cycles. Words with no unreached children are peeled repeatedly
+    until only cycles (and paths between them) remain; of those, the ones
+    with the fewest parents become seeds.
+    """
+    inside = unreached[parent_ids] & unreached[child_ids]
+    parents, kids = parent_ids[inside], child_ids[inside]
+
+    core = unreached.copy()
+    while True:
+        live = core[parents] & core[kids]
+        out_degree = np.bincount(parents[live], minlength=len(core))
+        leaves = core & (out_degree == 0)
+        if not leaves.any():
+            break
+        core &= ~leaves
+
+    live = core[parents] & core[kids]
+    in_degree = np.bincount(kids[live], minlength=len(core))
+    candidates = np.flatnonzero(core)
+    return candidates[in_degree[candidates] == in_degree[candidates].min()]
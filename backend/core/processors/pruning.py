@@ -0,0 +1,116 @@
+"""
+Graph pruning processor - trims relations before export.
+"""
+from typing import List, Dict, Union
+import logging
+import numpy as np
+
+from .base import Processor
+from ..models import WordInfo, RelationType
+from ..graph import RelationGraph, TYPE_CODES
+
+
+logger = logging.getLogger(__name__)
+
+
+class GraphPruningProcessor(Processor):
+    """
+    Removes relations the frontend would parse and then discard.
+
+    Steps (all as masks over the graph's edge arrays):
+    1. Drop relations whose target is not in the universe
+       (e.g. WordNet/LLM targets like "word_ice cream")
+    2. Collapse reciprocal pairs: if A has hypernym B and B has hyponym A,
+       only A -> B (hypernym) is kept
+    3. Cap each word's out-degree per relation type, keeping the strongest
+
+    Run it after every processor that adds relations, before export steps
+    such as GalaxySummaryProcessor that summarize the relations.
+
+    Config:
+        drop_external: Drop relations to targets outside the universe (default: True)
+        collapse_reciprocal: Collapse hypernym/hyponym pairs (default: True)
+        max_degree: Per-word cap, either one int for every type or a dict
+            of type name -> cap, e.g. {'related': 5, 'synonym': 8}
+            (default: None, no cap)
+    """
+
+    modifies_relations = True
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.drop_external = self.config.get('drop_external', True)
+        self.collapse_reciprocal = self.config.get('collapse_reciprocal', True)
+        self.max_degree: Union[int, Dict[str, int], None] = self.config.get('max_degree')
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Prune relations in place.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words with pruned relations
+        """
+        graph = self.get_graph(words)
+        keep = np.ones(graph.num_edges, dtype=bool)
+        dropped = {}
+
+        if self.drop_external:
+            internal = graph.dst < graph.n_words
+            dropped['external'] = int((keep & ~internal).sum())
+            keep &= internal
+
+        if self.collapse_reciprocal:
+            reciprocal = self._reciprocal_hyponyms(graph) & keep
+            dropped['reciprocal'] = int(reciprocal.sum())
+            keep &= ~reciprocal
+
+        if self.max_degree:
+            over = self._over_degree_cap(graph, keep)
+            dropped['degree_cap'] = int(over.sum())
+            keep &= ~over
+
+        removed = graph.filter_relations(words, keep)
+
+        logger.info(f"Pruned {removed} of {graph.num_edges} relations: {dropped}")
+        return words
+
+    def _reciprocal_hyponyms(self, graph: RelationGraph) -> np.ndarray:
+        """Mask of hyponym edges B -> A that duplicate a hypernym edge A -> B."""
+        num_nodes = graph.num_nodes
+        hyper = graph.type_mask(RelationType.HYPERNYM)
+        hypo = graph.type_mask(RelationType.HYPONYM)
+
+        hyper_keys = graph.src[hyper] * num_nodes + graph.dst[hyper]
+        hypo_keys = graph.dst[hypo] * num_nodes + graph.src[hypo]  # reversed
+
+        mask = np.zeros(graph.num_edges, dtype=bool)
+        mask[np.flatnonzero(hypo)[np.isin(hypo_keys, hyper_keys)]] = True
+        return mask
+
+    def _over_degree_cap(self, graph: RelationGraph, keep: np.ndarray) -> np.ndarray:
+        """Mask of kept edges ranked beyond their type's cap for their source."""
+        if isinstance(self.max_degree, dict):
+            caps = {TYPE_CODES[RelationType(name)]: cap for name, cap in self.max_degree.items()}
+        else:
+            caps = {code: self.max_degree for code in TYPE_CODES.values()}
+
+        cap_of_type = np.full(len(TYPE_CODES), np.iinfo(np.int64).max, dtype=np.int64)
+        for code, cap in caps.items():
+            cap_of_type[code] = cap
+
+        edges = np.flatnonzero(keep)
+        src, types = graph.src[edges], graph.types[edges]
+
+        # Strongest first within each (source, type) group; ties keep source order
+        order = np.lexsort((edges, -graph.weights[edges], types, src))
+        group = src[order] * len(TYPE_CODES) + types[order]
+        starts = np.r_[True, group[1:] != group[:-1]]
+        group_start = np.maximum.accumulate(np.where(starts, np.arange(len(order)), 0))
+        rank = np.arange(len(order)) - group_start
+
+        over = np.zeros(graph.num_edges, dtype=bool)
+        over[edges[order[rank >= cap_of_type[types[order]]]]] = True
+        return over
@@ -2,8 +2,8 @@
 Ranking processor - assigns frequency and importance scores.
 """
 from typing import List, Dict
-from collections import Counter
 import logging
+import numpy as np
 
 from .base import Processor
 from ..models import WordInfo
@@ -12,22 +12,30 @@ from ..models import WordInfo
 logger = logging.getLogger(__name__)
 
 
+# Frequency range used by the frontend's celestial size/type mapping
+MIN_FREQUENCY = 800
+MAX_FREQUENCY = 12000
+
+
 class FrequencyRankingProcessor(Processor):
     """
     Assigns frequency scores based on:
     1. Number of incoming relations (in-degree)
     2. Hierarchy level (higher = more specific = lower frequency)
-    3. Manual frequency data if available
+    3. Corpus counts (metadata['corpus_frequency'], e.g. from FrequencySource)
+       if available - log-scaled into the same range, replacing 1 and 2
 
     Config:
         base_frequency: Base frequency for all words (default: 1000)
         level_multiplier: Multiplier per hierarchy level (default: 500)
+        use_corpus: Prefer corpus counts when present (default: True)
     """
 
     def __init__(self, config: Dict = None):
         super().__init__(config)
         self.base_frequency = self.config.get('base_frequency', 1000)
         self.level_multiplier = self.config.get('level_multiplier', 500)
+        self.use_corpus = self.config.get('use_corpus', True)
 
     def process(self, words: List[WordInfo]) -> List[WordInfo]:
         """
@@ -40,40 +48,141 @@ class FrequencyRankingProcessor(Processor):
             Words with updated frequency values
         """
         logger.info(f"Computing frequency scores for {len(words)} words...")
+        if not words:
+            return words
+
+        # Count in-degrees (how many relations point to each word)
+        in_degree = self.get_graph(words).in_degree()[:len(words)]
+        levels = np.fromiter((w.hierarchy_level for w in words), dtype=np.int64, count=len(words))
+
+        # Boost based on in-degree (more connections = more common), then
+        # adjust by hierarchy level: lower levels (0-2) = more abstract/common
+        freq = self.base_frequency + in_degree * 50 + (6 - levels) * self.level_multiplier
+
+        if self.use_corpus:
+            corpus = np.fromiter((w.metadata.get('corpus_frequency', 0) for w in words),
+                                 dtype=np.float64, count=len(words))
+            has_count = corpus > 0
+            if has_count.any():
+                logs = np.log10(corpus[has_count])
+                span = logs.max() - logs.min()
+                scaled = (logs - logs.min()) / span if span > 0 else np.ones_like(logs)
+                freq[has_count] = MIN_FREQUENCY + scaled * (MAX_FREQUENCY - MIN_FREQUENCY)
+                logger.info(f"Using corpus counts for {int(has_count.sum())} words")
+
+        # Cap at reasonable ranges
+        freq = np.clip(freq, MIN_FREQUENCY, MAX_FREQUENCY).astype(np.int64)
+        for word, value in zip(words, freq.tolist()):
+            word.frequency = value
+
+        # Log distribution (low < 3000 <= medium < 7000 <= high <= 9000 < very_high)
+        buckets = np.bincount(np.digitize(freq, [3000, 7000, 9001]), minlength=4)
+        freq_ranges = {
+            'very_high': int(buckets[3]),
+            'high': int(buckets[2]),
+            'medium': int(buckets[1]),
+            'low': int(buckets[0])
+        }
+        logger.info(f"Frequency distribution: {freq_ranges}")
 
-        # Count in-degrees (how many words point to each word)
-        in_degree = Counter()
+        return words
 
-        for word in words:
-            for rel in word.relations:
-                target_id = rel.target_id
-                in_degree[target_id] += 1
 
-        # Assign frequencies
-        for word in words:
-            # Base frequency
-            freq = self.base_frequency
+class CentralityRankingProcessor(Processor):
+    """
+    Assigns frequency scores from weighted PageRank over the relation graph.
 
-            # Boost based on in-degree (more connections = more common)
-            degree_boost = in_degree[word.id] * 50
-            freq += degree_boost
+    Each relation is a vote from the word to its target, weighted by
+    VocabRelation.strength. Scores come from sparse power iteration over the
+    graph's edge arrays (one weighted bincount per step), then are
+    log-scaled into the frequency range, so hub words become large stars.
 
-            # Adjust based on hierarchy level
-            # Lower levels (0-2) = more abstract/common = higher frequency
-            # Higher levels (3-6) = more specific = lower frequency
-            level_adjustment = (6 - word.hierarchy_level) * self.level_multiplier
-            freq += level_adjustment
+    Config:
+        damping: PageRank damping factor (default: 0.85)
+        max_iter: Maximum power iterations (default: 100)
+        tol: L1 convergence tolerance (default: 1e-6)
+    """
 
-            # Cap at reasonable ranges
-            word.frequency = max(800, min(12000, freq))
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.damping = self.config.get('damping', 0.85)
+        self.max_iter = self.config.get('max_iter', 100)
+        self.tol = self.config.get('tol', 1e-6)
 
-        # Log distribution
-        freq_ranges = {
-            'very_high': sum(1 for w in words if w.frequency > 9000),
-            'high': sum(1 for w in words if 7000 <= w.frequency <= 9000),
-            'medium': sum(1 for w in words if 3000 <= w.frequency < 7000),
-            'low': sum(1 for w in words if w.frequency < 3000)
-        }
-        logger.info(f"Frequency distribution: {freq_ranges}")
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Assign frequency scores to words by centrality.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words with updated frequency values and metadata['centrality']
+        """
+        logger.info(f"Computing centrality for {len(words)} words...")
+        if not words:
+            return words
+
+        src, dst, weights = self.get_graph(words).edges(internal_only=True)
+        scores = pagerank(len(words), src, dst, weights, self.damping, self.max_iter, self.tol)
+
+        # Log-scale into the frequency range (PageRank is heavy-tailed)
+        logs = np.log(scores)
+        span = logs.max() - logs.min()
+        scaled = (logs - logs.min()) / span if span > 0 else np.full(len(words), 0.5)
+        freq = (MIN_FREQUENCY + scaled * (MAX_FREQUENCY - MIN_FREQUENCY)).astype(np.int64)
+
+        for word, value, score in zip(words, freq.tolist(), scores.tolist()):
+            word.frequency = value
+            word.metadata['centrality'] = score
+
+        top = np.argsort(-scores, kind='stable')[:5]
+        logger.info(f"Most central words: {[words[i].word for i in top]}")
 
         return words
+
+
+def pagerank(
+    num_nodes: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    damping: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-6
+) -> np.ndarray:
+    """
+    Weighted PageRank by power iteration over edge arrays.
+
+    Args:
+        num_nodes: Number of nodes
+        src: (E,) edge sources
+        dst: (E,) edge targets
+        weights: (E,) non-negative edge weights
+        damping: Probability of following an edge instead of teleporting
+        max_iter: Maximum iterations
+        tol: Stop when the L1 change of the score vector drops below this
+
+    Returns:
+        (num_nodes,) scores summing to 1
+    """
+    weights = np.maximum(np.asarray(weights, dtype=np.float64), 0.0)
+    out_weight = np.bincount(src, weights=weights, minlength=num_nodes)
+
+    # Per-edge transition probability; nodes without out-edges are dangling
+    edge_prob = weights / np.where(out_weight[src] > 0, out_weight[src], 1.0)
+    dangling = out_weight == 0
+
+    scores = np.full(num_nodes, 1.0 / num_nodes)
+    for iteration in range(max_iter):
+        flow = np.bincount(dst, weights=edge_prob * scores[src], minlength=num_nodes)
+        new_scores = (1.0 - damping) / num_nodes + damping * (flow + scores[dangling].sum() / num_nodes)
+        delta = np.abs(new_scores - scores).sum()
+        scores = new_scores
+        if delta < tol:
+            logger.info(f"PageRank converged after {iteration + 1} iterations")
+            break
+    else:
+        logger.warning(f"PageRank did not converge in {max_iter} iterations (delta {delta:.2e})")
+
+    return scores
@@ -0,0 +1,130 @@
+"""
+Dimensionality reduction processor - projects word vectors to fewer dimensions.
+"""
+from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+import logging
+import numpy as np
+
+from .base import Processor
+from ..models import WordInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+class DimensionalityReductionProcessor(Processor):
+    """
+    Replaces metadata['vector'] with a lower-dimensional PCA projection.
+
+    Run it before SemanticProcessor and VectorClusteringProcessor: their
+    matrix products scale with the vector dimension, so 300d -> 64d makes
+    them roughly 5x cheaper.
+
+    The projection (mean + components) is fit with randomized PCA on a
+    sample of the vectors. With `projection_path` it is saved and reused by
+    later builds, so incremental builds (e.g. SemanticProcessor's kNN state)
+    keep comparing vectors in the same space.
+
+    The projection subtracts the mean vector, so cosine similarities of
+    reduced vectors are not on the same scale as the raw ones (they are
+    usually lower); retune thresholds such as SemanticProcessor's
+    min_similarity after adding this step.
+
+    Config:
+        n_components: Output dimension (default: 64)
+        projection_path: .npz file to load/save the projection
+        fit_sample_size: Vectors used to fit the projection (default: 100000)
+        chunk_size: Vectors projected per step (default: 8192)
+        random_seed: Random seed for sampling and the randomized SVD
+    """
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.n_components = self.config.get('n_components', 64)
+        self.projection_path = self.config.get('projection_path')
+        self.fit_sample_size = self.config.get('fit_sample_size', 100000)
+        self.chunk_size = self.config.get('chunk_size', 8192)
+        self.random_seed = self.config.get('random_seed', 42)
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Project word vectors to n_components dimensions.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words with reduced metadata['vector']
+        """
+        valid_words = [w for w in words if w.metadata.get('vector') is not None]
+        if not valid_words:
+            logger.warning("No word vectors found, skipping dimensionality reduction")
+            return words
+
+        dim = len(valid_words[0].metadata['vector'])
+        if dim <= self.n_components:
+            logger.info(f"Vectors already have {dim} <= {self.n_components} dimensions, skipping")
+            return words
+
+        projection = self._load_projection(dim)
+        if projection is None:
+            projection = self._fit(valid_words)
+            self._save_projection(*projection)
+        mean, components = projection
+
+        logger.info(f"Projecting {len(valid_words)} vectors from {dim}d to {len(components)}d...")
+        reduced = np.empty((len(valid_words), len(components)), dtype=np.float32)
+        for start in range(0, len(valid_words), self.chunk_size):
+            chunk = valid_words[start:start + self.chunk_size]
+            block = np.asarray([w.metadata['vector'] for w in chunk], dtype=np.float32)
+            reduced[start:start + len(chunk)] = (block - mean) @ components.T
+
+        for word, vector in zip(valid_words, reduced):
+            word.metadata['vector'] = vector
+
+        return words
+
+    def _fit(self, valid_words: List[WordInfo]) -> Tuple[np.ndarray, np.ndarray]:
+        """Fit randomized PCA on a sample of the vectors."""
+        from sklearn.decomposition import PCA
+
+        rng = np.random.default_rng(self.random_seed)
+        sample_size = min(len(valid_words), self.fit_sample_size)
+        sample = np.sort(rng.choice(len(valid_words), sample_size, replace=False))
+        vectors = np.asarray([valid_words[i].metadata['vector'] for i in sample], dtype=np.float32)
+
+        n_components = min(self.n_components, *vectors.shape)
+        if n_components < self.n_components:
+            logger.warning(f"Only {n_components} components can be fit from {sample_size} "
+                           f"{vectors.shape[1]}d vectors (n_components={self.n_components})")
+        pca = PCA(n_components=n_components, svd_solver='randomized', random_state=self.random_seed)
+        pca.fit(vectors)
+        logger.info(f"Fit PCA on {sample_size} vectors: {n_components} components keep "
+                    f"{pca.explained_variance_ratio_.sum():.1%} of the variance")
+
+        return pca.mean_.astype(np.float32), pca.components_.astype(np.float32)
+
+    def _load_projection(self, dim: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Saved projection, if it was fit for this input dimension and
+        n_components (it may hold fewer components when the fit sample was
+        smaller than n_components).
+        """
+        if not self.projection_path or not Path(self.projection_path).exists():
+            return None
+        with np.load(self.projection_path) as data:
+            mean, components = data['mean'], data['components']
+            requested = int(data['n_components']) if 'n_components' in data else len(components)
+        if requested != self.n_components or components.shape[1:] != (dim,):
+            logger.warning(f"Ignoring saved projection with shape {components.shape} "
+                           f"(fit for n_components={requested})")
+            return None
+        logger.info(f"Reusing projection from {self.projection_path}")
+        return mean, components
+
+    def _save_projection(self, mean: np.ndarray, components: np.ndarray) -> None:
+        if self.projection_path:
+            Path(self.projection_path).parent.mkdir(parents=True, exist_ok=True)
+            with Path(self.projection_path).open('wb') as f:
+                np.savez(f, mean=mean, components=components, n_components=self.n_components)
@@ -7,6 +7,16 @@ import numpy as np
 
 from .base import Processor
 from ..models import WordInfo, VocabRelation, RelationType
+from ..similarity import (
+    normalize_rows,
+    blocked_topk,
+    parallel_topk,
+    IVFIndex,
+    QuantizedVectors,
+    quantized_self_topk,
+    KNNState,
+    mask_neighbors,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -21,12 +31,66 @@ class SemanticProcessor(Processor):
     Config:
         max_relations: Max similar words to link per word (default: 3)
         min_similarity: Minimum cosine similarity threshold (default: 0.6)
+        block_size: Rows per similarity block; bounds memory to
+            O(N * max_relations + block_size * N) (default: 1024)
+        engine: 'exact' (blocked exact search) or 'ivf' (approximate
+            inverted-file index for very large vocabularies) (default: 'exact')
+        nprobe: IVF lists scanned per word - the recall/latency knob (default: 8)
+        nlist: IVF list count (default: 4 * sqrt(N))
+        n_jobs: Worker processes for exact search; workers read the vector
+            matrix from shared memory (default: 1, -1 = all cores)
+        quantization: None, 'int8' or 'float16' - search over a compact
+            per-row-scaled copy of the vectors instead of stacking and
+            normalizing them into float32 matrices; the final top-k is
+            rescored exactly from metadata['vector'], which stays float32.
+            This trims the search's own working memory only and is not
+            faster than the exact engine (default: None)
+        rescore_factor: Candidates per word kept for exact rescoring, as a
+            multiple of max_relations (default: 4)
+        state_path: Optional .npz file holding the kNN graph between builds;
+            when set, only words added/removed since the last build are
+            searched and only the lists they affect are updated
+
+    Search modes are exclusive. `quantization` has its own search and
+    cannot be combined with engine='ivf', n_jobs or state_path. n_jobs only
+    applies to the exact engine. With state_path, engine and n_jobs apply
+    to the first (full) build only; later updates are always exact, so
+    engine='ivf' logs a warning. Conflicting settings raise ValueError.
     """
 
+    modifies_relations = True
+
     def __init__(self, config: Dict = None):
         super().__init__(config)
         self.max_relations = self.config.get('max_relations', 3)
         self.min_similarity = self.config.get('min_similarity', 0.6)
+        self.block_size = self.config.get('block_size', 1024)
+        self.engine = self.config.get('engine', 'exact')
+        self.nprobe = self.config.get('nprobe', 8)
+        self.nlist = self.config.get('nlist')
+        self.n_jobs = self.config.get('n_jobs', 1)
+        self.quantization = self.config.get('quantization')
+        self.rescore_factor = self.config.get('rescore_factor', 4)
+        self.state_path = self.config.get('state_path')
+        if self.engine not in ('exact', 'ivf'):
+            raise ValueError(f"Unknown similarity engine: {self.engine}")
+        self._check_search_options()
+
+    def _check_search_options(self):
+        """Reject option combinations where one setting would be ignored."""
+        if self.quantization:
+            conflicts = [name for name, is_set in (
+                ('engine=ivf', self.engine == 'ivf'),
+                ('n_jobs', self.n_jobs != 1),
+                ('state_path', bool(self.state_path)),
+            ) if is_set]
+            if conflicts:
+                raise ValueError(f"quantization cannot be combined with {', '.join(conflicts)}")
+        if self.engine == 'ivf' and self.n_jobs != 1:
+            raise ValueError("n_jobs only applies to the exact engine, not engine=ivf")
+        if self.engine == 'ivf' and self.state_path:
+            logger.warning("state_path with engine=ivf: the first build is approximate, "
+                           "incremental updates are exact")
 
     def process(self, words: List[WordInfo]) -> List[WordInfo]:
         """
@@ -56,46 +120,122 @@ class SemanticProcessor(Processor):
 
         logger.info(f"Computing similarities for {len(valid_words)} words with vectors")
 
-        # Stack vectors for batch computation
-        vectors_np = np.stack(word_vectors)
-
-        # Compute pairwise cosine similarities
-        # Normalize vectors
-        norms = np.linalg.norm(vectors_np, axis=1, keepdims=True)
-        vectors_norm = vectors_np / (norms + 1e-8)
-
-        # Cosine similarity matrix
-        similarity_matrix = np.dot(vectors_norm, vectors_norm.T)
+        # Top-k neighbors per word (excluding self)
+        if self.state_path:
+            neighbors, scores = self._search_incremental(valid_words, word_vectors)
+        elif self.quantization:
+            neighbors, scores = self._search_quantized(word_vectors)
+        else:
+            # Normalize so dot products are cosine similarities
+            vectors_norm = normalize_rows(np.stack(word_vectors))
+            neighbors, scores = self._search(vectors_norm, self.min_similarity)
 
         # Add relations
         added_count = 0
         for i, word in enumerate(valid_words):
-            # Get similarities for this word
-            sims = similarity_matrix[i]
-
-            # Find top similar words (excluding self)
-            # Set self-similarity to -1 to exclude it
-            sims[i] = -1
-
-            # Get top-k indices
-            top_indices = np.argsort(sims)[-self.max_relations:][::-1]
-
-            # Add relations if above threshold
-            for idx in top_indices:
-                sim_value = sims[idx]
-                if sim_value >= self.min_similarity:
-                    target_word = valid_words[idx]
-
-                    # Avoid duplicate relations
-                    existing = any(r.target_id == target_word.id for r in word.relations)
-                    if not existing:
-                        word.relations.append(VocabRelation(
-                            target_id=target_word.id,
-                            type=RelationType.RELATED,
-                            strength=float(sim_value)
-                        ))
-                        added_count += 1
+            for idx, sim_value in zip(neighbors[i], scores[i]):
+                if idx < 0:
+                    break
+                target_word = valid_words[idx]
+
+                # Skip targets already linked by a source relation
+                if not word.has_relation_to(target_word.id):
+                    word.add_relation(VocabRelation(
+                        target_id=target_word.id,
+                        type=RelationType.RELATED,
+                        strength=float(sim_value)
+                    ))
+                    added_count += 1
 
         logger.info(f"Added {added_count} semantic relations")
 
         return words
+
+    def _search_incremental(self, valid_words: List[WordInfo], word_vectors: List[np.ndarray]):
+        """
+        Update the persisted kNN state with this build's words and read
+        neighbor lists from it.
+        """
+        ids = [w.id for w in valid_words]
+        vectors_norm = normalize_rows(np.stack(word_vectors))
+
+        state = KNNState.load(self.state_path)
+        if state is not None and (state.k != self.max_relations
+                                  or state.vectors.shape[1] != vectors_norm.shape[1]):
+            logger.info("kNN state shape changed, rebuilding from scratch")
+            state = None
+
+        if state is not None:
+            current = set(ids)
+            removed = [id_ for id_ in state.ids if id_ not in current]
+            recomputed = state.remove(removed, block_size=self.block_size)
+
+            # Words whose vectors changed (e.g. new model) are re-added
+            kept = [i for i, id_ in enumerate(ids) if id_ in state.index]
+            rows = np.array([state.index[ids[i]] for i in kept], dtype=np.int64)
+            drifted = ~np.all(np.isclose(state.vectors[rows], vectors_norm[kept], atol=1e-5), axis=1)
+            if drifted.any():
+                stale = [ids[kept[i]] for i in np.flatnonzero(drifted)]
+                recomputed = np.union1d(recomputed, state.remove(stale, block_size=self.block_size))
+
+            added = [i for i, id_ in enumerate(ids) if id_ not in state.index]
+            changed = state.add([ids[i] for i in added], vectors_norm[added], block_size=self.block_size)
+            logger.info(f"Incremental kNN update: {len(added)} added, {len(removed)} removed, "
+                        f"{len(recomputed)} lists recomputed, {len(changed)} lists updated")
+        else:
+            logger.info(f"Building kNN state for {len(ids)} words")
+            neighbors, scores = self._search(vectors_norm, None)
+            state = KNNState(ids, vectors_norm, neighbors, scores)
+
+        state.save(self.state_path)
+
+        # Map state rows to this build's word order and apply the threshold
+        to_word = np.full(len(state.ids) + 1, -1, dtype=np.int64)  # slot -1 maps padding
+        to_word[[state.index[id_] for id_ in ids]] = np.arange(len(ids))
+        rows = np.array([state.index[id_] for id_ in ids], dtype=np.int64)
+
+        neighbors = to_word[state.neighbors[rows]]
+        scores = state.scores[rows].copy()
+        return mask_neighbors(neighbors, scores, self.min_similarity)
+
+    def _search_quantized(self, word_vectors: List[np.ndarray]):
+        """Quantized candidate search with exact rescoring from the word vectors."""
+        quantized = QuantizedVectors.from_rows(word_vectors, dtype=self.quantization, normalize=True)
+        logger.info(f"Quantized {len(quantized)} vectors to {self.quantization} "
+                    f"({quantized.nbytes / 1e6:.1f} MB)")
+        return quantized_self_topk(
+            quantized, word_vectors,
+            k=self.max_relations,
+            min_similarity=self.min_similarity,
+            block_size=self.block_size,
+            oversample=self.rescore_factor
+        )
+
+    def _search(self, vectors_norm: np.ndarray, min_similarity: Optional[float]):
+        """Run the configured top-k engine over normalized vectors."""
+        if self.engine == 'ivf':
+            index = IVFIndex(nlist=self.nlist, nprobe=self.nprobe).fit(vectors_norm)
+            return index.search(
+                vectors_norm,
+                k=self.max_relations,
+                min_similarity=min_similarity,
+                self_offset=0
+            )
+
+        # Exact: computed block by block without materializing the N x N matrix
+        if self.n_jobs != 1:
+            return parallel_topk(
+                vectors_norm,
+                k=self.max_relations,
+                min_similarity=min_similarity,
+                block_size=self.block_size,
+                n_jobs=self.n_jobs
+            )
+
+        return blocked_topk(
+            vectors_norm, vectors_norm,
+            k=self.max_relations,
+            min_similarity=min_similarity,
+            block_size=self.block_size,
+            self_offset=0
+        )
@@ -0,0 +1,76 @@
+"""
+Spatial index processor - octree over word positions for the renderer.
+"""
+from typing import List, Dict, Optional
+import logging
+import numpy as np
+
+from .base import Processor
+from ..models import WordInfo
+from ..spatial import SpatialIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpatialIndexProcessor(Processor):
+    """
+    Builds a SpatialIndex over words that have a position and exports it as
+    the universe's "spatialIndex" block, so the renderer (or a server) can
+    cull and pick by walking octree cells instead of scanning every node.
+
+    Positions are read from metadata['position'], either as an (x, y, z)
+    sequence or a {'x', 'y', 'z'} dict. Run it last, after the step that
+    lays the universe out; without positions it logs a warning and does
+    nothing.
+
+    Config:
+        depth: Leaf depth of the octree (default: automatic, from leaf_size)
+        leaf_size: Target average words per leaf cell (default: 32)
+        max_depth: Maximum automatic depth (default: 10)
+    """
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.depth: Optional[int] = self.config.get('depth')
+        self.leaf_size = self.config.get('leaf_size', 32)
+        self.max_depth = self.config.get('max_depth', 10)
+        self.index: Optional[SpatialIndex] = None
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Build the spatial index.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words unchanged (the index is attached as an export block)
+        """
+        nodes, positions = [], []
+        for i, word in enumerate(words):
+            position = word.metadata.get('position')
+            if position is None:
+                continue
+            if isinstance(position, dict):
+                position = (position['x'], position['y'], position['z'])
+            nodes.append(i)
+            positions.append(position)
+
+        if not nodes:
+            logger.warning("No word positions found, skipping spatial index")
+            return words
+        if len(nodes) < len(words):
+            logger.warning(f"{len(words) - len(nodes)} words have no position and are not indexed")
+
+        nodes = np.array(nodes, dtype=np.int64)
+        levels = np.fromiter((words[i].hierarchy_level for i in nodes), dtype=np.int64, count=len(nodes))
+        frequency = np.fromiter((words[i].frequency for i in nodes), dtype=np.int64, count=len(nodes))
+
+        index = SpatialIndex.build(np.asarray(positions, dtype=np.float64), levels, frequency,
+                                   self.depth, self.leaf_size, self.max_depth)
+        index.order = nodes[index.order]  # subset positions -> word indices
+
+        self.index = index
+        words[0].metadata.setdefault('_extensions', {})['spatialIndex'] = index
+        return words
@@ -0,0 +1,174 @@
+"""
+Galaxy summary processor - aggregates word relations into a galaxy-level graph.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import numpy as np
+
+from .base import Processor
+from ..models import WordInfo, RelationType
+
+
+logger = logging.getLogger(__name__)
+
+
+class GalaxySummaryProcessor(Processor):
+    """
+    Precomputes the zoomed-out view of the universe.
+
+    Word relations are aggregated into a weighted galaxy x galaxy graph
+    (and, optionally, a (galaxy, hierarchy level) x (galaxy, level) graph),
+    so the overview renders a few dozen summary edges instead of every word
+    edge. Each galaxy also lists its most frequent words as labels.
+
+    Aggregation runs on the shared RelationGraph's edge arrays: edges are
+    mapped to group pairs, made undirected, and summed with np.unique +
+    bincount. Edges inside one group are counted per group instead.
+
+    Run it after clustering, ranking and pruning, so galaxy ids, levels,
+    frequencies and relations are final. The result is exported as the
+    universe's "galaxyGraph" block.
+
+    Config:
+        top_words: Representative words per galaxy (default: 5)
+        min_edge_count: Drop summary edges backed by fewer relations (default: 1)
+        levels: Also build the (galaxy, level) graph (default: True)
+        types: Relation type names to aggregate (default: all)
+    """
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.top_words = self.config.get('top_words', 5)
+        self.min_edge_count = self.config.get('min_edge_count', 1)
+        self.include_levels = self.config.get('levels', True)
+        self.types: Optional[List[str]] = self.config.get('types')
+        self.summary: Optional[Dict[str, Any]] = None
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Build the galaxy summary graph.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words unchanged (the summary is attached as an export block)
+        """
+        if not words:
+            return words
+
+        # Galaxy order: configured galaxies first, then any other ids in use
+        galaxy_ids = [g.id for g in words[0].metadata.get('_galaxies', [])]
+        galaxy_index = {galaxy_id: i for i, galaxy_id in enumerate(galaxy_ids)}
+        for word in words:
+            if word.galaxy_id not in galaxy_index:
+                galaxy_index[word.galaxy_id] = len(galaxy_ids)
+                galaxy_ids.append(word.galaxy_id)
+
+        num_galaxies = len(galaxy_ids)
+        galaxy = np.fromiter((galaxy_index[w.galaxy_id] for w in words), dtype=np.int64, count=len(words))
+        levels = np.fromiter((w.hierarchy_level for w in words), dtype=np.int64, count=len(words))
+        frequency = np.fromiter((w.frequency for w in words), dtype=np.int64, count=len(words))
+
+        types = [RelationType(t) for t in self.types] if self.types else None
+        src, dst, weights = self.get_graph(words).edges(types, internal_only=True)
+
+        summary = {
+            "galaxies": galaxy_ids,
+            "wordCounts": np.bincount(galaxy, minlength=num_galaxies).tolist(),
+            "topWords": self._top_words(words, galaxy, frequency, num_galaxies),
+            **self._aggregate(galaxy, src, dst, weights, num_galaxies)
+        }
+
+        if self.include_levels:
+            # Node k of the level graph is (galaxy[k], level[k]); only pairs in use
+            num_levels = int(levels.max()) + 1
+            pair, group = np.unique(galaxy * num_levels + levels, return_inverse=True)
+            group = group.reshape(-1)
+            summary["levels"] = {
+                "galaxy": (pair // num_levels).tolist(),
+                "level": (pair % num_levels).tolist(),
+                "wordCounts": np.bincount(group, minlength=len(pair)).tolist(),
+                **self._aggregate(group, src, dst, weights, len(pair))
+            }
+
+        self.summary = summary
+        words[0].metadata.setdefault('_extensions', {})['galaxyGraph'] = summary
+
+        logger.info(f"Summarized {len(src)} relations into {len(summary['edges']['source'])} "
+                    f"edges between {num_galaxies} galaxies")
+        return words
+
+    def _aggregate(
+        self,
+        group: np.ndarray,
+        src: np.ndarray,
+        dst: np.ndarray,
+        weights: np.ndarray,
+        num_groups: int
+    ) -> Dict[str, Any]:
+        """
+        Sum word edges into undirected group-pair edges.
+
+        Args:
+            group: (N,) group index per word
+            src, dst, weights: Word edge arrays (word nodes only)
+            num_groups: Number of groups
+
+        Returns:
+            {"internalEdges": per-group count, "edges": {source, target, count, weight}}
+        """
+        a, b = group[src], group[dst]
+        inside = a == b
+        internal = np.bincount(a[inside], minlength=num_groups)
+
+        lo = np.minimum(a[~inside], b[~inside])
+        hi = np.maximum(a[~inside], b[~inside])
+        pairs, inverse = np.unique(lo * num_groups + hi, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        counts = np.bincount(inverse, minlength=len(pairs))
+        totals = np.bincount(inverse, weights=weights[~inside], minlength=len(pairs))
+
+        kept = counts >= self.min_edge_count
+        pairs, counts, totals = pairs[kept], counts[kept], totals[kept]
+        return {
+            "internalEdges": internal.tolist(),
+            "edges": {
+                "source": (pairs // num_groups).tolist(),
+                "target": (pairs % num_groups).tolist(),
+                "count": counts.tolist(),
+                "weight": np.round(totals, 4).tolist()
+            }
+        }
+
+    def _top_words(
+        self,
+        words: List[WordInfo],
+        galaxy: np.ndarray,
+        frequency: np.ndarray,
+        num_galaxies: int
+    ) -> List[List[str]]:
+        """Ids of the most frequent words per galaxy (ties keep word order)."""
+        order, rank = _rank_within_groups(galaxy, -frequency)
+        top = order[rank < self.top_words]
+
+        result: List[List[str]] = [[] for _ in range(num_galaxies)]
+        for i in top.tolist():
+            result[galaxy[i]].append(words[i].id)
+        return result
+
+
+def _rank_within_groups(group: np.ndarray, key: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort items by (group, key, position) and rank them within their group.
+
+    Returns:
+        (order, rank) - item indices in sorted order and each one's 0-based
+        rank inside its group
+    """
+    order = np.lexsort((np.arange(len(group)), key, group))
+    sorted_group = group[order]
+    starts = np.r_[True, sorted_group[1:] != sorted_group[:-1]]
+    positions = np.arange(len(order))
+    rank = positions - np.maximum.accumulate(np.where(starts, positions, 0))
+    return order, rank
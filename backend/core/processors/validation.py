@@ -0,0 +1,99 @@
+"""
+Edge validation processor - checks relations against word embeddings.
+"""
+from typing import List, Dict, Optional
+import logging
+import numpy as np
+
+from .base import Processor
+from ..models import WordInfo, RelationType
+from ..similarity import normalize_rows
+
+
+logger = logging.getLogger(__name__)
+
+
+class EdgeValidationProcessor(Processor):
+    """
+    Second-pass semantic check of relations before they become links
+    (the "vector validation" step of docs/design.md).
+
+    All relations between words that both have vectors are scored at once:
+    the vectors are normalized into one matrix and each edge's cosine
+    similarity is a row-wise dot product of its source and target rows,
+    computed over edge chunks. Edges below `min_similarity` are dropped or
+    down-weighted. Edges without vectors on both ends are left untouched.
+
+    Config:
+        min_similarity: Cosine similarity threshold (default: 0.2)
+        action: 'drop' or 'downweight' - down-weighting scales strength by
+            similarity / min_similarity (default: 'drop')
+        types: Relation type names to validate (default: all but 'antonym',
+            whose pairs are often distant in embedding space)
+        chunk_size: Edges scored per step (default: 16384)
+    """
+
+    modifies_relations = True
+
+    def __init__(self, config: Dict = None):
+        super().__init__(config)
+        self.min_similarity = self.config.get('min_similarity', 0.2)
+        self.action = self.config.get('action', 'drop')
+        self.types: Optional[List[str]] = self.config.get(
+            'types', [t.value for t in RelationType if t != RelationType.ANTONYM])
+        self.chunk_size = self.config.get('chunk_size', 16384)
+
+        if self.action not in ('drop', 'downweight'):
+            raise ValueError(f"Unknown edge validation action: {self.action}")
+
+    def process(self, words: List[WordInfo]) -> List[WordInfo]:
+        """
+        Validate relations with embedding similarity.
+
+        Args:
+            words: List of WordInfo objects
+
+        Returns:
+            Words with low-similarity relations dropped or down-weighted
+        """
+        graph = self.get_graph(words)
+
+        # One normalized matrix; word node -> row (-1 if no vector)
+        row_of_node = np.full(graph.num_nodes, -1, dtype=np.int64)
+        vectors = []
+        for i, word in enumerate(words):
+            vec = word.metadata.get('vector')
+            if vec is not None:
+                row_of_node[i] = len(vectors)
+                vectors.append(vec)
+
+        if not vectors:
+            logger.warning("No word vectors found, skipping edge validation")
+            return words
+        matrix = normalize_rows(np.stack(vectors))
+
+        candidates = graph.type_mask([RelationType(t) for t in self.types], internal_only=True)
+        src_rows, dst_rows = row_of_node[graph.src], row_of_node[graph.dst]
+        edges = np.flatnonzero(candidates & (src_rows >= 0) & (dst_rows >= 0))
+
+        similarity = np.empty(len(edges), dtype=np.float32)
+        for start in range(0, len(edges), self.chunk_size):
+            chunk = edges[start:start + self.chunk_size]
+            similarity[start:start + len(chunk)] = np.einsum(
+                'ij,ij->i', matrix[src_rows[chunk]], matrix[dst_rows[chunk]])
+
+        weak = similarity < self.min_similarity
+        logger.info(f"Validated {len(edges)} of {graph.num_edges} relations, "
+                    f"{int(weak.sum())} below similarity {self.min_similarity}")
+
+        if self.action == 'drop':
+            keep = np.ones(graph.num_edges, dtype=bool)
+            keep[edges[weak]] = False
+            graph.filter_relations(words, keep)
+        else:
+            scale = np.clip(similarity[weak] / self.min_similarity, 0.0, 1.0)
+            for edge, factor in zip(edges[weak].tolist(), scale.tolist()):
+                relation = words[graph.src[edge]].relations[graph.rel_pos[edge]]
+                relation.strength *= factor
+
+        return words
@@ -0,0 +1,21 @@
+"""
+Vector similarity search used by the semantic and clustering processors.
+"""
+from .exact import normalize_rows, blocked_topk, sort_neighbors, mask_neighbors
+from .ann import IVFIndex
+from .parallel import parallel_topk, resolve_n_jobs
+from .quantize import QuantizedVectors, quantized_self_topk
+from .knn_state import KNNState
+
+__all__ = [
+    "normalize_rows",
+    "blocked_topk",
+    "sort_neighbors",
+    "mask_neighbors",
+    "IVFIndex",
+    "parallel_topk",
+    "resolve_n_jobs",
+    "QuantizedVectors",
+    "quantized_self_topk",
+    "KNNState",
+]
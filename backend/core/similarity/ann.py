@@ -0,0 +1,175 @@
+"""
+Approximate nearest-neighbor search with an inverted-file (IVF) index.
+"""
+from typing import Optional, Tuple
+import logging
+import numpy as np
+
+from .exact import normalize_rows, blocked_topk, sort_neighbors, mask_neighbors
+
+
+logger = logging.getLogger(__name__)
+
+
+class IVFIndex:
+    """
+    Inverted-file index over normalized vectors.
+
+    A coarse quantizer (spherical k-means with `nlist` centroids) splits the
+    vectors into inverted lists. A query is only scored against the members
+    of its `nprobe` closest lists, so search cost drops from O(N) to roughly
+    O(N * nprobe / nlist) per query. `nprobe` is the recall/latency knob:
+    nprobe == nlist is exact search.
+
+    Usage:
+        index = IVFIndex(nprobe=8).fit(vectors_norm)
+        neighbors, scores = index.search(vectors_norm, k=5, self_offset=0)
+    """
+
+    def __init__(
+        self,
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        n_iter: int = 10,
+        train_size: Optional[int] = None,
+        random_seed: int = 42
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            nlist: Number of inverted lists (default: 4 * sqrt(N))
+            nprobe: Lists scanned per query (default: 8)
+            n_iter: k-means iterations for the coarse quantizer (default: 10)
+            train_size: Vectors sampled to train the quantizer (default: 64 * nlist)
+            random_seed: Random seed for reproducibility
+        """
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.n_iter = n_iter
+        self.train_size = train_size
+        self.random_seed = random_seed
+
+        self.vectors: Optional[np.ndarray] = None    # (N, dim) normalized
+        self.centroids: Optional[np.ndarray] = None  # (nlist, dim) normalized
+        self.list_order: Optional[np.ndarray] = None  # member rows grouped by list
+        self.list_offsets: Optional[np.ndarray] = None  # (nlist + 1,) CSR offsets
+
+    def fit(self, vectors: np.ndarray) -> 'IVFIndex':
+        """
+        Train the coarse quantizer and build the inverted lists.
+
+        Args:
+            vectors: (N, dim) normalized vectors
+
+        Returns:
+            self (for chaining)
+        """
+        self.vectors = vectors
+        num_vectors = len(vectors)
+        nlist = self.nlist or max(1, int(4 * np.sqrt(num_vectors)))
+        nlist = min(nlist, num_vectors)
+
+        rng = np.random.default_rng(self.random_seed)
+        train_size = min(num_vectors, self.train_size or 64 * nlist)
+        sample = vectors[np.sort(rng.choice(num_vectors, train_size, replace=False))]
+
+        # Spherical k-means on the sample
+        centroids = sample[rng.choice(train_size, nlist, replace=False)].copy()
+        for _ in range(self.n_iter):
+            assign = blocked_topk(sample, centroids, 1)[0][:, 0]
+            centroids = self._update_centroids(sample, assign, nlist, centroids, rng)
+
+        self.centroids = centroids
+
+        # Inverted lists over all vectors
+        assign = blocked_topk(vectors, centroids, 1)[0][:, 0]
+        self.list_order = np.argsort(assign, kind='stable')
+        self.list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))])
+
+        sizes = np.diff(self.list_offsets)
+        logger.info(f"IVF index: {num_vectors} vectors in {nlist} lists "
+                    f"(mean {sizes.mean():.0f}, max {sizes.max()} per list)")
+        return self
+
+    @staticmethod
+    def _update_centroids(sample: np.ndarray, assign: np.ndarray, nlist: int,
+                          previous: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Recompute normalized centroids; re-seed empty lists from random samples."""
+        order = np.argsort(assign, kind='stable')
+        counts = np.bincount(assign, minlength=nlist)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+        centroids = previous.copy()
+        nonempty = counts > 0
+        sums = np.add.reduceat(sample[order], starts[nonempty], axis=0)
+        centroids[nonempty] = normalize_rows(sums)
+
+        empty = np.flatnonzero(~nonempty)
+        if len(empty):
+            centroids[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+        return centroids
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        min_similarity: Optional[float] = None,
+        self_offset: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate top-k search.
+
+        Args:
+            queries: (Nq, dim) normalized query vectors
+            k: Neighbors to keep per query
+            min_similarity: Drop neighbors below this cosine similarity
+            self_offset: If queries are indexed rows [self_offset, self_offset + Nq),
+                each query's own row is excluded
+
+        Returns:
+            (indices, scores) in the same layout as blocked_topk
+        """
+        if self.centroids is None:
+            raise RuntimeError("IVFIndex.search() called before fit()")
+
+        num_queries = len(queries)
+        indices = np.full((num_queries, k), -1, dtype=np.int64)
+        scores = np.full((num_queries, k), -np.inf, dtype=np.float32)
+        if num_queries == 0 or k <= 0:
+            return indices, scores
+
+        # Lists each query probes, regrouped as list -> probing queries
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = blocked_topk(queries, self.centroids, nprobe)[0]
+        probe_lists = probes.ravel()
+        probe_queries = np.repeat(np.arange(num_queries), nprobe)
+        by_list = np.argsort(probe_lists, kind='stable')
+        probe_lists, probe_queries = probe_lists[by_list], probe_queries[by_list]
+        bounds = np.flatnonzero(np.diff(probe_lists)) + 1
+
+        for group in np.split(np.arange(len(probe_lists)), bounds):
+            if len(group) == 0:
+                continue
+            list_id = probe_lists[group[0]]
+            members = self.list_order[self.list_offsets[list_id]:self.list_offsets[list_id + 1]]
+            if len(members) == 0:
+                continue
+
+            qs = probe_queries[group]
+            sims = queries[qs] @ self.vectors[members].T
+            if self_offset is not None:
+                sims[members[None, :] == (qs + self_offset)[:, None]] = -np.inf
+
+            # Merge the list's candidates into the running top-k of each query
+            cand_idx = np.concatenate([indices[qs], np.broadcast_to(members, sims.shape)], axis=1)
+            cand_scores = np.concatenate([scores[qs], sims], axis=1)
+            if cand_idx.shape[1] > k:
+                top = np.argpartition(-cand_scores, k - 1, axis=1)[:, :k]
+                cand_idx = np.take_along_axis(cand_idx, top, axis=1)
+                cand_scores = np.take_along_axis(cand_scores, top, axis=1)
+            indices[qs, :cand_idx.shape[1]] = cand_idx
+            scores[qs, :cand_scores.shape[1]] = cand_scores
+
+        indices, scores = sort_neighbors(indices, scores)
+        return mask_neighbors(indices, scores, min_similarity)
@@ -0,0 +1,134 @@
+"""
+Exact top-k cosine similarity computed in row blocks.
+"""
+from typing import Optional, Tuple
+import numpy as np
+
+
+# Upper bound for one (block x N) similarity slab, in float32 elements (256 MB)
+MAX_BLOCK_ELEMENTS = 64 * 1024 * 1024
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row so dot products are cosine similarities.
+
+    Args:
+        vectors: (N, dim) array
+
+    Returns:
+        (N, dim) float32 array
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / (norms + 1e-8)
+
+
+def sort_neighbors(
+    indices: np.ndarray,
+    scores: np.ndarray,
+    k: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Order each row's neighbors by descending score, ties by ascending index.
+
+    Every engine sorts its final lists through here, so tie-breaking is the
+    same whichever engine produced them.
+
+    Args:
+        indices: (N, m) neighbor indices
+        scores: (N, m) neighbor scores
+        k: Keep only the first k columns after sorting (default: all)
+
+    Returns:
+        (indices, scores) sorted row-wise
+    """
+    order = np.lexsort((indices, -scores), axis=1)[:, :k]
+    return np.take_along_axis(indices, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def mask_neighbors(
+    indices: np.ndarray,
+    scores: np.ndarray,
+    min_similarity: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn missing, excluded (-inf) and below-threshold neighbors into padding
+    (index -1, score -inf), in place.
+
+    Args:
+        indices: (N, m) neighbor indices
+        scores: (N, m) neighbor scores
+        min_similarity: Drop neighbors below this cosine similarity
+
+    Returns:
+        The same (indices, scores) arrays
+    """
+    drop = (indices < 0) | ~np.isfinite(scores)
+    if min_similarity is not None:
+        drop |= scores < min_similarity
+    indices[drop] = -1
+    scores[drop] = -np.inf
+    return indices, scores
+
+
+def blocked_topk(
+    queries: np.ndarray,
+    base: np.ndarray,
+    k: int,
+    min_similarity: Optional[float] = None,
+    block_size: int = 1024,
+    self_offset: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k most similar base rows for every query row.
+
+    Queries are multiplied against the base matrix one block of rows at a
+    time and only the top k per row is kept (argpartition, then a sort of
+    those k), so memory is O(Nq * k + block * N) instead of O(Nq * N).
+
+    Args:
+        queries: (Nq, dim) normalized query vectors
+        base: (N, dim) normalized base vectors
+        k: Neighbors to keep per query
+        min_similarity: Drop neighbors below this cosine similarity
+        block_size: Query rows per matrix product (capped by MAX_BLOCK_ELEMENTS)
+        self_offset: If queries are base rows [self_offset, self_offset + Nq),
+            each query's own row is excluded
+
+    Returns:
+        (indices, scores) - (Nq, k) arrays sorted by descending score (ties by
+        index). Missing neighbors are padded with index -1 / score -inf.
+    """
+    num_queries, num_base = len(queries), len(base)
+    indices = np.full((num_queries, k), -1, dtype=np.int64)
+    scores = np.full((num_queries, k), -np.inf, dtype=np.float32)
+
+    if num_queries == 0 or num_base == 0 or k <= 0:
+        return indices, scores
+
+    block_size = max(1, min(block_size, MAX_BLOCK_ELEMENTS // num_base))
+    kk = min(k, num_base)
+
+    for start in range(0, num_queries, block_size):
+        end = min(start + block_size, num_queries)
+        sims = queries[start:end] @ base.T
+
+        if self_offset is not None:
+            rows = np.arange(end - start)
+            cols = self_offset + start + rows
+            inside = cols < num_base
+            sims[rows[inside], cols[inside]] = -np.inf
+
+        if kk == 1:
+            top = np.argmax(sims, axis=1)[:, None]
+        elif kk < num_base:
+            top = np.argpartition(sims, -kk, axis=1)[:, -kk:]
+        else:
+            top = np.broadcast_to(np.arange(num_base), (end - start, num_base))
+        top_scores = np.take_along_axis(sims, top, axis=1)
+
+        indices[start:end, :kk], scores[start:end, :kk] = sort_neighbors(top, top_scores)
+
+    # Excluded self matches and below-threshold neighbors become padding
+    return mask_neighbors(indices, scores, min_similarity)
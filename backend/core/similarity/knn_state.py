@@ -0,0 +1,182 @@
+"""
+Persisted kNN graph with incremental updates.
+"""
+from pathlib import Path
+from typing import List, Optional, Union
+import logging
+import numpy as np
+
+from .exact import blocked_topk, sort_neighbors, mask_neighbors
+
+
+logger = logging.getLogger(__name__)
+
+
+class KNNState:
+    """
+    Top-k neighbor lists plus the normalized embedding matrix they came from.
+
+    Saved between builds so that adding a few hundred words only computes:
+    - neighbors of the new words (new x all)
+    - new-word candidates for existing words (existing x new), merged into
+      their lists only where a new word beats the current k-th neighbor
+    Removing words recomputes just the lists that pointed at them.
+
+    Lists are stored without a similarity threshold; callers apply their own.
+    """
+
+    def __init__(self, ids: List[str], vectors: np.ndarray, neighbors: np.ndarray, scores: np.ndarray):
+        """
+        Args:
+            ids: Row ids (e.g. word ids)
+            vectors: (N, dim) normalized float32 vectors
+            neighbors: (N, k) neighbor rows, -1 padded
+            scores: (N, k) cosine similarities, -inf padded
+        """
+        self.ids = list(ids)
+        self.vectors = vectors
+        self.neighbors = neighbors
+        self.scores = scores
+        self.index = {id_: i for i, id_ in enumerate(self.ids)}
+
+    @property
+    def k(self) -> int:
+        return self.neighbors.shape[1]
+
+    @classmethod
+    def build(cls, ids: List[str], vectors: np.ndarray, k: int, block_size: int = 1024) -> 'KNNState':
+        """
+        Compute a fresh state with exact blocked search.
+
+        Args:
+            ids: Row ids
+            vectors: (N, dim) normalized vectors
+            k: Neighbors per row
+            block_size: Rows per matrix product
+        """
+        neighbors, scores = blocked_topk(vectors, vectors, k, block_size=block_size, self_offset=0)
+        return cls(ids, vectors, neighbors, scores)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional['KNNState']:
+        """Load a saved state, or None if the file doesn't exist."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                ids=data['ids'].tolist(),
+                vectors=data['vectors'],
+                neighbors=data['neighbors'],
+                scores=data['scores']
+            )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the state as an uncompressed .npz (fast to reload)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('wb') as f:
+            np.savez(
+                f,
+                ids=np.array(self.ids, dtype=str),
+                vectors=self.vectors,
+                neighbors=self.neighbors,
+                scores=self.scores
+            )
+
+    def add(self, ids: List[str], vectors: np.ndarray, block_size: int = 1024) -> np.ndarray:
+        """
+        Add new rows and update affected neighbor lists.
+
+        Args:
+            ids: Ids of the new rows (must not already be in the state)
+            vectors: (m, dim) normalized vectors of the new rows
+            block_size: Rows per matrix product
+
+        Returns:
+            Indices of existing rows whose neighbor lists changed
+        """
+        num_old, num_new = len(self.ids), len(ids)
+        if num_new == 0:
+            return np.empty(0, dtype=np.int64)
+
+        k = self.k
+        all_vectors = np.concatenate([self.vectors, vectors.astype(np.float32)])
+
+        # New rows: full search against everything
+        new_neighbors, new_scores = blocked_topk(
+            vectors, all_vectors, k, block_size=block_size, self_offset=num_old)
+
+        # Existing rows: only the new rows can enter their lists
+        kn = min(k, num_new)
+        changed = []
+        for start in range(0, num_old, block_size):
+            end = min(start + block_size, num_old)
+            sims = self.vectors[start:end] @ vectors.T
+
+            if kn < num_new:
+                top = np.argpartition(sims, -kn, axis=1)[:, -kn:]
+            else:
+                top = np.broadcast_to(np.arange(num_new), (end - start, num_new))
+            top_scores = np.take_along_axis(sims, top, axis=1)
+
+            # A list changes only if a new row beats its current k-th score
+            kth = self.scores[start:end, -1]
+            hit = np.flatnonzero(top_scores.max(axis=1) > kth)
+            if len(hit) == 0:
+                continue
+
+            rows = start + hit
+            merged_idx = np.concatenate([self.neighbors[rows], top[hit] + num_old], axis=1)
+            merged_scores = np.concatenate([self.scores[rows], top_scores[hit]], axis=1)
+            self.neighbors[rows], self.scores[rows] = sort_neighbors(merged_idx, merged_scores, k)
+            changed.append(rows)
+
+        self.vectors = all_vectors
+        self.neighbors = np.concatenate([self.neighbors, new_neighbors])
+        self.scores = np.concatenate([self.scores, new_scores])
+        self.ids.extend(ids)
+        self.index.update({id_: num_old + i for i, id_ in enumerate(ids)})
+
+        return np.concatenate(changed) if changed else np.empty(0, dtype=np.int64)
+
+    def remove(self, ids: List[str], block_size: int = 1024) -> np.ndarray:
+        """
+        Remove rows and recompute the lists that referenced them.
+
+        Args:
+            ids: Ids to remove (unknown ids are ignored)
+            block_size: Rows per matrix product
+
+        Returns:
+            Indices (after removal) of rows whose neighbor lists were recomputed
+        """
+        drop = np.zeros(len(self.ids), dtype=bool)
+        for id_ in ids:
+            if id_ in self.index:
+                drop[self.index[id_]] = True
+        if not drop.any():
+            return np.empty(0, dtype=np.int64)
+
+        keep = ~drop
+        remap = np.full(len(self.ids) + 1, -1, dtype=np.int64)  # slot -1 maps padding
+        remap[:-1][keep] = np.arange(keep.sum())
+
+        affected = (drop[self.neighbors] & (self.neighbors >= 0)).any(axis=1)[keep]
+
+        self.ids = [id_ for id_, kept in zip(self.ids, keep) if kept]
+        self.index = {id_: i for i, id_ in enumerate(self.ids)}
+        self.vectors = self.vectors[keep]
+        self.neighbors = remap[self.neighbors[keep]]
+        self.scores = self.scores[keep]
+
+        rows = np.flatnonzero(affected)
+        for start in range(0, len(rows), block_size):
+            batch = rows[start:start + block_size]
+            # Scattered rows can't use self_offset; fetch one extra and drop self
+            neighbors, scores = blocked_topk(self.vectors[batch], self.vectors, self.k + 1, block_size=block_size)
+            scores[neighbors == batch[:, None]] = -np.inf
+            self.neighbors[batch], self.scores[batch] = mask_neighbors(
+                *sort_neighbors(neighbors, scores, self.k))
+
+        return rows
@@ -0,0 +1,122 @@
+"""
+Multi-process exact top-k over a shared vector matrix.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import multiprocessing
+from typing import Optional, Tuple
+import logging
+import os
+import numpy as np
+
+from .exact import blocked_topk
+
+
+logger = logging.getLogger(__name__)
+
+
+# Matrix attached by each worker process (see _attach_worker)
+_WORKER_MATRIX: Optional[np.ndarray] = None
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+
+# Forking after BLAS or asyncio.to_thread threads exist can deadlock the
+# children, so workers start from a clean interpreter instead
+_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Turn an n_jobs setting (-1 = all cores) into a worker count."""
+    cpus = os.cpu_count() or 1
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpus + 1 + n_jobs)
+    return min(n_jobs, cpus)
+
+
+def _attach_worker(name: str, shape: tuple, dtype: str):
+    """Process pool initializer: map the shared matrix without copying it."""
+    global _WORKER_MATRIX, _WORKER_SHM
+    # Workers share the parent's resource tracker; the parent unlinks the block
+    _WORKER_SHM = shared_memory.SharedMemory(name=name)
+    _WORKER_MATRIX = np.ndarray(shape, dtype=dtype, buffer=_WORKER_SHM.buf)
+
+
+def _topk_rows(start: int, end: int, k: int, min_similarity: Optional[float],
+               block_size: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Worker task: exact top-k for matrix rows [start, end)."""
+    matrix = _WORKER_MATRIX
+    indices, scores = blocked_topk(
+        matrix[start:end], matrix,
+        k=k,
+        min_similarity=min_similarity,
+        block_size=block_size,
+        self_offset=start
+    )
+    return start, indices, scores
+
+
+def parallel_topk(
+    vectors: np.ndarray,
+    k: int,
+    min_similarity: Optional[float] = None,
+    block_size: int = 1024,
+    n_jobs: int = -1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact self top-k (each row against all rows, excluding itself) on a process pool.
+
+    The normalized matrix is placed in shared memory once, so workers read
+    it without pickling. Workers are started with forkserver (spawn where
+    that is unavailable), never fork. Rows are split into contiguous ranges; every row's
+    result depends only on that row, and ranges are written back by
+    position, so the output is identical to the single-process path.
+
+    Args:
+        vectors: (N, dim) normalized vectors
+        k: Neighbors to keep per row
+        min_similarity: Drop neighbors below this cosine similarity
+        block_size: Rows per matrix product inside each worker
+        n_jobs: Worker processes (-1 = all cores)
+
+    Returns:
+        (indices, scores) in the same layout as blocked_topk
+    """
+    workers = resolve_n_jobs(n_jobs)
+    num_rows = len(vectors)
+
+    if workers == 1 or num_rows <= block_size:
+        return blocked_topk(vectors, vectors, k, min_similarity, block_size, self_offset=0)
+
+    indices = np.full((num_rows, k), -1, dtype=np.int64)
+    scores = np.full((num_rows, k), -np.inf, dtype=np.float32)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, vectors.nbytes))
+    shared = np.ndarray(vectors.shape, dtype=vectors.dtype, buffer=shm.buf)
+    shared[:] = vectors
+    del shared  # release the buffer export so the block can be closed
+
+    # A few ranges per worker keeps cores busy when ranges finish unevenly
+    bounds = np.linspace(0, num_rows, workers * 4 + 1).astype(int)
+    ranges = [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+    logger.info(f"Computing top-{k} for {num_rows} rows on {workers} processes")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context(_START_METHOD),
+                                 initializer=_attach_worker,
+                                 initargs=(shm.name, vectors.shape, vectors.dtype.str)) as pool:
+            futures = [
+                pool.submit(_topk_rows, a, b, k, min_similarity, block_size)
+                for a, b in ranges
+            ]
+            for future in futures:
+                start, part_indices, part_scores = future.result()
+                indices[start:start + len(part_indices)] = part_indices
+                scores[start:start + len(part_scores)] = part_scores
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return indices, scores
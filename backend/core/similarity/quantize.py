@@ -0,0 +1,191 @@
+"""
+Quantized (int8 / float16) vector storage with exact float32 rescoring.
+"""
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .exact import sort_neighbors, mask_neighbors
+
+
+QUANTIZED_DTYPES = {
+    'int8': np.int8,
+    'float16': np.float16,
+}
+
+
+class QuantizedVectors:
+    """
+    Compact copy of an (N, dim) vector matrix.
+
+    - int8: each row is stored as round(v / scale) with a per-row float32
+      scale of max(|v|) / 127 (4x smaller than float32)
+    - float16: rows stored as half floats, scale fixed at 1 (2x smaller)
+
+    NumPy has no int8/half GEMM, so products run on float32 blocks that are
+    dequantized on the fly; the full float32 matrix is never materialized.
+
+    Usage:
+        quantized = QuantizedVectors.from_rows(vectors, dtype='int8', normalize=True)
+        block = quantized.dequantize(0, 1024)
+    """
+
+    def __init__(self, codes: np.ndarray, scales: np.ndarray):
+        """
+        Args:
+            codes: (N, dim) int8 or float16 codes
+            scales: (N,) float32 per-row scales
+        """
+        self.codes = codes
+        self.scales = scales
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Union[np.ndarray, Sequence[np.ndarray]],
+        dtype: str = 'int8',
+        normalize: bool = False,
+        chunk_size: int = 4096
+    ) -> 'QuantizedVectors':
+        """
+        Quantize vectors chunk by chunk (rows may be a list of 1-D arrays).
+
+        Args:
+            rows: (N, dim) array or sequence of (dim,) vectors
+            dtype: 'int8' or 'float16'
+            normalize: L2-normalize rows before quantizing
+            chunk_size: Rows converted per step
+
+        Returns:
+            QuantizedVectors
+        """
+        if dtype not in QUANTIZED_DTYPES:
+            raise ValueError(f"Unsupported quantization dtype: {dtype}")
+
+        num_rows = len(rows)
+        dim = len(rows[0]) if num_rows else 0
+        codes = np.empty((num_rows, dim), dtype=QUANTIZED_DTYPES[dtype])
+        scales = np.ones(num_rows, dtype=np.float32)
+
+        for start in range(0, num_rows, chunk_size):
+            end = min(start + chunk_size, num_rows)
+            block = np.asarray(rows[start:end], dtype=np.float32)
+            if normalize:
+                block = block / (np.linalg.norm(block, axis=1, keepdims=True) + 1e-8)
+
+            if dtype == 'int8':
+                scale = np.abs(block).max(axis=1) / 127.0
+                scale[scale == 0] = 1.0
+                codes[start:end] = np.rint(block / scale[:, None]).astype(np.int8)
+                scales[start:end] = scale
+            else:
+                codes[start:end] = block.astype(np.float16)
+
+        return cls(codes, scales)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def dim(self) -> int:
+        return self.codes.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scales.nbytes
+
+    def dequantize(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """Rows [start, end) as float32."""
+        end = len(self) if end is None else end
+        return self.codes[start:end].astype(np.float32) * self.scales[start:end, None]
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        """Selected rows as float32."""
+        return self.codes[indices].astype(np.float32) * self.scales[indices, None]
+
+
+def quantized_self_topk(
+    quantized: QuantizedVectors,
+    exact_rows: Union[np.ndarray, Sequence[np.ndarray]],
+    k: int,
+    min_similarity: Optional[float] = None,
+    block_size: int = 1024,
+    column_block: int = 16384,
+    oversample: int = 4
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Self top-k (excluding each row itself) over quantized, normalized rows.
+
+    Candidates (k * oversample per row) come from quantized products; the
+    final top-k is rescored with exact float32 cosine similarity on the
+    original vectors, so returned scores are exact.
+
+    Args:
+        quantized: Quantized, normalized vectors
+        exact_rows: Original float32 vectors (array or list; need not be normalized)
+        k: Neighbors to keep per row
+        min_similarity: Drop neighbors below this cosine similarity
+        block_size: Query rows per step
+        column_block: Base rows dequantized per step
+        oversample: Candidate multiplier for the rescoring step
+
+    Returns:
+        (indices, scores) in the same layout as blocked_topk
+    """
+    num_rows = len(quantized)
+    indices = np.full((num_rows, k), -1, dtype=np.int64)
+    scores = np.full((num_rows, k), -np.inf, dtype=np.float32)
+    if num_rows < 2 or k <= 0:
+        return indices, scores
+
+    num_candidates = min(k * max(1, oversample), num_rows - 1)
+
+    for start in range(0, num_rows, block_size):
+        end = min(start + block_size, num_rows)
+        queries = quantized.dequantize(start, end)
+        rows = np.arange(end - start)
+
+        cand_idx = np.full((end - start, num_candidates), -1, dtype=np.int64)
+        cand_scores = np.full((end - start, num_candidates), -np.inf, dtype=np.float32)
+
+        # Approximate candidates, one dequantized column block at a time
+        for col in range(0, num_rows, column_block):
+            col_end = min(col + column_block, num_rows)
+            sims = queries @ quantized.dequantize(col, col_end).T
+
+            self_cols = start + rows - col
+            inside = (self_cols >= 0) & (self_cols < col_end - col)
+            sims[rows[inside], self_cols[inside]] = -np.inf
+
+            # Best columns of this block first, then merge with the candidates so far
+            keep = min(num_candidates, col_end - col)
+            block_top = np.argpartition(sims, -keep, axis=1)[:, -keep:]
+            merged_idx = np.concatenate([cand_idx, block_top + col], axis=1)
+            merged_scores = np.concatenate(
+                [cand_scores, np.take_along_axis(sims, block_top, axis=1)], axis=1)
+            top = np.argpartition(merged_scores, -num_candidates, axis=1)[:, -num_candidates:]
+            cand_idx = np.take_along_axis(merged_idx, top, axis=1)
+            cand_scores = np.take_along_axis(merged_scores, top, axis=1)
+
+        # Exact float32 rescoring of the candidates
+        exact_queries = _gather_normalized(exact_rows, np.arange(start, end))
+        valid = cand_idx >= 0
+        flat = np.where(valid, cand_idx, 0).ravel()
+        exact_cands = _gather_normalized(exact_rows, flat).reshape(end - start, num_candidates, -1)
+        exact_scores = np.einsum('bd,bcd->bc', exact_queries, exact_cands).astype(np.float32)
+        exact_scores[~valid] = -np.inf
+
+        top, top_scores = sort_neighbors(cand_idx, exact_scores, k)
+        kk = top.shape[1]
+        indices[start:end, :kk] = top
+        scores[start:end, :kk] = top_scores
+
+    return mask_neighbors(indices, scores, min_similarity)
+
+
+def _gather_normalized(rows: Union[np.ndarray, Sequence[np.ndarray]], indices: np.ndarray) -> np.ndarray:
+    """Gather rows (from an array or a list of vectors) as normalized float32."""
+    if isinstance(rows, np.ndarray):
+        block = np.asarray(rows[indices], dtype=np.float32)
+    else:
+        block = np.asarray([rows[i] for i in indices], dtype=np.float32)
+    return block / (np.linalg.norm(block, axis=1, keepdims=True) + 1e-8)
@@ -0,0 +1,287 @@
+"""
+Spatial index over positioned words for culling and pick queries.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpatialIndex:
+    """
+    Linear (pointerless) octree over 3D node positions.
+
+    Positions are quantized to a 2^depth grid inside a bounding cube and
+    sorted by their Morton (Z-order) code, so every octree cell at every
+    depth covers one contiguous range of that order. A cell at depth k is
+    its nodes' Morton code shifted right by 3 * (depth - k). Per depth the
+    index stores the non-empty cell codes, their node ranges, and the
+    minimum hierarchy level (the most prominent body) and maximum frequency
+    inside, so level-of-detail queries can skip cells of small bodies.
+
+    Queries walk the tree from the 8 top cells down, one depth at a time.
+
+    Usage:
+        index = SpatialIndex.build(positions, levels, frequency)
+        nodes = index.query_box(lo, hi, positions)
+        cells = index.cells_in_box(lo, hi, min_frequency=5000)
+    """
+
+    def __init__(self, origin: np.ndarray, size: float, depth: int, order: np.ndarray,
+                 cells: List[Dict[str, np.ndarray]]):
+        """
+        Args:
+            origin: (3,) minimum corner of the bounding cube
+            size: Edge length of the bounding cube
+            depth: Depth of the leaf cells (2^depth cells per axis)
+            order: (N,) node indices sorted by Morton code
+            cells: One dict per depth 1..depth with arrays 'code',
+                'offsets' (cell i holds order[offsets[i]:offsets[i + 1]]),
+                'min_level' and 'max_frequency'
+        """
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.size = float(size)
+        self.depth = depth
+        self.order = order
+        self.cells = cells
+
+    @classmethod
+    def build(
+        cls,
+        positions: np.ndarray,
+        levels: np.ndarray,
+        frequency: np.ndarray,
+        depth: Optional[int] = None,
+        leaf_size: int = 32,
+        max_depth: int = 10
+    ) -> 'SpatialIndex':
+        """
+        Build the index.
+
+        Args:
+            positions: (N, 3) node positions
+            levels: (N,) hierarchy level per node
+            frequency: (N,) frequency per node
+            depth: Leaf depth; by default the smallest depth whose cells
+                hold about leaf_size nodes on average
+            leaf_size: Target average nodes per leaf cell
+            max_depth: Upper bound for the automatic depth (at most 17, so
+                codes stay exact in JavaScript numbers)
+
+        Returns:
+            SpatialIndex
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        num_nodes = len(positions)
+        if num_nodes == 0:
+            raise ValueError("Cannot build a spatial index without positions")
+        if depth is None:
+            depth = int(np.ceil(np.log(max(num_nodes / leaf_size, 1)) / np.log(8)))
+            depth = min(max(depth, 1), max_depth)
+        depth = min(depth, 17)
+
+        origin = positions.min(axis=0)
+        extent = float((positions.max(axis=0) - origin).max())
+        size = extent * (1 + 1e-9) if extent > 0 else 1.0
+
+        grid = 1 << depth
+        quantized = np.clip(((positions - origin) / size * grid).astype(np.int64), 0, grid - 1)
+        codes = morton_encode(quantized[:, 0], quantized[:, 1], quantized[:, 2])
+
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        sorted_levels = np.asarray(levels, dtype=np.int64)[order]
+        sorted_frequency = np.asarray(frequency, dtype=np.int64)[order]
+
+        cells = []
+        for k in range(1, depth + 1):
+            cell_codes = codes >> np.uint64(3 * (depth - k))
+            starts = np.flatnonzero(np.r_[True, cell_codes[1:] != cell_codes[:-1]])
+            cells.append({
+                'code': cell_codes[starts].astype(np.int64),
+                'offsets': np.r_[starts, num_nodes].astype(np.int64),
+                'min_level': np.minimum.reduceat(sorted_levels, starts),
+                'max_frequency': np.maximum.reduceat(sorted_frequency, starts)
+            })
+
+        index = cls(origin, size, depth, order.astype(np.int64), cells)
+        logger.info(f"Built spatial index: {num_nodes} nodes, depth {depth}, "
+                    f"{len(cells[-1]['code'])} leaf cells")
+        return index
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def cell_bounds(self, k: int, cell: np.ndarray) -> np.ndarray:
+        """
+        Minimum corners of cells at depth k.
+
+        Args:
+            k: Depth (1..depth)
+            cell: Indices into the depth-k cell arrays
+
+        Returns:
+            (len(cell), 3) corners; the cell edge is size / 2^k
+        """
+        codes = self.cells[k - 1]['code'][cell].astype(np.uint64)
+        coords = np.stack([morton_decode(codes >> np.uint64(axis)) for axis in range(3)], axis=1)
+        return self.origin + coords * (self.size / (1 << k))
+
+    def cells_in_box(
+        self,
+        lo: Sequence[float],
+        hi: Sequence[float],
+        min_frequency: Optional[int] = None,
+        max_level: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Leaf cells overlapping an axis-aligned box.
+
+        Args:
+            lo: (3,) box minimum
+            hi: (3,) box maximum
+            min_frequency: Skip cells whose most frequent node is below this
+            max_level: Skip cells whose most prominent node is deeper than this
+
+        Returns:
+            Indices into the leaf cell arrays (self.cells[-1])
+        """
+        lo, hi = np.asarray(lo, dtype=np.float64), np.asarray(hi, dtype=np.float64)
+        candidates = np.arange(len(self.cells[0]['code']))
+
+        for k in range(1, self.depth + 1):
+            level = self.cells[k - 1]
+            corner = self.cell_bounds(k, candidates)
+            edge = self.size / (1 << k)
+            keep = ((corner <= hi) & (corner + edge >= lo)).all(axis=1)
+            if min_frequency is not None:
+                keep &= level['max_frequency'][candidates] >= min_frequency
+            if max_level is not None:
+                keep &= level['min_level'][candidates] <= max_level
+            candidates = candidates[keep]
+            if k == self.depth or len(candidates) == 0:
+                break
+
+            # Children of cell c are the next depth's codes in [8c, 8c + 8)
+            child_codes = self.cells[k]['code']
+            parents = level['code'][candidates]
+            first = np.searchsorted(child_codes, parents * 8, side='left')
+            last = np.searchsorted(child_codes, parents * 8 + 8, side='left')
+            candidates = _concat_ranges(first, last)
+
+        return candidates
+
+    def query_box(
+        self,
+        lo: Sequence[float],
+        hi: Sequence[float],
+        positions: Optional[np.ndarray] = None,
+        min_frequency: Optional[int] = None,
+        max_level: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Nodes in the leaf cells overlapping a box.
+
+        Args:
+            lo: (3,) box minimum
+            hi: (3,) box maximum
+            positions: (N, 3) node positions; if given, only nodes inside
+                the box are returned (otherwise whole cells are)
+            min_frequency: As in cells_in_box
+            max_level: As in cells_in_box
+
+        Returns:
+            Node indices
+        """
+        leaves = self.cells_in_box(lo, hi, min_frequency, max_level)
+        offsets = self.cells[-1]['offsets']
+        nodes = self.order[_concat_ranges(offsets[leaves], offsets[leaves + 1])]
+        if positions is not None and len(nodes):
+            inside = ((positions[nodes] >= lo) & (positions[nodes] <= hi)).all(axis=1)
+            nodes = nodes[inside]
+        return nodes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Compact JSON form; node indices follow the universe's word order.
+
+        cells[k - 1] lists the non-empty cells at depth k. Cell i spans
+        words order[offsets[i]:offsets[i + 1]] and has edge size / 2^k; its
+        grid coordinates are the x/y/z bits of code, interleaved x lowest.
+        """
+        return {
+            "origin": self.origin.tolist(),
+            "size": self.size,
+            "depth": self.depth,
+            "order": self.order.tolist(),
+            "cells": [{
+                "code": level['code'].tolist(),
+                "offsets": level['offsets'].tolist(),
+                "minLevel": level['min_level'].tolist(),
+                "maxFrequency": level['max_frequency'].tolist()
+            } for level in self.cells]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SpatialIndex':
+        """
+        Load an exported index.
+
+        Args:
+            data: Output of to_dict (e.g. universe JSON "spatialIndex")
+        """
+        return cls(
+            np.asarray(data["origin"], dtype=np.float64),
+            data["size"],
+            data["depth"],
+            np.asarray(data["order"], dtype=np.int64),
+            [{
+                'code': np.asarray(level["code"], dtype=np.int64),
+                'offsets': np.asarray(level["offsets"], dtype=np.int64),
+                'min_level': np.asarray(level["minLevel"], dtype=np.int64),
+                'max_frequency': np.asarray(level["maxFrequency"], dtype=np.int64)
+            } for level in data["cells"]]
+        )
+
+
+def _concat_ranges(first: np.ndarray, last: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(first[i], last[i]) for all i, without a loop."""
+    lengths = last - first
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Each output step is +1, except at range starts, which jump to first[i]
+    steps = np.ones(total, dtype=np.int64)
+    nonempty = lengths > 0
+    starts = np.cumsum(lengths[nonempty]) - lengths[nonempty]
+    steps[starts] = first[nonempty] - np.r_[0, (last[nonempty] - 1)[:-1]]
+    return np.cumsum(steps)
+
+
+def morton_encode(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """Interleave the bits of grid coordinates (< 2^21) into Morton codes."""
+    return _spread_bits(x) | (_spread_bits(y) << np.uint64(1)) | (_spread_bits(z) << np.uint64(2))
+
+
+def morton_decode(codes: np.ndarray) -> np.ndarray:
+    """Grid coordinate stored in the lowest of every 3 code bits."""
+    v = codes.astype(np.uint64) & np.uint64(0x1249249249249249)
+    v = (v ^ (v >> np.uint64(2))) & np.uint64(0x10c30c30c30c30c3)
+    v = (v ^ (v >> np.uint64(4))) & np.uint64(0x100f00f00f00f00f)
+    v = (v ^ (v >> np.uint64(8))) & np.uint64(0x1f0000ff0000ff)
+    v = (v ^ (v >> np.uint64(16))) & np.uint64(0x1f00000000ffff)
+    v = (v ^ (v >> np.uint64(32))) & np.uint64(0x1fffff)
+    return v.astype(np.int64)
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert two zero bits after each of the lowest 21 bits."""
+    v = values.astype(np.uint64) & np.uint64(0x1fffff)
+    v = (v | (v << np.uint64(32))) & np.uint64(0x1f00000000ffff)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x1f0000ff0000ff)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x100f00f00f00f00f)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x10c30c30c30c30c3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return v
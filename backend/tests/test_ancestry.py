@@ -0,0 +1,39 @@
+"""
+Tests for the ancestry index built by HierarchyProcessor.
+"""
+from core.models import WordInfo, VocabRelation, RelationType
+from core.processors.hierarchy import HierarchyProcessor
+
+
+def build(hypernyms):
+    """Run HierarchyProcessor over words with the given {word: [parents]}."""
+    names = sorted(set(hypernyms) | {p for parents in hypernyms.values() for p in parents})
+    words = []
+    for name in names:
+        word = WordInfo(word=name)
+        for parent in hypernyms.get(name, []):
+            word.add_relation(VocabRelation(target_id=f"word_{parent}", type=RelationType.HYPERNYM))
+        words.append(word)
+
+    processor = HierarchyProcessor()
+    processor.process(words)
+    return processor.ancestry
+
+
+def test_second_parent_at_same_depth_is_kept():
+    index = build({'a': ['root'], 'b': ['root'], 'x': ['b'], 'c': ['a', 'x']})
+
+    assert index.is_a('word_c', 'word_a')
+    assert index.is_a('word_c', 'word_x')
+    assert index.is_a('word_c', 'word_b')
+    assert sorted(index.descendants('word_b')) == ['word_c', 'word_x']
+    assert sorted(index.ancestors('word_c')) == ['word_a', 'word_b', 'word_root', 'word_x']
+
+
+def test_cycle_without_root():
+    index = build({'a': ['b'], 'b': ['a'], 'c': ['a']})
+
+    assert index.is_a('word_c', 'word_a')
+    assert not index.is_a('word_a', 'word_c')
+    # Exactly one edge of the a <-> b cycle is dropped
+    assert index.is_a('word_a', 'word_b') != index.is_a('word_b', 'word_a')
@@ -0,0 +1,48 @@
+"""
+Tests for UniverseBuilder.build_async against a slow stand-in service.
+"""
+import asyncio
+import time
+
+from core.builder import UniverseBuilder
+from core.data_sources.base import DataSource
+from core.models import WordInfo, VocabRelation, RelationType
+
+
+LATENCY = 0.02
+
+
+class SlowSource(DataSource):
+    """Answers every lookup after a fixed delay, like a remote lexicon service."""
+
+    def _do_initialize(self):
+        pass
+
+    def get_word_info(self, word):
+        time.sleep(LATENCY)
+        return WordInfo(word=word)
+
+    def get_relations(self, word):
+        time.sleep(LATENCY)
+        return [VocabRelation(target_id=f"word_{word[::-1]}", type=RelationType.RELATED, strength=0.5)]
+
+
+def relations(universe):
+    return {w.id: [(r.target_id, r.type, r.strength) for r in w.relations] for w in universe.words}
+
+
+def test_build_async_overlaps_latency():
+    wordlist = [f"word{i:02d}" for i in range(40)]
+
+    start = time.perf_counter()
+    expected = UniverseBuilder("sync").add_source(SlowSource()).build(wordlist)
+    sync_time = time.perf_counter() - start
+
+    builder = UniverseBuilder("async").add_source(SlowSource({'max_concurrency': 8}))
+    start = time.perf_counter()
+    universe = asyncio.run(builder.build_async(wordlist))
+    async_time = time.perf_counter() - start
+
+    assert [w.id for w in universe.words] == [w.id for w in expected.words]
+    assert relations(universe) == relations(expected)
+    assert async_time < sync_time / 3
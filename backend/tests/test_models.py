@@ -0,0 +1,59 @@
+"""
+Tests for WordInfo relation merging.
+"""
+import pytest
+
+from core.models import WordInfo, VocabRelation, RelationType
+
+
+def related(target: str, strength: float) -> VocabRelation:
+    return VocabRelation(target_id=f"word_{target}", type=RelationType.RELATED, strength=strength)
+
+
+def test_weighted_merge():
+    word = WordInfo(word="cat")
+    assert word.add_relation(related("dog", 0.2), 'weighted', 1.0)
+    assert not word.add_relation(related("dog", 0.8), 'weighted', 3.0)
+
+    assert len(word.relations) == 1
+    assert word.relations[0].strength == pytest.approx(0.65)
+
+
+def test_weighted_merge_survives_replaced_list():
+    word = WordInfo(word="cat")
+    word.add_relation(related("dog", 0.2), 'weighted', 1.0)
+    word.add_relation(related("dog", 0.8), 'weighted', 3.0)
+
+    word.relations = list(word.relations)
+    word.add_relation(related("dog", 0.0), 'weighted', 4.0)
+
+    assert len(word.relations) == 1
+    assert word.relations[0].strength == pytest.approx(0.325)
+
+
+def test_remove_then_append_keeps_index_valid():
+    word = WordInfo(word="cat")
+    word.add_relation(related("dog", 0.5))
+    word.add_relation(related("cow", 0.5))
+
+    word.relations.pop(0)
+    word.relations.append(related("pig", 0.5))
+
+    assert word.add_relation(related("dog", 0.4))
+    assert not word.add_relation(related("pig", 0.9))
+    assert [r.target_id for r in word.relations] == ["word_cow", "word_pig", "word_dog"]
+    assert word.relations[1].strength == 0.9
+
+
+def test_reordered_list_merges_into_right_relation():
+    word = WordInfo(word="cat")
+    word.add_relation(related("dog", 0.5))
+    word.add_relation(related("cow", 0.5))
+    word.add_relation(related("pig", 0.5))
+
+    # Same list, length and last item: only the positions changed
+    word.relations[0], word.relations[1] = word.relations[1], word.relations[0]
+
+    assert not word.add_relation(related("dog", 0.9))
+    assert {r.target_id: r.strength for r in word.relations}["word_dog"] == 0.9
+    assert len(word.relations) == 3
@@ -67,7 +67,7 @@ function App() {
   const { nodes, links } = useMemo(() => {
     if (!rawContent) return { nodes: [], links: [] }
     const mapper = new UniverseMapper()
-    return mapper.mapDataset(rawContent.words)
+    return mapper.mapDataset(rawContent.words, rawContent.celestial)
   }, [rawContent])
 
   const selectedNode = nodes.find((n) => n.id === selectedId) ?? null
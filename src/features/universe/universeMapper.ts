@@ -9,6 +9,7 @@ import type {
   CelestialType,
   SpectralClass,
   CelestialLink,
+  CelestialAttributesData,
 } from "@/types/universe"
 import { VISUAL_CONFIG, getSpectralColor, getBaseSize, getGalaxyColor } from "./visualConfig"
 
@@ -136,6 +137,35 @@ export class UniverseMapper {
     }
   }
 
+  /**
+   * Convert vocab word to celestial node using attributes precomputed by
+   * the backend (the universe's "celestial" block, row i = words[i])
+   */
+  precomputedToCelestial(
+    word: VocabWord,
+    attrs: CelestialAttributesData,
+    i: number
+  ): CelestialNode {
+    return {
+      id: word.id,
+      word: word.word,
+      pos: word.pos,
+      definition: word.definition,
+      frequency: word.frequency,
+      firstRecordedYear: word.firstRecordedYear,
+      hierarchyLevel: word.hierarchyLevel,
+      celestialType: attrs.types[attrs.type[i]],
+      spectralClass: attrs.spectralClasses[attrs.spectralClass[i]],
+      color: attrs.palette[attrs.color[i]],
+      radius: attrs.radius[i],
+      luminosity: attrs.luminosity[i],
+      mass: word.frequency / 10,
+      galaxyId: word.galaxyId,
+      solarSystemId: word.solarSystemId,
+      relations: word.relations,
+    }
+  }
+
   /**
    * Build links from vocab words
    */
@@ -159,11 +189,14 @@ export class UniverseMapper {
   /**
    * Convert full dataset
    */
-  mapDataset(words: VocabWord[]): {
+  mapDataset(words: VocabWord[], celestial?: CelestialAttributesData): {
     nodes: CelestialNode[]
     links: CelestialLink[]
   } {
-    const nodes = words.map((w) => this.vocabToCelestial(w))
+    const nodes =
+      celestial && celestial.type.length === words.length
+        ? words.map((w, i) => this.precomputedToCelestial(w, celestial, i))
+        : words.map((w) => this.vocabToCelestial(w))
     const links = this.buildLinks(words)
     return { nodes, links }
   }
@@ -15,6 +15,85 @@ export interface UniverseData {
   }
   galaxies?: GalaxyConfig[]
   words: VocabWord[]
+  ancestry?: AncestryIndexData
+  galaxyGraph?: GalaxyGraphData
+  celestial?: CelestialAttributesData
+  spatialIndex?: SpatialIndexData
+}
+
+/**
+ * Hypernym ancestry as post-order intervals (arrays follow `words` order).
+ * words[i] is a kind of words[j] iff post[i] falls in one of
+ * [starts[k], ends[k]] for k in offsets[j]..offsets[j + 1] - 1 (i !== j).
+ */
+export interface AncestryIndexData {
+  post: number[]
+  offsets: number[]
+  starts: number[]
+  ends: number[]
+}
+
+/**
+ * Relations aggregated per galaxy for the zoomed-out view.
+ * Edge endpoints index `galaxies`; edges are undirected (source < target).
+ */
+export interface GalaxyGraphData {
+  galaxies: string[]            // Galaxy ids
+  wordCounts: number[]
+  topWords: string[][]          // Most frequent word ids per galaxy
+  internalEdges: number[]       // Relations inside each galaxy
+  edges: SummaryEdges
+  levels?: {
+    // Node k is (galaxies[galaxy[k]], hierarchy level level[k]);
+    // edge endpoints index these nodes
+    galaxy: number[]
+    level: number[]
+    wordCounts: number[]
+    internalEdges: number[]
+    edges: SummaryEdges
+  }
+}
+
+export interface SummaryEdges {
+  source: number[]
+  target: number[]
+  count: number[]               // Word relations aggregated
+  weight: number[]              // Sum of their strengths
+}
+
+/**
+ * Celestial attributes precomputed with the UniverseMapper rules, one row per
+ * word (in `words` order). Categorical columns are codes into the tables.
+ */
+export interface CelestialAttributesData {
+  types: CelestialType[]
+  spectralClasses: SpectralClass[]
+  palette: string[]             // Colors
+  type: number[]
+  spectralClass: number[]
+  color: number[]
+  radius: number[]
+  luminosity: number[]
+}
+
+/**
+ * Linear octree over word positions. Words are sorted by Morton code into
+ * `order` (indices into `words`). cells[k - 1] lists the non-empty cells at
+ * depth k: cell i holds order[offsets[i]..offsets[i + 1] - 1], has edge
+ * size / 2^k, and its grid x/y/z are the interleaved bits of code (x lowest).
+ * Children of a cell with code c have codes 8c..8c + 7 one depth down.
+ */
+export interface SpatialIndexData {
+  origin: [number, number, number]
+  size: number
+  depth: number
+  order: number[]
+  cells: {
+    code: number[]
+    offsets: number[]
+    minLevel: number[]          // Most prominent hierarchy level in the cell
+    maxFrequency: number[]
+  }[]
 }
 
 export interface GalaxyConfig {